@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from django.contrib.auth.models import User
+from django.db.models import Case, Q, Value, When
+
+
+def find_user_by_login(key: str) -> User | None:
+    """
+    The user whose username (preferred) or email equals key, in one query.
+    Accounts use the email as username, so either column may hold it.
+    """
+    return (
+        User.objects
+        .filter(Q(username=key) | Q(email=key))
+        .order_by(Case(When(username=key, then=Value(0)), default=Value(1)), "pk")
+        .first()
+    )
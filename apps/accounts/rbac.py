@@ -5,10 +5,21 @@ from django.shortcuts import get_object_or_404
 from apps.projects.models import Project, ProjectMembership
 
 def role_of(user) -> str:
+    """
+    The user's RBAC role, memoized on the user instance.
+
+    Permission helpers call is_admin/is_evaluator several times per request
+    (and per row in list views); the profile is resolved once per instance.
+    request.user is rebuilt on every request, so a role change applies from
+    the user's next request on.
+    """
     if not user.is_authenticated:
         return "ANON"
-    prof = getattr(user, "profile", None)
-    return getattr(prof, "role", "DEVELOPER")
+    role = getattr(user, "_rbac_role", None)
+    if role is None:
+        prof = getattr(user, "profile", None)
+        role = user._rbac_role = getattr(prof, "role", "DEVELOPER")
+    return role
 
 def is_admin(user) -> bool:
     return role_of(user) == "ADMIN"
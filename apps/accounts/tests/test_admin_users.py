@@ -155,4 +155,63 @@ class AdminUserTests(TestCase):
 
     def test_unauthenticated_cannot_access_user_list(self):
         response = self.client.get(reverse("accounts:admin_user_list"))
-        self.assertEqual(response.status_code, 403)
\ No newline at end of file
+        self.assertEqual(response.status_code, 403)
+
+
+class AdminUsersApiTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin = make_user("admin_user", role="ADMIN")
+        self.client.force_login(self.admin)
+
+    def test_create_returns_requested_role(self):
+        response = self.client.post(
+            "/api/admin/users/",
+            {"email": "evaluser@test.com", "password": "evalpass123", "role": "EVALUATOR"},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["user"]["role"], "EVALUATOR")
+        self.assertEqual(User.objects.get(username="evaluser@test.com").profile.role, "EVALUATOR")
+
+    def test_create_rejects_taken_email(self):
+        make_user("taken")
+
+        response = self.client.post(
+            "/api/admin/users/",
+            {"email": "taken", "password": "pass1234", "role": "DEVELOPER"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "A user with this email already exists")
+        self.assertEqual(User.objects.filter(username="taken").count(), 1)
+
+    def test_list_returns_roles_without_extra_queries(self):
+        for i in range(3):
+            make_user(f"dev{i}")
+        make_user("eval_user", role="EVALUATOR")
+
+        # session, session user (profile joined), one joined users query
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/admin/users/")
+
+        self.assertEqual(response.status_code, 200)
+        roles = {u["email"]: u["role"] for u in response.json()["users"]}
+        self.assertEqual(roles["eval_user@test.com"], "EVALUATOR")
+        self.assertEqual(roles["dev0@test.com"], "DEVELOPER")
+        self.assertEqual(len(roles), 5)
+
+    def test_dashboard_role_counts(self):
+        make_user("eval_user", role="EVALUATOR")
+        make_user("dev_one")
+        make_user("dev_two")
+
+        response = self.client.get("/api/admin/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        stats = response.json()["stats"]
+        self.assertEqual(stats["totalUsers"], 4)
+        self.assertEqual(stats["admins"], 1)
+        self.assertEqual(stats["evaluators"], 1)
+        self.assertEqual(stats["developers"], 2)
@@ -43,4 +43,73 @@ class LoginTest(TestCase):
         response = self.client.post(self.logout_url)
 
         self.assertEqual(response.status_code, 302)
-        self.assertNotIn("_auth_user_id", self.client.session)
\ No newline at end of file
+        self.assertNotIn("_auth_user_id", self.client.session)
+
+
+class ProfileBackendTest(TestCase):
+
+    def test_session_user_comes_with_profile(self):
+        from apps.accounts.backends import ProfileModelBackend
+        from apps.accounts.rbac import is_admin
+
+        user = User.objects.create_user(username="admin@example.com", password="pass1234")
+        user.profile.role = "ADMIN"
+        user.profile.save()
+
+        with self.assertNumQueries(1):
+            loaded = ProfileModelBackend().get_user(user.pk)
+            self.assertTrue(is_admin(loaded))
+
+    def test_missing_or_inactive_user_is_rejected(self):
+        from apps.accounts.backends import ProfileModelBackend
+
+        user = User.objects.create_user(username="gone@example.com", password="pass1234", is_active=False)
+        self.assertIsNone(ProfileModelBackend().get_user(user.pk))
+        self.assertIsNone(ProfileModelBackend().get_user(user.pk + 1000))
+
+    def test_login_user_comes_with_profile(self):
+        from apps.accounts.backends import ProfileModelBackend
+        from apps.accounts.rbac import is_admin
+
+        user = User.objects.create_user(username="admin@example.com", password="pass1234")
+        user.profile.role = "ADMIN"
+        user.profile.save()
+
+        with self.assertNumQueries(1):
+            loaded = ProfileModelBackend().authenticate(None, username="admin@example.com", password="pass1234")
+            self.assertTrue(is_admin(loaded))
+
+        self.assertIsNone(ProfileModelBackend().authenticate(None, username="admin@example.com", password="nope"))
+        self.assertIsNone(ProfileModelBackend().authenticate(None, username="nobody@example.com", password="pass1234"))
+
+    def test_failed_login_hashes_the_password_once(self):
+        from unittest.mock import patch
+
+        from django.contrib.auth import authenticate
+
+        User.objects.create_user(username="dev@example.com", password="pass1234")
+
+        with patch.object(User, "set_password") as mock_set, \
+                patch.object(User, "check_password", return_value=False) as mock_check:
+            self.assertIsNone(authenticate(None, username="nobody@example.com", password="pass1234"))
+            self.assertIsNone(authenticate(None, username="dev@example.com", password="nope"))
+
+        self.assertEqual(mock_set.call_count, 1)
+        self.assertEqual(mock_check.call_count, 1)
+
+
+class RoleOfTest(TestCase):
+
+    def test_role_is_resolved_once_per_user_instance(self):
+        from apps.accounts.rbac import is_admin, is_developer, is_evaluator, role_of
+
+        user = User.objects.create_user(username="eval@example.com", password="pass1234")
+        user.profile.role = "EVALUATOR"
+        user.profile.save()
+        loaded = User.objects.get(pk=user.pk)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(role_of(loaded), "EVALUATOR")
+            self.assertTrue(is_evaluator(loaded))
+            self.assertFalse(is_admin(loaded))
+            self.assertFalse(is_developer(loaded))
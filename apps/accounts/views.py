@@ -3,7 +3,7 @@ from django.contrib.auth import login
 from django.contrib.auth.views import LoginView, LogoutView
 from django.urls import reverse_lazy
 
-from .models import UserProfile
+from .rbac import is_admin
 
 
 class UserLoginView(LoginView):
@@ -11,9 +11,7 @@ class UserLoginView(LoginView):
 
     def get_success_url(self):
         user = self.request.user
-        role = getattr(getattr(user, "profile", None), "role", UserProfile.Role.DEVELOPER)
-
-        if role == UserProfile.Role.ADMIN:
+        if is_admin(user):
             return reverse("accounts:admin_user_list")
 
         return reverse("projects:list")
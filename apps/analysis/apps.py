@@ -6,4 +6,11 @@ class AnalysisConfig(AppConfig):
     
     def ready(self):
         # Import signals so the @receiver decorators get registered.
-        from apps.analysis import signals  # noqa: F401
\ No newline at end of file
+        from apps.analysis import signals  # noqa: F401
+
+        from django.conf import settings
+
+        if getattr(settings, "EMBEDDER_PRELOAD", False):
+            from apps.analysis.embeddings.embedder import get_shared_embedder
+
+            get_shared_embedder()
\ No newline at end of file
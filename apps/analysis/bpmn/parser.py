@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Union, Optional
+import mmap
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -103,10 +104,21 @@ def _local(tag: str) -> str:
     return tag.split("}")[-1] if "}" in tag else tag
 
 
-def _load_xml_bytes(bpmn_input: Union[str, Path, bytes]) -> bytes:
+def map_bpmn_file(path: Path) -> mmap.mmap:
+    """
+    Read-only memory map of a stored BPMN file.
+    The parser functions accept the returned buffer like bytes (zero-copy);
+    the caller closes it when done.
+    """
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _load_xml_bytes(bpmn_input: Union[str, Path, bytes, mmap.mmap]) -> bytes:
     if isinstance(bpmn_input, Path):
         return bpmn_input.read_bytes()
-    if isinstance(bpmn_input, bytes):
+    if isinstance(bpmn_input, (bytes, bytearray, memoryview, mmap.mmap)):
+        # ET.fromstring reads any bytes-like buffer without copying it first
         return bpmn_input
     if isinstance(bpmn_input, str):
         p = Path(bpmn_input)
@@ -343,14 +355,20 @@ def extract_bpmn_graph(bpmn_input: Union[str, Path, bytes]) -> Dict[str, object]
         "event_definitions": event_definitions,
     }
 
-def extract_tasks_with_context(bpmn_input: Union[str, Path, bytes]) -> List[Dict]:
+def extract_tasks_with_context(
+    bpmn_input: Union[str, Path, bytes],
+    graph: Optional[Dict[str, object]] = None,
+) -> List[Dict]:
     """
     Extract tasks with full context:
     - task_id, name, description, task_type
     - incoming_nodes: names of nodes that come before
     - outgoing_nodes: names of nodes that come after
+
+    Pass an already extracted graph to skip parsing the XML again.
     """
-    graph = extract_bpmn_graph(bpmn_input)
+    if graph is None:
+        graph = extract_bpmn_graph(bpmn_input)
 
     flows = graph.get("flows") or []
     events = graph.get("events") or []
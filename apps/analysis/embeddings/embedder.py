@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import List, Optional, Sequence
 
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 
@@ -23,9 +25,38 @@ class EmbeddingResult:
 
 class LocalEmbedder:
     #constructor with model loading
-    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, device: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        device: Optional[str] = None,
+        quantize_int8: bool = False,
+        compile_model: bool = False,
+    ) -> None:
         self.model_name = model_name
         self.model = SentenceTransformer(model_name, device=device)
+        # Numeric variant of the weights; vectors differ slightly between
+        # variants, so it is part of the embedding cache key.
+        self.variant = "fp32"
+        # fp16 weights on GPU: tensor-core matmuls and half the memory traffic.
+        # Vectors are converted back to float in embed_many.
+        if self.model.device.type == "cuda":
+            self.model.half()
+            self.variant = "fp16"
+        elif quantize_int8:
+            # CPU: int8 dynamic quantization of the Linear layers (~4x smaller
+            # weights). Scores shift slightly, so this is opt-in.
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            self.variant = "int8"
+
+        if compile_model:
+            # Compile the transformer forward (fused kernels, less Python
+            # dispatch per layer); dynamic=True avoids recompiling for every
+            # padded sequence length. Warm up once so the first request
+            # doesn't pay the compile cost.
+            self.model[0].auto_model = torch.compile(self.model[0].auto_model, dynamic=True)
+            self.embed_many(["warm up"])
 
     @staticmethod
     def _clean(text: Optional[str]) -> str:
@@ -41,11 +72,14 @@ class LocalEmbedder:
         if not cleaned:
             return []
 
-        vectors = self.model.encode(  #calling the model to get embeddings
-            cleaned,
-            batch_size=int(batch_size), #the amount of texts to process in one batch, can be tuned for performance vs memory
-            normalize_embeddings=True,
-        )
+        # inference_mode: no autograd/version-counter bookkeeping (older
+        # sentence-transformers releases only wrap encode() in no_grad)
+        with torch.inference_mode():
+            vectors = self.model.encode(  #calling the model to get embeddings
+                cleaned,
+                batch_size=int(batch_size), #the amount of texts to process in one batch, can be tuned for performance vs memory
+                normalize_embeddings=True,
+            )
 
         vectors_np = np.asarray(vectors, dtype=float) #convert to numpy array for easier math operation handling
                                                         #vectors_np[0] + vectors_np[1]
@@ -56,3 +90,23 @@ class LocalEmbedder:
         return results
         # print(results[0])
         # EmbeddingResult(text='Hello world!', vector=[0.12, -0.44, 0.98, ..., 0.05])
+
+
+# Process-wide embedder: the model is loaded once and reused by every analysis
+# run instead of paying the weight-loading cost on each request.
+_shared_lock = threading.Lock()
+_shared_embedder: Optional[LocalEmbedder] = None
+
+
+def get_shared_embedder() -> LocalEmbedder:
+    global _shared_embedder
+    if _shared_embedder is None:
+        with _shared_lock:
+            if _shared_embedder is None:
+                from django.conf import settings
+
+                _shared_embedder = LocalEmbedder(
+                    quantize_int8=getattr(settings, "EMBEDDER_QUANTIZE_INT8", False),
+                    compile_model=getattr(settings, "EMBEDDER_COMPILE", False),
+                )
+    return _shared_embedder
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .embedder import LocalEmbedder, EmbeddingResult
+import numpy as np
+from django.core.cache import cache
+
+from .embedder import LocalEmbedder, EmbeddingResult, get_shared_embedder
+
+# Vectors are cached per (model, weight variant, text); the text fully
+# determines the vector, so unchanged tasks/code are never re-embedded.
+EMBEDDING_CACHE_TTL = 60 * 60 * 24 * 30
 
 
 @dataclass(frozen=True)
@@ -139,6 +147,43 @@ def _collect_payloads(
     return task_payloads, code_payloads
 
 
+def _embedding_cache_key(embedder: LocalEmbedder, text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"emb:{embedder.model_name}:{embedder.variant}:{digest}"
+
+
+def _embed_cached(
+    embedder: LocalEmbedder,
+    texts: Sequence[str],
+    batch_size: int,
+) -> List[EmbeddingResult]:
+    """
+    embedder.embed_many with a content-addressed cache in front of it.
+    Only texts without a cached vector (each distinct text once) reach the
+    model. Vectors are stored as raw float32 bytes, the model's own
+    precision, so a cached vector equals a freshly computed one.
+    """
+    cleaned = [(t or "").strip() for t in texts]
+    keys = [_embedding_cache_key(embedder, t) for t in cleaned]
+    cached = cache.get_many(keys)
+
+    missing = list(dict.fromkeys(k for k in keys if k not in cached))
+    if missing:
+        text_by_key = dict(zip(keys, cleaned))
+        fresh = embedder.embed_many([text_by_key[k] for k in missing], batch_size=batch_size)
+        new_entries = {
+            k: np.asarray(res.vector, dtype=np.float32).tobytes()
+            for k, res in zip(missing, fresh)
+        }
+        cache.set_many(new_entries, timeout=EMBEDDING_CACHE_TTL)
+        cached.update(new_entries)
+
+    return [
+        EmbeddingResult(text=t, vector=np.frombuffer(cached[k], dtype=np.float32).tolist())
+        for t, k in zip(cleaned, keys)
+    ]
+
+
 def embed_pipeline(
     *,
     tasks: Sequence[Dict[str, Any]],
@@ -147,16 +192,23 @@ def embed_pipeline(
     batch_size: int = 32,
 ) -> Dict[str, Any]:
 
-    embedder = embedder or LocalEmbedder()
+    embedder = embedder or get_shared_embedder()
 
     task_payloads, code_payloads = _collect_payloads(tasks, code_items)
 
-    # Embed BPMN tasks 
     task_ids = [tid for tid, _ in task_payloads]
     task_texts = [txt for _, txt in task_payloads] #txt comes from build_bpmn_text
-    task_vectors: List[EmbeddingResult] = embedder.embed_many(
-        task_texts, batch_size=batch_size
+    code_ids = [cid for cid, _ in code_payloads]
+    code_texts = [txt for _, txt in code_payloads] #txt comes from build_code_text
+
+    # Embed tasks + code in ONE encode call, then split the results back;
+    # saves a second model/tokenizer pass and lets batches span both sides.
+    # Texts embedded before come from the cache.
+    all_vectors: List[EmbeddingResult] = _embed_cached(
+        embedder, task_texts + code_texts, batch_size
     )
+    task_vectors = all_vectors[:len(task_texts)]
+    code_vectors = all_vectors[len(task_texts):]
 
     embedded_tasks: List[EmbeddedRecord] = []
     for tid, res in zip(task_ids, task_vectors):
@@ -169,13 +221,6 @@ def embed_pipeline(
             )
         )
 
-    # Embed code items 
-    code_ids = [cid for cid, _ in code_payloads]
-    code_texts = [txt for _, txt in code_payloads] #txt comes from build_code_text
-    code_vectors: List[EmbeddingResult] = embedder.embed_many(
-        code_texts, batch_size=batch_size
-    )
-
     embedded_code: List[EmbeddedRecord] = []
     for cid, res in zip(code_ids, code_vectors):
         embedded_code.append(
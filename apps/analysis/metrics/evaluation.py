@@ -26,27 +26,29 @@ def evaluate_traceability(
     tasks_by_id = {t["taskId"]: t for t in bpmn_tasks if t.get("taskId")}
     code_by_id = {c["codeId"]: c for c in code_items if c.get("codeId")}
 
-    # group matches by task
-    by_task: Dict[str, List[Dict]] = {}
+    # best candidate per task in one pass; only the running best is kept,
+    # not every candidate (first one wins on ties, like max())
+    best_by_task: Dict[str, Tuple[float, Dict]] = {}
     for m in matches:
         tid = m.get("taskId")
         if not tid:
             continue
-        by_task.setdefault(tid, []).append(m)
+        score = float(m.get("similarity", 0.0))
+        current = best_by_task.get(tid)
+        if current is None or score > current[0]:
+            best_by_task[tid] = (score, m)
 
     matched: List[Dict] = []
     missing: List[Dict] = []
     used_code_ids = set()
 
     for tid, task in tasks_by_id.items():
-        candidates = by_task.get(tid, [])
-        if not candidates:
+        candidate = best_by_task.get(tid)
+        if candidate is None:
             missing.append({"taskId": tid, "taskName": task.get("taskName", ""), "reason": "no candidates"})
             continue
 
-        # best similarity
-        best = max(candidates, key=lambda x: float(x.get("similarity", 0.0)))
-        best_score = float(best.get("similarity", 0.0))
+        best_score, best = candidate
 
         if best_score >= float(threshold):
             cid = best.get("codeId")
@@ -31,6 +31,12 @@ class AnalysisRun(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # per-project status counts (dashboard_stats)
+            models.Index(fields=["project", "status"]),
+            # a project's runs newest first (run history, latest run lookups)
+            models.Index(fields=["project", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"Run(Project={self.project_id}) - {self.status}"
@@ -27,6 +27,7 @@ class PipelineFactory:
         code_root_resolver,
         replace_bpmn_tasks_func,
         replace_match_results_func,
+        run_obj=None,
     ) -> PostDevPipeline:
         return PostDevPipeline(
             project=project,
@@ -36,6 +37,7 @@ class PipelineFactory:
             code_root_resolver=code_root_resolver,
             replace_bpmn_tasks_func=replace_bpmn_tasks_func,
             replace_match_results_func=replace_match_results_func,
+            run_obj=run_obj,
         )
 
     @staticmethod
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
-from apps.analysis.bpmn.parser import extract_tasks_with_context
+from apps.analysis.bpmn.parser import extract_bpmn_graph, extract_tasks_with_context, map_bpmn_file
 from apps.analysis.models import AnalysisRun
-from apps.analysis.models_code import CodeArtifact
+from apps.analysis.services.storage_service import clear_code_artifacts
 from apps.analysis.semantic.analyze import (
     analyze_bpmn_side,
     analyze_code_side,
     match_bpmn_code,
 )
-from apps.projects.services import _persist_code_artifacts_with_summaries
+from apps.projects.services import _extract_and_summarize_code, _persist_code_artifacts_with_summaries
 
 from apps.analysis.models import CodeEmbedding, TaskEmbedding
+
+# Parsed BPMN (graph, task rows) cache lifetime; entries are keyed by the
+# file's SHA-256, so a changed upload never hits a stale entry.
+BPMN_PARSE_CACHE_TTL = 60 * 60 * 24
+
+
 class PostDevPipeline:
     """
     Factory-based concrete pipeline for full project analysis.
@@ -42,6 +51,7 @@ class PostDevPipeline:
         code_root_resolver,
         replace_bpmn_tasks_func,
         replace_match_results_func,
+        run_obj: Optional[AnalysisRun] = None,
     ) -> None:
         self.project = project
         self.matcher = matcher
@@ -53,16 +63,19 @@ class PostDevPipeline:
         self._replace_bpmn_tasks = replace_bpmn_tasks_func
         self._replace_match_results = replace_match_results_func
 
-        self.run_obj: Optional[AnalysisRun] = None
+        # an already-created PENDING run (background mode) is reused
+        self.run_obj: Optional[AnalysisRun] = run_obj
         self.bpmn_abs: Optional[Path] = None
-        self.bpmn_bytes: bytes = b""
+        # read-only mmap of the active BPMN (bytes-like), closed after run()
+        self.bpmn_bytes: Any = b""
         self.code_root: Optional[Path] = None
 
         self.storage_tasks: List[Dict[str, Any]] = []
+        self.task_map: Dict[str, Any] = {}
         self.bpmn_graph: Dict[str, Any] = {}
         self.threshold: float = 0.6
         self.engine_result: Dict[str, Any] = {}
-        self.storage_results: List[Dict[str, Any]] = []
+        self.storage_results: Iterable[Dict[str, Any]] = ()
 
     def run(self) -> AnalysisRun:
         try:
@@ -75,6 +88,8 @@ class PostDevPipeline:
         except Exception as e:
             self._mark_failed(str(e))
             return self._build_response()
+        finally:
+            self._release()
 
     def _validate(self) -> None:
         if not getattr(self.project, "active_bpmn", None):
@@ -84,25 +99,30 @@ class PostDevPipeline:
 
     def _load(self) -> None:
         with transaction.atomic():
-            self.run_obj = AnalysisRun.objects.create(project=self.project, status="PENDING")
+            if self.run_obj is None:
+                self.run_obj = AnalysisRun.objects.create(project=self.project, status="PENDING")
             self.run_obj.status = "RUNNING"
             self.run_obj.started_at = timezone.now()
             self.run_obj.save(update_fields=["status", "started_at"])
 
         self.bpmn_abs = self._abs_media_path(self.project.active_bpmn.stored_path)
-        self.bpmn_bytes = self.bpmn_abs.read_bytes()
+        self.bpmn_bytes = map_bpmn_file(self.bpmn_abs)
         self.code_root = self._resolve_code_root_from_project(self.project)
 
     def _preprocess(self) -> None:
-        self.storage_tasks = extract_tasks_with_context(self.bpmn_bytes)
-        from apps.analysis.bpmn.parser import extract_bpmn_graph
-        self.bpmn_graph = extract_bpmn_graph(self.bpmn_bytes)
+        # Parsed graph + task rows are cached by file content, so re-running
+        # on an unchanged BPMN skips the XML parse entirely.
+        key = "bpmn_parse:" + hashlib.sha256(self.bpmn_bytes).hexdigest()
+        parsed = cache.get(key)
+        if parsed is None:
+            # parse once; task context is derived from the same graph
+            graph = extract_bpmn_graph(self.bpmn_bytes)
+            parsed = (graph, extract_tasks_with_context(self.bpmn_bytes, graph=graph))
+            cache.set(key, parsed, BPMN_PARSE_CACHE_TTL)
+        self.bpmn_graph, self.storage_tasks = parsed
 
     def _execute(self) -> None:
-        # 1) Store BPMN tasks
-        self._replace_bpmn_tasks(self.project, self.storage_tasks)
-
-        # 2) Only regenerate code summaries if code was re-uploaded since last run
+        # Only regenerate code summaries if code was re-uploaded since last run
         last_run = (
             AnalysisRun.objects
             .filter(project=self.project, status="DONE")
@@ -119,13 +139,28 @@ class PostDevPipeline:
             or active_code_uploaded_at > last_run_finished_at
         )
 
-        if code_changed:
-            CodeArtifact.objects.filter(project=self.project).delete()
-            _persist_code_artifacts_with_summaries(
-                project=self.project,
-                code_root_dir=self.code_root,
+        # 1) Code extraction + summaries (file/API work only) run on a worker
+        #    thread while BPMN tasks are stored and summarized here; DB writes
+        #    stay on this thread.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            code_future = (
+                pool.submit(_extract_and_summarize_code, self.code_root)
+                if code_changed else None
             )
 
+            # 2) Store BPMN tasks (kept in memory for embeddings + match storage)
+            stored_tasks = self._replace_bpmn_tasks(self.project, self.storage_tasks)
+            self.task_map = {t.task_id: t for t in stored_tasks}
+
+            if code_future is not None:
+                prepared = code_future.result()
+                clear_code_artifacts(self.project)
+                _persist_code_artifacts_with_summaries(
+                    project=self.project,
+                    code_root_dir=self.code_root,
+                    prepared=prepared,
+                )
+
 
         self.threshold = float(getattr(self.project, "similarity_threshold", 0.6) or 0.6)
 
@@ -181,52 +216,45 @@ class PostDevPipeline:
             self._save_embeddings(embedded)
 
 
-        # 4) Convert matching result into storage schema
+        # 4) Convert matching result into storage schema (lazily; consumed
+        #    in batches by replace_match_results)
+        self.storage_results = self._iter_storage_results()
+
+    def _iter_storage_results(self) -> Iterator[Dict[str, Any]]:
         matching = self.engine_result.get("matching") or {}
         matched = matching.get("matched") or []
         missing = matching.get("missing") or []
         extra = matching.get("extra") or []
 
-        self.storage_results = []
-
         for m in matched:
-            self.storage_results.append(
-                {
-                    "status": "MATCHED",
-                    "task_id": m.get("task_id", ""),
-                    "code_ref": m.get("code_id", ""),
-                    "similarity_score": float(m.get("score", 0.0) or 0.0),
-                }
-            )
+            yield {
+                "status": "MATCHED",
+                "task_id": m.get("task_id", ""),
+                "code_ref": m.get("code_id", ""),
+                "similarity_score": float(m.get("score", 0.0) or 0.0),
+            }
 
         for tid in missing:
-            self.storage_results.append(
-                {
-                    "status": "MISSING",
-                    "task_id": tid,
-                    "code_ref": "",
-                    "similarity_score": 0.0,
-                }
-            )
+            yield {
+                "status": "MISSING",
+                "task_id": tid,
+                "code_ref": "",
+                "similarity_score": 0.0,
+            }
 
         for cid in extra:
-            self.storage_results.append(
-                {
-                    "status": "EXTRA",
-                    "task_id": "",
-                    "code_ref": cid,
-                    "similarity_score": 0.0,
-                }
-            )
+            yield {
+                "status": "EXTRA",
+                "task_id": "",
+                "code_ref": cid,
+                "similarity_score": 0.0,
+            }
 
     def _save_embeddings(self, embedded: dict) -> None:
         task_embeddings = embedded.get("task_embeddings") or []
         code_embeddings = embedded.get("code_embeddings") or []
 
-        task_map = {
-            t.task_id: t
-            for t in self.project.bpmn_tasks.all()
-        }
+        task_map = self.task_map
 
         code_map = {
             a.code_uid: a
@@ -252,7 +280,7 @@ class PostDevPipeline:
                         defaults={"vector": emb.get("vector")},
                     )
     def _save(self) -> None:
-        self._replace_match_results(self.project, self.storage_results)
+        self._replace_match_results(self.project, self.storage_results, task_map=self.task_map)
 
         if not self.run_obj:
             raise RuntimeError("AnalysisRun was not initialized.")
@@ -267,6 +295,12 @@ class PostDevPipeline:
             raise RuntimeError("AnalysisRun was not initialized.")
         return self.run_obj
 
+    def _release(self) -> None:
+        close = getattr(self.bpmn_bytes, "close", None)
+        if close:
+            close()
+        self.bpmn_bytes = b""
+
     def _mark_failed(self, message: str) -> None:
         if not self.run_obj:
             with transaction.atomic():
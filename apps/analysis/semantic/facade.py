@@ -20,10 +20,12 @@ class SemanticAnalysisFacade:
         *,
         bpmn_input: Union[str, Path, bytes],
         project=None,
+        bpmn_graph_override: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
         return analyze_bpmn_side(
             bpmn_input=bpmn_input,
             project=project,
+            bpmn_graph_override=bpmn_graph_override,
         )
 
     @staticmethod
@@ -48,10 +50,12 @@ class SemanticAnalysisFacade:
         batch_size: int = 32,
         include_debug: bool = False,
         project=None,
+        bpmn_graph_override: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
         bpmn_result = SemanticAnalysisFacade.analyze_bpmn(
             bpmn_input=bpmn_input,
             project=project,
+            bpmn_graph_override=bpmn_graph_override,
         )
         error = _validate_bpmn_result(bpmn_result)
         if error:
@@ -72,6 +76,7 @@ class SemanticAnalysisFacade:
             matcher=matcher,
             top_k=top_k,
             batch_size=batch_size,
+            project=project,
         )
 
         result = _build_response(
@@ -137,6 +142,7 @@ def _run_matching(
     matcher: str,
     top_k: int,
     batch_size: int,
+    project=None,
 ) -> Dict[str, Any]:
     return match_bpmn_code(
         bpmn_tasks=bpmn_result["bpmn_tasks"],
@@ -145,6 +151,7 @@ def _run_matching(
         matcher=matcher,
         top_k=top_k,
         batch_size=batch_size,
+        project=project,
     )
 
 
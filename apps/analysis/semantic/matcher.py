@@ -29,9 +29,11 @@ def _validate_similarity(similarity: Dict[str, Any]) -> Tuple[List[str], List[st
 
     task_ids = list(similarity.get("task_ids") or [])
     code_ids = list(similarity.get("code_ids") or [])
-    matrix = similarity.get("matrix") or []
+    matrix = similarity.get("matrix")
 
-    S = np.asarray(matrix, dtype=float)
+    # compute_similarity hands over a float32 ndarray; use it without a copy.
+    # Nested lists (older callers, tests) are converted once.
+    S = matrix if isinstance(matrix, np.ndarray) else np.asarray(matrix or [], dtype=float)
 
     # If empty matrix, return a safe empty (N, M) matrix (can happen if no embeddings).
     if S.size == 0:
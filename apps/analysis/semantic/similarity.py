@@ -15,12 +15,17 @@ class SimilarityMeta:
     task_count: int
     code_count: int
 
+# Embeddings are float32 on the model side; keeping them float32 here runs the
+# similarity GEMM as SGEMM (half the memory traffic of float64).
+SIMILARITY_DTYPE = np.float32
+
 #the vector we got from the embedder
 def _to_matrix(vectors: Sequence[Sequence[float]]) -> np.ndarray:
     """
     Convert list[list[float]] to numpy matrix of shape (N, D).
+    Always C-contiguous so strided array views from callers still hit BLAS.
     """
-    mat = np.asarray(vectors, dtype=float)
+    mat = np.ascontiguousarray(vectors, dtype=SIMILARITY_DTYPE)
     #array([
     #[0.1, 0.2, 0.3],
     #[0.4, 0.5, 0.6],
@@ -35,6 +40,12 @@ def cosine_similarity_matrix(
     task_vectors: Sequence[Sequence[float]],
     code_vectors: Sequence[Sequence[float]],
 ) -> np.ndarray:
+    """
+    Dot-product similarity of task vs code vectors.
+
+    Both sides are expected to be L2-normalized (LocalEmbedder uses
+    normalize_embeddings=True), so the dot product is the cosine.
+    """
 
     T = _to_matrix(task_vectors)  # (N, D) Task vectors
     C = _to_matrix(code_vectors)  # (M, D) Code vectors
@@ -42,6 +53,8 @@ def cosine_similarity_matrix(
     if T.shape[1] != C.shape[1]:
         raise ValueError(f"Vector dim mismatch: tasks dim={T.shape[1]} vs code dim={C.shape[1]}")
 
+    # C.T of a C-contiguous C is an F-contiguous view; numpy passes it to
+    # SGEMM with the transpose flag, so no copy is needed here
     S = T @ C.T  # (N, M) #the second T flips rows and columns
 
     #          Code1   Code2
@@ -49,8 +62,35 @@ def cosine_similarity_matrix(
     #Task1     0.67    0.97
     #Task2     0.80    0.40
 
-    return np.clip(S, -1.0, 1.0)
-    #values should be between -1 and 1
+    # float rounding can push normalized dot products a hair past +-1;
+    # clip in place so no second (N, M) buffer is allocated
+    np.clip(S, -1.0, 1.0, out=S)
+    return S
+
+
+def cosine_to_query(
+    vectors: Sequence[Sequence[float]],
+    query: Sequence[float],
+) -> np.ndarray:
+    """
+    Cosine similarity of every row of vectors against one query vector, in a
+    single vectorized pass (row norms + one matrix-vector product) instead of
+    a Python loop over rows. Vectors need not be normalized; zero vectors
+    score 0. Returns a float64 array of shape (K,).
+    """
+    V = np.asarray(vectors, dtype=float)
+    q = np.asarray(query, dtype=float)
+    if V.size == 0 or q.size == 0:
+        return np.zeros(len(vectors), dtype=float)
+
+    row_norms = np.linalg.norm(V, axis=1)
+    row_norms[row_norms == 0] = 1e-9
+    q_norm = float(np.linalg.norm(q)) or 1e-9
+
+    scores = (V @ q) / (row_norms * q_norm)
+    np.clip(scores, -1.0, 1.0, out=scores)
+    return scores
+
 
 def compute_similarity(
     *,
@@ -65,14 +105,19 @@ def compute_similarity(
         "meta": {...},
         "task_ids": [...],
         "code_ids": [...],
-        "matrix": [[...], [...], ...]   # shape (N, M)
+        "matrix": np.ndarray  # float32, shape (N, M); [] when either side is empty
     }
+
+    The matrix stays a float32 array: it is only consumed in-process (matchers,
+    top_k_matches), so expanding it to nested lists of Python floats would
+    cost ~8x the memory and another full pass over it for nothing.
     """
     task_ids: List[str] = [str(x.get("id")) for x in task_embeddings]
     code_ids: List[str] = [str(x.get("id")) for x in code_embeddings]
 
-    task_vecs: List[List[float]] = [list(x.get("vector") or []) for x in task_embeddings]
-    code_vecs: List[List[float]] = [list(x.get("vector") or []) for x in code_embeddings]
+    # _to_matrix copies into one contiguous array, so no per-vector copies here
+    task_vecs: List[Sequence[float]] = [x.get("vector") or [] for x in task_embeddings]
+    code_vecs: List[Sequence[float]] = [x.get("vector") or [] for x in code_embeddings]
 
     if not task_vecs or not code_vecs:
         meta = SimilarityMeta(metric="cosine", task_count=len(task_vecs), code_count=len(code_vecs))
@@ -91,7 +136,7 @@ def compute_similarity(
         "meta": asdict(meta),
         "task_ids": task_ids,
         "code_ids": code_ids,
-        "matrix": S.astype(float).tolist(),
+        "matrix": S,
     }
 
 
@@ -101,25 +146,40 @@ def top_k_matches(
     k: int = 3, #number of top matches to return per task
 ) -> Dict[str, List[Tuple[str, float]]]:
 
-    task_ids: List[str] = list(similarity.get("task_ids") or [])
-    code_ids: List[str] = list(similarity.get("code_ids") or [])
-    matrix: List[List[float]] = list(similarity.get("matrix") or [])
+    # read-only access; no per-call copies of the ids or the N x M matrix
+    task_ids: Sequence[str] = similarity.get("task_ids") or []
+    code_ids: Sequence[str] = similarity.get("code_ids") or []
+    matrix = similarity.get("matrix")
+
+    # an ndarray matrix is used as-is; nested lists get one NumPy traversal
+    S = matrix if isinstance(matrix, np.ndarray) else np.asarray(matrix or [], dtype=SIMILARITY_DTYPE)
 
-    if not matrix:
+    if S.size == 0:
         return {tid: [] for tid in task_ids}
 
-    S = np.asarray(matrix, dtype=float)  # (N, M)
     N, M = S.shape #N = number of tasks, M = number of code items
 
     k_eff = max(0, min(int(k), M))
 
+    if k_eff == 0:
+        return {tid: [] for tid in task_ids}
+
+    # Native ops over all rows at once; Python only assembles the per-task
+    # lists. argpartition selects each row's k best in O(M), then only those
+    # k survivors are sorted (descending) instead of every row in full.
+    if k_eff < M:
+        top_idx = np.argpartition(-S, k_eff - 1, axis=1)[:, :k_eff]  # (N, k), unordered
+    else:
+        top_idx = np.broadcast_to(np.arange(M), (N, M))
+    top_scores = np.take_along_axis(S, top_idx, axis=1)  # (N, k)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top_idx = np.take_along_axis(top_idx, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
     results: Dict[str, List[Tuple[str, float]]] = {}
-    for i in range(N):
-        row = S[i]  # (M,)
-        # argsort ascending -> take last k -> reverse for descending
-        idx = np.argsort(row)[-k_eff:][::-1]
-        results[task_ids[i]] = [(code_ids[j], float(row[j])) for j in idx]
-        
+    for i, (idx_row, score_row) in enumerate(zip(top_idx.tolist(), top_scores.tolist())):
+        results[task_ids[i]] = [(code_ids[j], score) for j, score in zip(idx_row, score_row)]
+
         #results["t1"] = [
         #("c1", 0.9), ("c2", 0.8), ("c3", 0.3)
         #]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from django.conf import settings
+from django.db import close_old_connections, transaction
 
+from apps.analysis.bpmn.parser import map_bpmn_file
 from apps.analysis.metrics.evaluation import evaluate_traceability
 from apps.analysis.models import AnalysisRun
 from apps.analysis.pipelines.pipeline_factory import PipelineFactory
@@ -58,6 +61,7 @@ def run_analysis_for_project(
     *,
     matcher: str = "greedy",
     top_k: int = 3,
+    run_obj: Optional[AnalysisRun] = None,
 ) -> AnalysisRun:
     """
     Factory-based wrapper around PostDevPipeline.
@@ -72,23 +76,94 @@ def run_analysis_for_project(
         code_root_resolver=_resolve_code_root_from_project,
         replace_bpmn_tasks_func=replace_bpmn_tasks,
         replace_match_results_func=replace_match_results,
+        run_obj=run_obj,
     )
 
     return pipeline.run()
 
 
+def _run_analysis_in_background(project_id: int, run_id: int, matcher: str, top_k: int) -> None:
+    from apps.projects.models import Project
+
+    try:
+        project = Project.objects.select_related("active_bpmn", "active_code").get(id=project_id)
+        run_obj = AnalysisRun.objects.get(id=run_id)
+        run_analysis_for_project(project, matcher=matcher, top_k=top_k, run_obj=run_obj)
+    except Exception as e:
+        # save() rather than a queryset update so the post_save sync still runs
+        run_obj = AnalysisRun.objects.filter(id=run_id).first()
+        if run_obj is not None:
+            run_obj.status = "FAILED"
+            run_obj.error_message = str(e)
+            run_obj.save(update_fields=["status", "error_message"])
+    finally:
+        # this thread's DB connection isn't managed by the request cycle
+        close_old_connections()
+
+
+def start_analysis_for_project(
+    project,
+    *,
+    matcher: str = "greedy",
+    top_k: int = 3,
+) -> AnalysisRun:
+    """
+    Create a PENDING AnalysisRun and run the pipeline on a background thread,
+    so the request returns immediately; poll the run's status for the result.
+    The thread starts once the run row is committed, so it can load it.
+    """
+    run_obj = AnalysisRun.objects.create(project=project, status="PENDING")
+
+    worker = threading.Thread(
+        target=_run_analysis_in_background,
+        args=(project.id, run_obj.id, matcher, int(top_k)),
+        name=f"analysis-run-{run_obj.id}",
+        daemon=True,
+    )
+    transaction.on_commit(worker.start)
+    return run_obj
+
+
 def run_semantic_pipeline_for_project(
     project_id: int,
     threshold: float = 0.7,
     top_k: int = 3,
+    *,
+    project=None,
 ) -> Dict[str, Any]:
     """
     Used by apps/analysis/views.py (dashboard endpoint).
     Returns a UI-ready JSON payload using the same semantic engine.
+
+    A caller that already loaded the project (with active_bpmn/active_code
+    selected) can pass it as project= to skip fetching the row again.
     """
+    from django.db.models import Prefetch, prefetch_related_objects
+
+    from apps.analysis.models import BpmnTask
     from apps.projects.models import Project
 
-    project = Project.objects.select_related("active_bpmn", "active_code").get(id=project_id)
+    # BPMN tasks come along in one prefetch (only the columns this path
+    # reads) and are reused by analyze_bpmn_side instead of being queried again.
+    tasks_prefetch = Prefetch(
+        "bpmn_tasks",
+        queryset=BpmnTask.objects.only("id", "project_id", "task_id", "name", "description", "summary_text"),
+    )
+    if project is None:
+        project = (
+            Project.objects
+            .select_related("active_bpmn", "active_code")
+            .only(
+                "id",
+                "active_bpmn__stored_path",
+                "active_code__extracted_dir",
+                "active_code__stored_path",
+            )
+            .prefetch_related(tasks_prefetch)
+            .get(id=project_id)
+        )
+    else:
+        prefetch_related_objects([project], tasks_prefetch)
 
     if not getattr(project, "active_bpmn", None):
         raise ValueError("No active BPMN uploaded for this project.")
@@ -96,19 +171,18 @@ def run_semantic_pipeline_for_project(
         raise ValueError("No active Code ZIP uploaded for this project.")
 
     bpmn_abs = _abs_media_path(project.active_bpmn.stored_path)
-    bpmn_bytes = bpmn_abs.read_bytes()
-
     code_root = _resolve_code_root_from_project(project)
 
-    result = analyze_project(
-        bpmn_input=bpmn_bytes,
-        code_root=code_root,
-        threshold=threshold,
-        matcher="greedy",
-        top_k=int(top_k),
-        include_debug=False,
-        project=project,
-    )
+    with map_bpmn_file(bpmn_abs) as bpmn_buf:
+        result = analyze_project(
+            bpmn_input=bpmn_buf,
+            code_root=code_root,
+            threshold=threshold,
+            matcher="greedy",
+            top_k=int(top_k),
+            include_debug=False,
+            project=project,
+        )
 
     return {
         "matching": result.get("matching") or {},
@@ -1,5 +1,6 @@
 from .analysis_run_service import (
     run_analysis_for_project,
+    start_analysis_for_project,
     run_semantic_pipeline_for_project,
     compute_metrics_from_similarity_payload,
 )
@@ -17,6 +18,7 @@ from .upload_flow_service import (
 
 __all__ = [
     "run_analysis_for_project",
+    "start_analysis_for_project",
     "run_semantic_pipeline_for_project",
     "compute_metrics_from_similarity_payload",
     "get_project_bpmn_summary",
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
 
 from apps.analysis.models import BpmnTask, MatchResult
+from apps.analysis.models_code import CodeArtifact
+
+# Rows per INSERT/UPDATE statement; keeps large projects under DB packet/variable limits.
+BPMN_TASK_BATCH_SIZE = 500
+MATCH_RESULT_BATCH_SIZE = 1000
 
 
 def _build_task_summary(name: str, desc: str, task_type: str, incoming: list, outgoing: list) -> str:
@@ -16,21 +24,82 @@ def _build_task_summary(name: str, desc: str, task_type: str, incoming: list, ou
         outgoing=outgoing,
     )
 
-def replace_bpmn_tasks(project, tasks: List[Dict[str, Any]]) -> int:
-    existing_task_ids = set()
+
+def _task_pk_map(project) -> Dict[str, int]:
+    """
+    {bpmn task_id: BpmnTask pk} for the project, cached on the instance so
+    repeated calls within a pipeline run issue one query at most.
+    replace_bpmn_tasks refreshes it whenever it re-syncs the tasks.
+    """
+    cached = getattr(project, "_bpmn_task_pk_map", None)
+    if cached is None:
+        cached = dict(project.bpmn_tasks.values_list("task_id", "pk"))
+        project._bpmn_task_pk_map = cached
+    return cached
+
+
+def clear_code_artifacts(project) -> None:
+    """
+    Delete all CodeArtifact rows of a project (and their CodeEmbedding rows).
+
+    A plain QuerySet.delete() loads every artifact, raw snippets included,
+    before cascading. Loading only the pks keeps that SELECT small; the
+    collector still cascades to every relation (CodeEmbedding today).
+    """
+    CodeArtifact.objects.filter(project=project).only("pk").delete()
+
+
+def _classify_new_tasks(project, created: List[BpmnTask]) -> None:
+    """
+    AI-suitability classification for tasks inserted by bulk_create, which
+    skips post_save and so the auto_classify_bpmn_task receiver. Failures
+    leave the task UNKNOWN, as in the receiver.
+    """
+    from apps.analysis.services.ai_suitability_service import (
+        classify_bpmn_task,
+        classify_unclassified_tasks_for_project,
+    )
+
+    if not all(t.pk for t in created):
+        # no pks without RETURNING support; classify from the DB instead
+        try:
+            classify_unclassified_tasks_for_project(project.id)
+        except Exception as e:
+            print(f"[ai_suitability] classification failed for project {project.id}: {e}")
+        return
+
+    for task in created:
+        try:
+            classify_bpmn_task(task)
+        except Exception as e:
+            print(f"[ai_suitability] classification failed for task {task.id}: {e}")
+
+
+def replace_bpmn_tasks(project, tasks: List[Dict[str, Any]]) -> List[BpmnTask]:
+    """
+    Sync stored BpmnTask rows with the parsed BPMN tasks.
+
+    Returns the BpmnTask objects kept for the project so callers can reuse
+    them (e.g. as the task_map for replace_match_results) without re-querying.
+    """
+    existing_by_id = {t.task_id: t for t in BpmnTask.objects.filter(project=project)}
+
+    kept: Dict[str, BpmnTask] = {}
+    to_create: Dict[str, BpmnTask] = {}
+    to_update: Dict[str, BpmnTask] = {}
 
     for t in tasks:
+        # rows without a task_id are dropped before any other field is touched
         task_id = str(t.get("task_id", "")).strip()
+        if not task_id:
+            continue
         name = str(t.get("name", "")).strip() or "Unnamed Task"
         desc = str(t.get("description", "")).strip()
         task_type = str(t.get("task_type", "")).strip()
         incoming_nodes = t.get("incoming_nodes") or []
         outgoing_nodes = t.get("outgoing_nodes") or []
 
-        if not task_id:
-            continue
-
-        existing = BpmnTask.objects.filter(project=project, task_id=task_id).first()
+        existing = kept.get(task_id) or existing_by_id.get(task_id)
 
         if existing:
             # Only refresh if the task details changed or summary is missing
@@ -52,12 +121,15 @@ def replace_bpmn_tasks(project, tasks: List[Dict[str, Any]]) -> int:
             existing.task_type = task_type
             existing.incoming_nodes = incoming_nodes
             existing.outgoing_nodes = outgoing_nodes
-            existing.save()
-            existing_task_ids.add(task_id)
+            kept[task_id] = existing
+            # unchanged stored rows are already persisted; re-running on the
+            # same BPMN writes nothing
+            if existing.pk and should_refresh:
+                to_update[task_id] = existing
 
         else:
             summary = _build_task_summary(name, desc, task_type, incoming_nodes, outgoing_nodes)
-            BpmnTask.objects.create(
+            obj = BpmnTask(
                 project=project,
                 task_id=task_id,
                 name=name,
@@ -67,18 +139,56 @@ def replace_bpmn_tasks(project, tasks: List[Dict[str, Any]]) -> int:
                 outgoing_nodes=outgoing_nodes,
                 summary_text=summary,
             )
-            existing_task_ids.add(task_id)
-
-    # Delete tasks that no longer exist in the BPMN
-    BpmnTask.objects.filter(project=project).exclude(
-        task_id__in=existing_task_ids
-    ).delete()
-
-    return BpmnTask.objects.filter(project=project).count()
-
-def replace_match_results(project, results: List[Dict[str, Any]]) -> int:
+            kept[task_id] = obj
+            to_create[task_id] = obj
+
+    # Summaries are generated above; only the writes share one transaction so
+    # a failure can't leave the task set half-synced.
+    stale_ids = [t.pk for task_id, t in existing_by_id.items() if task_id not in kept]
+    if to_create or to_update or stale_ids:
+        with transaction.atomic():
+            if to_create:
+                BpmnTask.objects.bulk_create(list(to_create.values()), batch_size=BPMN_TASK_BATCH_SIZE)
+
+            if to_update:
+                BpmnTask.objects.bulk_update(
+                    list(to_update.values()),
+                    ["name", "description", "task_type", "incoming_nodes", "outgoing_nodes", "summary_text"],
+                    batch_size=BPMN_TASK_BATCH_SIZE,
+                )
+
+            # Delete tasks that no longer exist in the BPMN
+            if stale_ids:
+                BpmnTask.objects.filter(pk__in=stale_ids).delete()
+
+    if to_create:
+        _classify_new_tasks(project, list(to_create.values()))
+
+    # bulk_create sets pks on backends with RETURNING (PostgreSQL, SQLite 3.35+)
+    if all(t.pk for t in kept.values()):
+        project._bpmn_task_pk_map = {tid: t.pk for tid, t in kept.items()}
+    else:
+        project._bpmn_task_pk_map = None
+
+    return list(kept.values())
+
+@transaction.atomic
+def replace_match_results(
+    project,
+    results: Iterable[Dict[str, Any]],
+    task_map: Optional[Dict[str, BpmnTask]] = None,
+) -> int:
     """
     Replace all stored match results for a project.
+    Returns the number of MatchResult rows the project now has.
+    The delete and all insert batches run in one transaction.
+
+    results may be any iterable (e.g. a generator); it is consumed in
+    MATCH_RESULT_BATCH_SIZE chunks so only one batch of rows is in memory.
+
+    task_map ({bpmn task_id: BpmnTask}) can be passed when the caller already
+    holds the project's tasks; otherwise the project's cached (task_id, pk)
+    map is used (see _task_pk_map).
 
     Expected input:
       [
@@ -95,36 +205,46 @@ def replace_match_results(project, results: List[Dict[str, Any]]) -> int:
     MatchResult.objects.filter(project=project, is_ai_generated=False).delete()
 
     # Tasks that already have an AI-generated match are owned by the AI flow.
-    # The pipeline must not create duplicate rows for them.
-    ai_owned_task_ids = set(
+    # The pipeline must not create duplicate rows for them. All AI rows are
+    # fetched so the returned total can be computed without a COUNT(*).
+    ai_task_ids = list(
         MatchResult.objects
-        .filter(project=project, is_ai_generated=True, task__isnull=False)
+        .filter(project=project, is_ai_generated=True)
         .values_list("task_id", flat=True)
     )
-
-    task_map = {t.task_id: t for t in project.bpmn_tasks.all()}
-
-    objs: List[MatchResult] = []
-    for r in results:
-        status = str(r.get("status", "MATCHED")).upper().strip()
-        task_id = str(r.get("task_id", "")).strip()
-        task = task_map.get(task_id) if task_id else None
-
-        # Skip pipeline results for tasks already owned by the AI flow.
-        if task is not None and task.id in ai_owned_task_ids:
-            continue
-
-        objs.append(
-            MatchResult(
-                project=project,
-                task=task,
-                code_ref=str(r.get("code_ref", "")).strip(),
-                similarity_score=float(r.get("similarity_score", 0.0) or 0.0),
-                status=status,
+    ai_owned_task_ids = {tid for tid in ai_task_ids if tid is not None}
+    created = 0
+
+    # Only the FK value is needed per row: {bpmn task_id: BpmnTask pk}.
+    if task_map is None:
+        task_pk_by_id = _task_pk_map(project)
+    else:
+        task_pk_by_id = {tid: t.pk for tid, t in task_map.items()}
+
+    rows = iter(results)
+    while batch := list(islice(rows, MATCH_RESULT_BATCH_SIZE)):
+        objs: List[MatchResult] = []
+        for r in batch:
+            task_id = str(r.get("task_id", "")).strip()
+            task_pk = task_pk_by_id.get(task_id) if task_id else None
+
+            # Skip pipeline results for tasks already owned by the AI flow.
+            if task_pk is not None and task_pk in ai_owned_task_ids:
+                continue
+
+            objs.append(
+                MatchResult(
+                    project=project,
+                    task_id=task_pk,
+                    code_ref=str(r.get("code_ref", "")).strip(),
+                    similarity_score=float(r.get("similarity_score", 0.0) or 0.0),
+                    status=str(r.get("status", "MATCHED")).upper().strip(),
+                )
             )
-        )
 
-    if objs:
-        MatchResult.objects.bulk_create(objs)
+        if objs:
+            MatchResult.objects.bulk_create(objs, batch_size=MATCH_RESULT_BATCH_SIZE)
+            created += len(objs)
 
-    return MatchResult.objects.filter(project=project).count()
\ No newline at end of file
+    # preserved AI rows + rows inserted above
+    return len(ai_task_ids) + created
\ No newline at end of file
@@ -1,7 +1,8 @@
+from django.db.models import Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from apps.analysis.models import BpmnTask
+from apps.analysis.models import AnalysisRun, BpmnTask
 
 
 @receiver(post_save, sender=BpmnTask)
@@ -23,4 +24,19 @@ def auto_classify_bpmn_task(sender, instance, created, **kwargs):
     try:
         classify_bpmn_task(instance)
     except Exception as e:
-        print(f"[ai_suitability signal] failed for task {instance.id}: {e}")
\ No newline at end of file
+        print(f"[ai_suitability signal] failed for task {instance.id}: {e}")
+
+
+@receiver(post_save, sender=AnalysisRun)
+def sync_project_last_run(sender, instance, **kwargs):
+    """
+    Copy the run's status onto Project.last_run_status / last_run_at.
+    Only the project's newest run may write, so an older run finishing late
+    can't overwrite the status of a newer one.
+    """
+    from apps.projects.models import Project
+
+    Project.objects.filter(
+        Q(last_run_at__isnull=True) | Q(last_run_at__lte=instance.created_at),
+        id=instance.project_id,
+    ).update(last_run_status=instance.status, last_run_at=instance.created_at)
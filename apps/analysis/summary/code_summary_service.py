@@ -1,6 +1,12 @@
 from __future__ import annotations
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List
 
+from django.core.cache import cache
+
 from .generator import build_generator_block
 from .shared_model_singleton import ModelProvider
 
@@ -41,6 +47,14 @@ Rules:
 - One sentence only, ending with a period
 """
 
+# Parallel Groq requests per summarize_many call; each call is network-bound,
+# so a small pool keeps the API busy without tripping rate limits.
+SUMMARY_MAX_CONCURRENCY = 8
+
+# Model outputs are cached per (model, prompt); the prompt is built only from
+# the structured function, so an unchanged function is never re-summarized.
+SUMMARY_CACHE_TTL = 60 * 60 * 24 * 30
+
 DETAILED_RULES = """You explain code behavior clearly for humans.
  Task: Write 2 to 4 short sentences explaining what the function does and how it does it.
  Rules: 
@@ -52,19 +66,32 @@ DETAILED_RULES = """You explain code behavior clearly for humans.
 """
 
 
+# Static prompt prefixes, built once. Every request starts with the same
+# bytes, so only the per-function block varies (and provider-side prefix
+# caching can reuse the shared part).
+_CODE_COMPARE_PREFIX = CODE_COMPARE_RULES + "\nINPUT:\n"
+_DETAILED_PREFIX = DETAILED_RULES + "\nINPUT:\n"
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a precise software analyst."}
+
+
 def build_code_compare_prompt(structured_block: str) -> str:
-    return CODE_COMPARE_RULES + "\nINPUT:\n" + structured_block
+    return _CODE_COMPARE_PREFIX + structured_block
 
 
 def build_detailed_prompt(structured_block: str) -> str:
-    return DETAILED_RULES + "\nINPUT:\n" + structured_block
+    return _DETAILED_PREFIX + structured_block
+
+
+# clean_summary runs once per summary; compile its patterns at import time.
+_BACKTICK_RE = re.compile(r'`([^`]+)`')
+_NAME_PREFIX_RE = re.compile(r'^_?NAME\s*:\s*', flags=re.IGNORECASE)
+_THE_FUNCTION_RE = re.compile(r'^[Tt]he\s+\w+\s+(function|method)\s+')
 
 
 def clean_summary(text: str) -> str:
     if not text:
         return text
 
-    import re
     t = text.strip()
 
     # Reject if LLM echoed the input block
@@ -72,13 +99,13 @@ def clean_summary(text: str) -> str:
         return ""
 
     # Remove backticks but keep the word inside
-    t = re.sub(r'`([^`]+)`', r'\1', t).strip()
+    t = _BACKTICK_RE.sub(r'\1', t).strip()
 
     # Remove _NAME: prefix
-    t = re.sub(r'^_?NAME\s*:\s*', '', t, flags=re.IGNORECASE).strip()
+    t = _NAME_PREFIX_RE.sub('', t).strip()
 
     # Remove "The <function_name> function/method" pattern
-    t = re.sub(r'^[Tt]he\s+\w+\s+(function|method)\s+', '', t).strip()
+    t = _THE_FUNCTION_RE.sub('', t).strip()
 
     # Remove leading prefixes
     prefixes = ["this function", "the function", "this method", "the method", "the code"]
@@ -118,19 +145,40 @@ class SummaryService:
         self.client = provider.client
         self.model_name = provider.model_name
         
-    def summarize_many(self, structured_functions: List[Dict]) -> Dict[str, Dict[str, str]]:
+    def summarize_many(
+        self,
+        structured_functions: List[Dict],
+        *,
+        include_detailed: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Returns {uid: short_summary}. The 2-4 sentence detailed summary costs a
+        second API call per function, so it is only generated when
+        include_detailed=True; values are then {"short": ..., "detailed": ...}.
+        """
         print("EEEE -> functions:", len(structured_functions))
-        out: Dict[str, Dict[str, str]] = {}
+        out: Dict[str, Any] = {}
 
+        # Build every prompt first, then send them as one concurrent batch
+        # instead of waiting on each API round-trip in turn.
+        uids: List[str] = []
+        prompts: List[str] = []
         for sf in structured_functions:
             uid = (sf.get("function_uid") or "").strip()
             if not uid:
                 continue
 
             block = build_generator_block(sf)
-            short_prompt = build_code_compare_prompt(block)
-            short_raw = self._call_model(short_prompt)
+            uids.append(uid)
+            prompts.append(build_code_compare_prompt(block))
+            if include_detailed:
+                prompts.append(build_detailed_prompt(block))
+
+        raw = self._call_model_batch(prompts)
+        step = 2 if include_detailed else 1
 
+        for i, uid in enumerate(uids):
+            short_raw = raw[i * step]
             print("UID:", uid)
             print("SHORT RAW:", repr(short_raw))
 
@@ -141,22 +189,65 @@ class SummaryService:
                 print("VALIDATION FAILED FOR", uid, "RAW =", repr(short_raw), "ERROR =", str(e))
                 short_clean = ""
 
-            out[uid] = short_clean
+            if include_detailed:
+                detailed = " ".join((raw[i * step + 1] or "").split())
+                out[uid] = {"short": short_clean, "detailed": detailed}
+            else:
+                out[uid] = short_clean
 
         return out
 
+    def _cache_key(self, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return f"sum:{self.model_name}:{digest}"
+
+    def _call_model_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Run _call_model over prompts concurrently; results keep input order.
+        Cached outputs are reused and only the misses go to the API.
+        """
+        keys = [self._cache_key(p) for p in prompts]
+        cached = cache.get_many(keys)
+
+        missing = [i for i, k in enumerate(keys) if k not in cached]
+        miss_prompts = [prompts[i] for i in missing]
+
+        if len(miss_prompts) <= 1:
+            fresh = [self._call_model(p) for p in miss_prompts]
+        else:
+            workers = min(SUMMARY_MAX_CONCURRENCY, len(miss_prompts))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(self._call_model, miss_prompts))
+
+        # Failed calls return "" and are not cached, so they are retried next run
+        cache.set_many(
+            {keys[i]: text for i, text in zip(missing, fresh) if text},
+            timeout=SUMMARY_CACHE_TTL,
+        )
+
+        results = [cached.get(k, "") for k in keys]
+        for i, text in zip(missing, fresh):
+            results[i] = text
+        return results
+
     def _call_model(self, prompt: str) -> str:
         try:
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": "You are a precise software analyst."},
+                    _SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0.2,
+                temperature=0.0,  # greedy decoding: one sentence, no sampling needed
                 max_tokens=80,
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
             print(f"Groq API call failed: {e}")
-            return ""
\ No newline at end of file
+            return ""
+
+
+@lru_cache(maxsize=1)
+def get_summary_service() -> SummaryService:
+    """Process-wide SummaryService; it is stateless, so callers can share it."""
+    return SummaryService()
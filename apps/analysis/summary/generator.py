@@ -1,8 +1,14 @@
 # apps/analysis/summary/generator.py
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List
 
+# Token budget for the code snippet in a prompt. Counted with a word /
+# punctuation split, which tracks BPE token counts far better than characters.
+SNIPPET_TOKEN_BUDGET = 350
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
 
 def _join(items: List[str], limit: int = 12) -> str:
     items = [str(x).strip() for x in (items or []) if str(x).strip()]
@@ -13,6 +19,28 @@ def _join(items: List[str], limit: int = 12) -> str:
     return " | ".join(items)
 
 
+def _truncate_snippet(snippet: str, budget: int = SNIPPET_TOKEN_BUDGET) -> str:
+    """
+    Keep whole lines until the approximate token budget is reached; the line
+    that overflows it is cut after its last token that still fits.
+    """
+    kept: List[str] = []
+    used = 0
+    for line in snippet.splitlines():
+        tokens = list(_TOKEN_RE.finditer(line))
+        if used + len(tokens) > budget:
+            remaining = budget - used
+            if remaining > 0:
+                # spend the rest of the budget on this line (e.g. a long
+                # expression or minified code), never cutting mid-identifier
+                kept.append(line[:tokens[remaining - 1].end()])
+            return "\n".join(kept) + "\n... (truncated)"
+        kept.append(line)
+        used += len(tokens)
+
+    return snippet
+
+
 def build_generator_block(sf: Dict[str, Any]) -> str:
     """
     Build the input block sent to the LLM.
@@ -30,8 +58,7 @@ def build_generator_block(sf: Dict[str, Any]) -> str:
 
     # Code FIRST — LLM reads actual logic before seeing the name
     if snippet:
-        if len(snippet) > 1200:
-            snippet = snippet[:1200] + "\n... (truncated)"
+        snippet = _truncate_snippet(snippet)
         lines.append("CODE:")
         lines.append(snippet)
         lines.append("")
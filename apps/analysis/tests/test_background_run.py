@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.projects.models import Project, ProjectMembership, ProjectFile
+from apps.analysis.models import AnalysisRun
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class BackgroundAnalysisRunTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectMembership.objects.create(project=self.project, user=self.dev)
+
+        self.project.active_bpmn = ProjectFile.objects.create(
+            project=self.project, file_type="BPMN", original_name="p.bpmn",
+            stored_path="projects/1/bpmn/p.bpmn", uploaded_by=self.evaluator,
+        )
+        self.project.active_code = ProjectFile.objects.create(
+            project=self.project, file_type="CODE", original_name="code.zip",
+            stored_path="projects/1/code/code.zip", extracted_dir="/tmp/extracted",
+            uploaded_by=self.dev,
+        )
+        self.project.save(update_fields=["active_bpmn", "active_code"])
+
+    def test_background_run_returns_pending_run_and_status_is_pollable(self):
+        self.client.force_login(self.dev)
+
+        with patch("apps.analysis.services.analysis_run_service.threading.Thread") as mock_thread, \
+                self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                reverse("api:run_analysis", kwargs={"project_id": self.project.id}) + "?background=1"
+            )
+            # the worker waits for the run row to be committed
+            mock_thread.return_value.start.assert_not_called()
+
+        self.assertEqual(response.status_code, 202)
+        run_id = response.json()["run"]["id"]
+        self.assertEqual(AnalysisRun.objects.get(id=run_id).status, "PENDING")
+        self.assertEqual(callbacks, [mock_thread.return_value.start])
+
+        status = self.client.get(
+            reverse("api:analysis_run_status", kwargs={"project_id": self.project.id, "run_id": run_id})
+        )
+        self.assertEqual(status.status_code, 200)
+        self.assertEqual(status.json()["run"]["status"], "PENDING")
+
+    def test_project_page_run_analysis_starts_background_run(self):
+        self.client.force_login(self.dev)
+        ProjectFile.objects.filter(id=self.project.active_bpmn_id).update(is_well_formed=True)
+
+        with patch("apps.analysis.services.analysis_run_service.threading.Thread") as mock_thread, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("projects:run_analysis", kwargs={"project_id": self.project.id})
+            )
+
+        self.assertRedirects(
+            response,
+            reverse("projects:detail", kwargs={"project_id": self.project.id}),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(AnalysisRun.objects.get(project=self.project).status, "PENDING")
+        mock_thread.return_value.start.assert_called_once()
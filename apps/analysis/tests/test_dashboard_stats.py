@@ -0,0 +1,150 @@
+import io
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.projects.models import Project, ProjectFile, ProjectMembership
+from apps.analysis.models import AnalysisRun
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class DashboardStatsTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+
+        self.projects = []
+        for i in range(4):
+            p = make_project(self.admin, self.evaluator, name=f"Project {i}")
+            ProjectMembership.objects.create(project=p, user=self.dev)
+            self.projects.append(p)
+
+        AnalysisRun.objects.create(project=self.projects[0], status="FAILED")
+        AnalysisRun.objects.create(project=self.projects[0], status="DONE")
+        AnalysisRun.objects.create(project=self.projects[1], status="RUNNING")
+
+        for p in self.projects[:2]:
+            ProjectFile.objects.create(
+                project=p, file_type="BPMN", original_name="p.bpmn",
+                stored_path="p.bpmn", uploaded_by=self.evaluator,
+            )
+        ProjectFile.objects.create(
+            project=self.projects[0], file_type="CODE", original_name="code.zip",
+            stored_path="code.zip", uploaded_by=self.evaluator,
+        )
+
+    def test_dashboard_stats_counts_and_recent_status(self):
+        self.client.force_login(self.dev)
+
+        response = self.client.get(reverse("analysis:dashboard_stats"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=15", response["Cache-Control"])
+        data = response.json()
+        self.assertEqual(data["totalProjects"], 4)
+        self.assertEqual(data["totalUploads"], 3)
+        self.assertEqual(data["analysesDone"], 1)
+        self.assertEqual(data["analysesPending"], 2)
+
+        status_by_name = {p["name"]: p["status"] for p in data["recentProjects"]}
+        self.assertEqual(status_by_name["Project 0"], "done")
+        self.assertEqual(status_by_name["Project 1"], "pending")
+        self.assertEqual(status_by_name["Project 3"], "pending")
+
+    def test_dashboard_stats_query_count_does_not_grow_with_projects(self):
+        self.client.force_login(self.dev)
+        url = reverse("analysis:dashboard_stats")
+        self.client.get(url)  # warm session/auth lookups
+
+        with self.assertNumQueries(4):
+            self.client.get(url)
+
+        for i in range(4, 8):
+            p = make_project(self.admin, self.evaluator, name=f"Project {i}")
+            ProjectMembership.objects.create(project=p, user=self.dev)
+            AnalysisRun.objects.create(project=p, status="DONE")
+
+        with self.assertNumQueries(4):
+            self.client.get(url)
+
+    def test_recent_projects_query_reads_only_needed_columns(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_login(self.dev)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("analysis:dashboard_stats"))
+
+        recent_sql = next(
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "projects_project"."id"')
+        )
+        self.assertNotIn('"projects_project"."description"', recent_sql)
+        self.assertNotIn('"projects_project"."github_repo_url"', recent_sql)
+
+
+class ProjectLastRunSyncTests(TestCase):
+
+    def setUp(self):
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+
+    def test_run_status_changes_are_copied_to_project(self):
+        run = AnalysisRun.objects.create(project=self.project, status="PENDING")
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.last_run_status, "PENDING")
+        self.assertEqual(self.project.last_run_at, run.created_at)
+
+        run.status = "DONE"
+        run.save(update_fields=["status"])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.last_run_status, "DONE")
+
+    def test_older_run_finishing_late_does_not_overwrite_newer_run(self):
+        older = AnalysisRun.objects.create(project=self.project, status="RUNNING")
+        newer = AnalysisRun.objects.create(project=self.project, status="PENDING")
+
+        older.status = "FAILED"
+        older.save(update_fields=["status"])
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.last_run_status, "PENDING")
+        self.assertEqual(self.project.last_run_at, newer.created_at)
+
+    def test_backfill_command_sets_latest_run(self):
+        from django.core.management import call_command
+
+        AnalysisRun.objects.create(project=self.project, status="FAILED")
+        latest = AnalysisRun.objects.create(project=self.project, status="DONE")
+        empty = make_project(self.admin, self.evaluator, name="No runs")
+        Project.objects.update(last_run_status="", last_run_at=None)
+
+        call_command("backfill_last_run", stdout=io.StringIO())
+
+        self.project.refresh_from_db()
+        empty.refresh_from_db()
+        self.assertEqual(self.project.last_run_status, "DONE")
+        self.assertEqual(self.project.last_run_at, latest.created_at)
+        self.assertEqual(empty.last_run_status, "")
+        self.assertIsNone(empty.last_run_at)
@@ -0,0 +1,50 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from apps.analysis.bpmn.parser import extract_bpmn_graph
+from apps.analysis.pipelines.postdev_pipeline import PostDevPipeline
+
+
+BPMN = (
+    b'<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">'
+    b'<process id="P"><task id="T1" name="Pay"/></process></definitions>'
+)
+
+
+def make_pipeline(bpmn_bytes):
+    pipeline = PostDevPipeline(
+        project=None,
+        abs_media_path_resolver=None,
+        code_root_resolver=None,
+        replace_bpmn_tasks_func=None,
+        replace_match_results_func=None,
+    )
+    pipeline.bpmn_bytes = bpmn_bytes
+    return pipeline
+
+
+class PostDevPreprocessTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unchanged_bpmn_is_parsed_once(self):
+        target = "apps.analysis.pipelines.postdev_pipeline.extract_bpmn_graph"
+        with patch(target, wraps=extract_bpmn_graph) as parse:
+            first = make_pipeline(BPMN)
+            first._preprocess()
+            second = make_pipeline(BPMN)
+            second._preprocess()
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual([t["task_id"] for t in second.storage_tasks], ["T1"])
+        self.assertEqual(second.bpmn_graph, first.bpmn_graph)
+
+    def test_changed_bpmn_is_parsed_again(self):
+        make_pipeline(BPMN)._preprocess()
+        changed = make_pipeline(BPMN.replace(b'name="Pay"', b'name="Refund"'))
+        changed._preprocess()
+
+        self.assertEqual([t["name"] for t in changed.storage_tasks], ["Refund"])
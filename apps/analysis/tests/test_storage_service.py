@@ -0,0 +1,200 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from apps.projects.models import Project
+from apps.analysis.models import BpmnTask, CodeEmbedding, MatchResult
+from apps.analysis.models_code import CodeArtifact
+from apps.analysis.services.storage_service import (
+    clear_code_artifacts,
+    replace_bpmn_tasks,
+    replace_match_results,
+)
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+def storage_task(task_id, name, description=""):
+    return {
+        "task_id": task_id,
+        "name": name,
+        "description": description,
+        "task_type": "serviceTask",
+        "incoming_nodes": [],
+        "outgoing_nodes": [],
+    }
+
+
+@patch(
+    "apps.analysis.services.storage_service._build_task_summary",
+    side_effect=lambda name, *args: f"Summary of {name}.",
+)
+class StorageServiceTests(TestCase):
+
+    def setUp(self):
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project   = make_project(self.admin, self.evaluator)
+
+    def test_replace_bpmn_tasks_creates_updates_and_deletes(self, _mock_summary):
+        replace_bpmn_tasks(self.project, [
+            storage_task("t1", "Validate Order"),
+            storage_task("t2", "Charge Payment"),
+        ])
+
+        stored = replace_bpmn_tasks(self.project, [
+            storage_task("t1", "Validate Order Form"),
+            storage_task("t3", "Send Email"),
+            storage_task("", "No Id"),
+        ])
+
+        self.assertEqual(sorted(t.task_id for t in stored), ["t1", "t3"])
+        self.assertTrue(all(t.pk for t in stored))
+
+        rows = {t.task_id: t for t in BpmnTask.objects.filter(project=self.project)}
+        self.assertEqual(sorted(rows), ["t1", "t3"])
+        self.assertEqual(rows["t1"].name, "Validate Order Form")
+        self.assertEqual(rows["t1"].summary_text, "Summary of Validate Order Form.")
+
+    def test_replace_bpmn_tasks_writes_nothing_for_unchanged_tasks(self, mock_summary):
+        tasks = [storage_task("t1", "Validate Order"), storage_task("t2", "Charge Payment")]
+        replace_bpmn_tasks(self.project, tasks)
+        mock_summary.reset_mock()
+
+        # only the existing-rows SELECT: no transaction, UPDATE or summaries
+        with self.assertNumQueries(1):
+            stored = replace_bpmn_tasks(self.project, tasks)
+
+        self.assertEqual(sorted(t.task_id for t in stored), ["t1", "t2"])
+        mock_summary.assert_not_called()
+
+    def test_replace_bpmn_tasks_classifies_new_tasks(self, _mock_summary):
+        def classify(task):
+            task.ai_suitability = "RECOMMENDED"
+            task.save(update_fields=["ai_suitability"])
+            return task
+
+        with patch(
+            "apps.analysis.services.ai_suitability_service.classify_bpmn_task", side_effect=classify,
+        ) as mock_classify:
+            replace_bpmn_tasks(self.project, [storage_task("t1", "Validate Order")])
+            replace_bpmn_tasks(self.project, [
+                storage_task("t1", "Validate Order Form"),
+                storage_task("t2", "Charge Payment"),
+            ])
+
+        # each task once, when it is created; the update of t1 is not reclassified
+        self.assertEqual([c.args[0].task_id for c in mock_classify.call_args_list], ["t1", "t2"])
+        self.assertEqual(
+            set(BpmnTask.objects.filter(project=self.project).values_list("ai_suitability", flat=True)),
+            {"RECOMMENDED"},
+        )
+
+    def test_replace_bpmn_tasks_collapses_duplicate_ids(self, _mock_summary):
+        stored = replace_bpmn_tasks(self.project, [
+            storage_task("t1", "First"),
+            storage_task("t1", "Second"),
+        ])
+
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(BpmnTask.objects.get(project=self.project, task_id="t1").name, "Second")
+
+    def test_replace_match_results_uses_given_task_map(self, _mock_summary):
+        stored = replace_bpmn_tasks(self.project, [storage_task("t1", "Validate Order")])
+        task_map = {t.task_id: t for t in stored}
+
+        # savepoint + delete + AI-row lookup + insert + release; no task query
+        with self.assertNumQueries(5):
+            count = replace_match_results(
+                self.project,
+                [
+                    {"status": "MATCHED", "task_id": "t1", "code_ref": "a.py::f", "similarity_score": 0.8},
+                    {"status": "EXTRA", "task_id": "", "code_ref": "b.py::g", "similarity_score": 0.0},
+                ],
+                task_map=task_map,
+            )
+
+        self.assertEqual(count, 2)
+        matched = MatchResult.objects.get(project=self.project, status="MATCHED")
+        self.assertEqual(matched.task_id, stored[0].pk)
+
+    def test_replace_match_results_consumes_generator_in_batches(self, _mock_summary):
+        rows = (
+            {"status": "EXTRA", "task_id": "", "code_ref": f"m.py::f{i}", "similarity_score": 0.0}
+            for i in range(5)
+        )
+
+        with patch("apps.analysis.services.storage_service.MATCH_RESULT_BATCH_SIZE", 2):
+            count = replace_match_results(self.project, rows, task_map={})
+
+        self.assertEqual(count, 5)
+        self.assertEqual(MatchResult.objects.filter(project=self.project, status="EXTRA").count(), 5)
+
+    def test_replace_match_results_keeps_and_counts_ai_rows(self, _mock_summary):
+        stored = replace_bpmn_tasks(self.project, [storage_task("t1", "Validate Order")])
+        task_map = {t.task_id: t for t in stored}
+        MatchResult.objects.create(
+            project=self.project, task=stored[0], code_ref="ai.py::f",
+            similarity_score=0.9, status="MATCHED", is_ai_generated=True,
+        )
+
+        count = replace_match_results(
+            self.project,
+            [
+                {"status": "MATCHED", "task_id": "t1", "code_ref": "a.py::f", "similarity_score": 0.8},
+                {"status": "EXTRA", "task_id": "", "code_ref": "b.py::g", "similarity_score": 0.0},
+            ],
+            task_map=task_map,
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(count, MatchResult.objects.filter(project=self.project).count())
+        self.assertTrue(MatchResult.objects.get(project=self.project, task=stored[0]).is_ai_generated)
+
+    def test_replace_match_results_resolves_task_ids_without_task_map(self, _mock_summary):
+        stored = replace_bpmn_tasks(self.project, [storage_task("t1", "Validate Order")])
+        rows = [
+            {"status": "MATCHED", "task_id": "t1", "code_ref": "a.py::f", "similarity_score": 0.8},
+            {"status": "MISSING", "task_id": "unknown", "code_ref": "", "similarity_score": 0.0},
+        ]
+
+        # fresh instance: the (task_id, pk) map is loaded once and then cached
+        project = Project.objects.get(pk=self.project.pk)
+        replace_match_results(project, rows)
+        with self.assertNumQueries(5):
+            count = replace_match_results(project, rows)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(MatchResult.objects.get(project=self.project, status="MATCHED").task_id, stored[0].pk)
+        self.assertIsNone(MatchResult.objects.get(project=self.project, status="MISSING").task_id)
+
+    def test_clear_code_artifacts_removes_artifacts_and_embeddings(self, _mock_summary):
+        other = make_project(self.admin, self.evaluator, name="Other")
+        for project in (self.project, other):
+            for uid in ("a.py::f", "a.py::g"):
+                art = CodeArtifact.objects.create(project=project, code_uid=uid, symbol=uid)
+                CodeEmbedding.objects.create(project=project, code_artifact=art, vector=[0.1, 0.2])
+
+        # artifact pks SELECT + embeddings DELETE + artifacts DELETE
+        with self.assertNumQueries(3):
+            clear_code_artifacts(self.project)
+
+        self.assertFalse(CodeArtifact.objects.filter(project=self.project).exists())
+        self.assertFalse(CodeEmbedding.objects.filter(project=self.project).exists())
+        self.assertEqual(CodeArtifact.objects.filter(project=other).count(), 2)
+        self.assertEqual(CodeEmbedding.objects.filter(project=other).count(), 2)
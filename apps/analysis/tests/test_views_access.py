@@ -0,0 +1,295 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.projects.models import Project, ProjectMembership
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class AnalysisViewAccessTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+        self.outsider  = make_user("other_dev",  role="DEVELOPER")
+
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectMembership.objects.create(project=self.project, user=self.dev)
+        self.url = reverse("analysis:metrics_developers", kwargs={"project_id": self.project.id})
+
+    def test_member_can_open_project(self):
+        self.client.force_login(self.dev)
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+
+    def test_non_member_is_forbidden(self):
+        self.client.force_login(self.outsider)
+        self.assertEqual(self.client.post(self.url).status_code, 403)
+
+    def test_assigned_evaluator_can_open_project(self):
+        self.client.force_login(self.evaluator)
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+
+
+class MetricsCacheTests(TestCase):
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+
+    def test_summary_and_details_share_one_metrics_computation(self):
+        from unittest.mock import patch
+
+        self.client.force_login(self.evaluator)
+        body = '{"threshold": 0.5, "bpmn_tasks": [], "code_items": [], "matches": []}'
+        kwargs = {"project_id": self.project.id}
+        fake = {"summary": {"coverage": 1.0}, "details": {"rows": []}}
+
+        with patch("apps.analysis.views.compute_metrics_from_similarity_payload", return_value=fake) as mock_compute:
+            summary = self.client.post(reverse("analysis:metrics_summary", kwargs=kwargs), body, content_type="application/json")
+            details = self.client.post(reverse("analysis:metrics_details", kwargs=kwargs), body, content_type="application/json")
+
+        self.assertEqual(mock_compute.call_count, 1)
+        self.assertEqual(summary.json(), {"coverage": 1.0})
+        self.assertEqual(details.json(), {"rows": []})
+
+    def test_batch_endpoint_returns_summary_and_details_together(self):
+        from unittest.mock import patch
+
+        self.client.force_login(self.evaluator)
+        body = '{"threshold": 0.5, "bpmn_tasks": [], "code_items": [], "matches": []}'
+        fake = {"summary": {"coverage": 1.0}, "details": {"rows": []}}
+        url = reverse("analysis:metrics_batch", kwargs={"project_id": self.project.id})
+
+        with patch("apps.analysis.views.compute_metrics_from_similarity_payload", return_value=fake) as mock_compute:
+            response = self.client.post(url, body, content_type="application/json")
+
+        self.assertEqual(mock_compute.call_count, 1)
+        self.assertEqual(response.json(), fake)
+
+    def test_malformed_payload_is_rejected_before_computing(self):
+        from unittest.mock import patch
+
+        self.client.force_login(self.evaluator)
+        url = reverse("analysis:metrics_batch", kwargs={"project_id": self.project.id})
+
+        with patch("apps.analysis.views.compute_metrics_from_similarity_payload") as mock_compute:
+            not_object = self.client.post(url, "[1, 2]", content_type="application/json")
+            bad_field = self.client.post(url, '{"matches": {"a": 1}}', content_type="application/json")
+            not_json = self.client.post(url, "{not json", content_type="application/json")
+
+        self.assertEqual(not_object.status_code, 400)
+        self.assertEqual(bad_field.status_code, 400)
+        self.assertEqual(not_json.status_code, 400)
+        mock_compute.assert_not_called()
+
+    def test_oversized_body_returns_413(self):
+        from django.test import override_settings
+
+        self.client.force_login(self.evaluator)
+        url = reverse("analysis:metrics_summary", kwargs={"project_id": self.project.id})
+        body = '{"matches": [' + ",".join(["{}"] * 100) + "]}"
+
+        with override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=64):
+            response = self.client.post(url, body, content_type="application/json")
+
+        self.assertEqual(response.status_code, 413)
+
+
+class BpmnXmlTests(TestCase):
+
+    def setUp(self):
+        import tempfile
+        from django.test import override_settings
+        from apps.projects.models import ProjectFile
+
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        override = override_settings(MEDIA_ROOT=self.media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        self.project.active_bpmn = ProjectFile.objects.create(
+            project=self.project, file_type="BPMN", original_name="p.bpmn",
+            stored_path="p.bpmn", uploaded_by=self.evaluator,
+        )
+        self.project.save(update_fields=["active_bpmn"])
+        self.url = reverse("api:project_bpmn_xml", kwargs={"project_id": self.project.id})
+
+    def _write(self, xml: str):
+        from pathlib import Path
+        (Path(self.media.name) / "p.bpmn").write_text(xml, encoding="utf-8")
+
+    def test_file_with_diagram_is_served_unchanged(self):
+        xml = (
+            '<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL" '
+            'xmlns:bpmndi="http://www.omg.org/spec/BPMN/20100524/DI">'
+            '<process id="P"/><bpmndi:BPMNDiagram id="D"/></definitions>'
+        )
+        self._write(xml)
+        self.client.force_login(self.evaluator)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertEqual(b"".join(response.streaming_content).decode("utf-8"), xml)
+
+    def test_file_without_diagram_gets_layout_added(self):
+        self._write(
+            '<definitions xmlns="http://www.omg.org/spec/BPMN/20100524/MODEL">'
+            '<process id="P"><task id="T1" name="Pay"/></process></definitions>'
+        )
+        self.client.force_login(self.evaluator)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"BPMNDiagram", response.content)
+
+
+class MembershipMemoTests(TestCase):
+
+    def setUp(self):
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+        self.outsider  = make_user("other_dev",  role="DEVELOPER")
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectMembership.objects.create(project=self.project, user=self.dev)
+
+    def test_membership_lookup_runs_once_per_project_instance(self):
+        from apps.projects.permissions import can_open_project, require_member
+
+        project = Project.objects.get(pk=self.project.pk)
+        with self.assertNumQueries(2):  # one per user, both results reused
+            self.assertTrue(can_open_project(project, self.dev))
+            self.assertTrue(require_member(project, self.dev))
+            self.assertFalse(can_open_project(project, self.outsider))
+            self.assertFalse(require_member(project, self.outsider))
+
+
+class RunProjectTests(TestCase):
+
+    def setUp(self):
+        from apps.projects.models import ProjectFile
+
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        self.project.active_bpmn = ProjectFile.objects.create(
+            project=self.project, file_type="BPMN", original_name="p.bpmn",
+            stored_path="p.bpmn", uploaded_by=self.evaluator, bpmn_summary="Order flow.",
+        )
+        self.project.active_code = ProjectFile.objects.create(
+            project=self.project, file_type="CODE", original_name="code.zip",
+            stored_path="code.zip", extracted_dir="/tmp/extracted", uploaded_by=self.evaluator,
+        )
+        self.project.save(update_fields=["active_bpmn", "active_code"])
+
+        from django.core.cache import cache
+        cache.clear()
+
+    def test_project_row_is_loaded_once(self):
+        from unittest.mock import MagicMock, patch
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_login(self.evaluator)
+        url = reverse("analysis:run_project", kwargs={"project_id": self.project.id})
+
+        with patch("apps.analysis.services.analysis_run_service.map_bpmn_file", MagicMock()), \
+             patch("apps.analysis.services.analysis_run_service.analyze_project", return_value={}) as analyze, \
+             CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["bpmn_summary"], "Order flow.")
+        self.assertEqual(analyze.call_args.kwargs["project"].pk, self.project.pk)
+        project_selects = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "projects_project"' in q["sql"]
+        ]
+        self.assertEqual(len(project_selects), 1)
+
+    def test_result_is_cached_until_a_new_run(self):
+        from unittest.mock import MagicMock, patch
+        from apps.analysis.models import AnalysisRun
+
+        self.client.force_login(self.evaluator)
+        url = reverse("analysis:run_project", kwargs={"project_id": self.project.id})
+
+        with patch("apps.analysis.services.analysis_run_service.map_bpmn_file", MagicMock()), \
+             patch("apps.analysis.services.analysis_run_service.analyze_project", return_value={}) as analyze:
+            self.client.get(url)
+            self.client.get(url)
+            self.assertEqual(analyze.call_count, 1)
+
+            # a different threshold is a different result
+            self.client.get(url, {"threshold": "0.5"})
+            self.assertEqual(analyze.call_count, 2)
+
+            # a new analysis run invalidates the cached result
+            AnalysisRun.objects.create(project=self.project, status="DONE")
+            self.client.get(url)
+            self.assertEqual(analyze.call_count, 3)
+
+
+class MetricsErrorTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        self.url = reverse("analysis:metrics_summary", kwargs={"project_id": self.project.id})
+
+    def _post_failing(self):
+        from unittest.mock import patch
+
+        self.client.force_login(self.evaluator)
+        with patch(
+            "apps.analysis.views.compute_metrics_from_similarity_payload",
+            side_effect=RuntimeError("metrics failed"),
+        ):
+            return self.client.post(self.url, data="{}", content_type="application/json")
+
+    def test_trace_is_hidden_outside_debug(self):
+        response = self._post_failing()
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("error", response.json())
+        self.assertNotIn("trace", response.json())
+
+    def test_trace_is_returned_in_debug(self):
+        from django.test import override_settings
+
+        with override_settings(DEBUG=True):
+            response = self._post_failing()
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Traceback", response.json()["trace"])
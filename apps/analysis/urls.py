@@ -13,6 +13,8 @@ urlpatterns = [
 
     path("api/analysis/<int:project_id>/run/", views.run_project, name="run_project"),
     path("api/analysis/<int:project_id>/metrics/from-payload/", views.run_project_metrics, name="run_project_metrics"),
+    # summary + details in one response; the two endpoints below return one part each
+    path("api/analysis/<int:project_id>/metrics/batch/", views.run_project_metrics, name="metrics_batch"),
     path("api/analysis/<int:project_id>/metrics/summary/", views.metrics_summary, name="metrics_summary"),
     path("api/analysis/<int:project_id>/metrics/details/", views.metrics_details, name="metrics_details"),
     path("api/analysis/<int:project_id>/metrics/developers/", views.metrics_developers, name="metrics_developers"),
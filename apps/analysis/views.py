@@ -2,26 +2,49 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import traceback
+from functools import wraps
 from pathlib import Path
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, render
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_GET, require_http_methods
 from apps.projects.models import Project, ProjectMembership, ProjectFile
 from apps.analysis.models import AnalysisRun
 from apps.accounts.rbac import is_admin, is_evaluator
 from .services.services import run_semantic_pipeline_for_project, compute_metrics_from_similarity_payload
-from apps.analysis.bpmn.parser import extract_bpmn_graph
-from apps.api.projects_api.permissions import can_open_project
-from django.http import HttpResponse
+from apps.analysis.bpmn.parser import extract_bpmn_graph, map_bpmn_file
+from apps.common.db import count_per_project
+from apps.common.http import fast_json_response, read_json_body
+from apps.projects.permissions import can_open_project, get_membership
+from django.http import FileResponse, HttpResponse
 from django.views.decorators.http import require_POST
 from apps.analysis.services.upload_flow_service import run_bpmn_upload_flow
 from django.core.files.base import ContentFile
 from apps.analysis.models import MatchResult
+
+# Seconds a computed metrics payload stays cached (keyed by request body).
+METRICS_CACHE_TTL = 300
+
+# Top-level list fields of a metrics request; a payload where any of them is
+# not a list is rejected with 400 before the metrics are computed.
+METRICS_LIST_FIELDS = ("bpmn_tasks", "code_items", "matches")
+
+# Seconds a run_project pipeline result stays cached. The key already changes
+# whenever the project's inputs change, so the TTL only bounds stale entries.
+SEMANTIC_RESULT_CACHE_TTL = 60 * 60
+
+# Seconds the browser may reuse a dashboard_stats response without asking again.
+DASHBOARD_STATS_MAX_AGE = 15
+
 # ============================================================
 # Helpers
 # ============================================================
@@ -37,10 +60,98 @@ def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def _read_json(request) -> dict:
-    if not request.body:
-        return {}
-    return json.loads(request.body.decode("utf-8"))
+class MetricsPayloadError(ValueError):
+    """A metrics request body that is not valid JSON or has the wrong shape (HTTP 400)."""
+
+
+def _limit_body_size(view):
+    """
+    Reject a request whose declared Content-Length exceeds
+    DATA_UPLOAD_MAX_MEMORY_SIZE with 413, before the body is read. Django
+    would raise on request.body anyway, but only after the view started.
+    """
+    @wraps(view)
+    def _w(request, *args, **kwargs):
+        limit = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        try:
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if limit is not None and length > limit:
+            return JsonResponse({"detail": "Request body too large"}, status=413)
+        return view(request, *args, **kwargs)
+    return _w
+
+
+def _metrics_payload(request) -> dict:
+    """Parsed metrics request body; raises MetricsPayloadError when it is malformed."""
+    try:
+        payload = read_json_body(request)
+    except ValueError as e:  # JSONDecodeError (stdlib and orjson), bad UTF-8
+        raise MetricsPayloadError(f"Invalid JSON body: {e}") from e
+    if not isinstance(payload, dict):
+        raise MetricsPayloadError("Body must be a JSON object")
+    for field in METRICS_LIST_FIELDS:
+        if not isinstance(payload.get(field) or [], list):
+            raise MetricsPayloadError(f"'{field}' must be a list")
+    return payload
+
+
+def _cached_metrics(request, project_id: int) -> dict:
+    """
+    compute_metrics_from_similarity_payload, memoized on the request body.
+    The full/summary/details endpoints share the entry, so the dashboard's
+    follow-up calls with the same payload are cache hits.
+    """
+    digest = hashlib.blake2b(request.body or b"", digest_size=16).hexdigest()
+    key = f"metrics:{project_id}:{digest}"
+
+    result = cache.get(key)
+    if result is None:
+        result = compute_metrics_from_similarity_payload(_metrics_payload(request))
+        cache.set(key, result, METRICS_CACHE_TTL)
+    return result
+
+
+def _bad_payload(exc: MetricsPayloadError):
+    return JsonResponse({"detail": str(exc)}, status=400)
+
+
+def _cached_semantic_result(project: Project, threshold: float, top_k: int) -> dict:
+    """
+    run_semantic_pipeline_for_project, memoized per project inputs.
+
+    The pipeline only reads the active BPMN/code files and the rows the last
+    analysis run wrote (tasks, artifacts, embeddings), so the active file ids
+    plus the latest run's status/timestamp identify its inputs; uploading a
+    file or starting/finishing a run moves to a new key.
+    """
+    last_run_at = project.last_run_at.isoformat() if project.last_run_at else ""
+    key = (
+        f"sempipe:{project.id}:{threshold}:{top_k}:"
+        f"{project.active_bpmn_id}:{project.active_code_id}:"
+        f"{project.last_run_status}:{last_run_at}"
+    )
+
+    result = cache.get(key)
+    if result is None:
+        result = run_semantic_pipeline_for_project(
+            project.id, threshold=threshold, top_k=top_k, project=project
+        )
+        cache.set(key, result, SEMANTIC_RESULT_CACHE_TTL)
+    return result
+
+
+def _projects_visible_to(user):
+    """
+    Project queryset annotated with user_is_member, so the membership check
+    in _can_open_project is resolved by the same query that loads the project.
+    """
+    return Project.objects.annotate(
+        user_is_member=Exists(
+            ProjectMembership.objects.filter(project=OuterRef("pk"), user_id=user.pk)
+        )
+    )
 
 
 def _can_open_project(project: Project, user) -> bool:
@@ -56,13 +167,25 @@ def _can_open_project(project: Project, user) -> bool:
     if is_evaluator(user) and project.evaluator_id == user.id:
         return True
 
-    return ProjectMembership.objects.filter(project=project, user=user).exists()
+    is_member = getattr(project, "user_is_member", None)
+    if is_member is not None:
+        return bool(is_member)
+
+    return get_membership(project, user) is not None
 
 
 def _forbidden():
     return JsonResponse({"detail": "Forbidden"}, status=403)
 
 
+def _server_error(exc: Exception):
+    """500 payload; the stack trace is only included (and formatted) in DEBUG."""
+    payload = {"error": str(exc)}
+    if settings.DEBUG:
+        payload["trace"] = traceback.format_exc()
+    return JsonResponse(payload, status=500)
+
+
 def _resolve_code_root_from_project(project: Project) -> Path:
     active_code = getattr(project, "active_code", None)
     if not active_code:
@@ -95,19 +218,23 @@ def dashboard(request):
 
 @login_required
 @require_GET
+@gzip_page
 def run_project(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    # active_bpmn is loaded here once and reused for the pre-dev info below
+    project = get_object_or_404(
+        _projects_visible_to(request.user).select_related("active_bpmn", "active_code"),
+        id=project_id,
+    )
     if not _can_open_project(project, request.user):
         return _forbidden()
 
     threshold = float(request.GET.get("threshold", project.similarity_threshold or 0.7))
     top_k = int(request.GET.get("top_k", 3))
 
-    result = run_semantic_pipeline_for_project(project_id, threshold=threshold, top_k=top_k)
+    result = _cached_semantic_result(project, threshold, top_k)
 
     # Attach pre-dev info stored on active_bpmn
     try:
-        project = Project.objects.select_related("active_bpmn").get(id=project_id)
         ab = project.active_bpmn
         result["bpmn_summary"] = (ab.bpmn_summary if ab else "") or ""
         result["precheck_warnings"] = (ab.precheck_warnings if ab else []) or []
@@ -119,7 +246,7 @@ def run_project(request, project_id: int):
         result["precheck_errors"] = []
         result["is_well_formed"] = False
 
-    return JsonResponse(result, safe=True, json_dumps_params={"ensure_ascii": False})
+    return fast_json_response(result)
 
 
 # ============================================================
@@ -127,59 +254,77 @@ def run_project(request, project_id: int):
 # ============================================================
 # NOTE: These metrics endpoints compute precision, recall, F1 and alignment.
 # Not currently used by the frontend — available for future use or external tooling.
+# run_project_metrics (also routed as metrics/batch/) returns summary and details
+# in one response; clients should prefer it over calling metrics_summary and
+# metrics_details separately, which are kept for existing callers.
+# The large-payload views (run_project, run_project_metrics, metrics_details)
+# are gzip-compressed for clients that accept it; their numeric JSON is
+# highly repetitive, so this cuts the bytes on the wire several-fold.
+@transaction.non_atomic_requests
 @csrf_exempt
 @login_required
 @require_http_methods(["POST"])
+@_limit_body_size
+@gzip_page
 def run_project_metrics(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(_projects_visible_to(request.user), id=project_id)
     if not _can_open_project(project, request.user):
         return _forbidden()
 
-    payload = _read_json(request)
     try:
-        result = compute_metrics_from_similarity_payload(payload)
-        return JsonResponse(result, safe=True, json_dumps_params={"ensure_ascii": False})
+        result = _cached_metrics(request, project_id)
+        return fast_json_response(result)
+    except MetricsPayloadError as e:
+        return _bad_payload(e)
     except Exception as e:
-        return JsonResponse({"error": str(e), "trace": traceback.format_exc()}, status=500)
+        return _server_error(e)
 
 
+@transaction.non_atomic_requests
 @csrf_exempt
 @login_required
 @require_http_methods(["POST"])
+@_limit_body_size
 def metrics_summary(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(_projects_visible_to(request.user), id=project_id)
     if not _can_open_project(project, request.user):
         return _forbidden()
 
-    payload = _read_json(request)
     try:
-        result = compute_metrics_from_similarity_payload(payload)
-        return JsonResponse(result["summary"], safe=True, json_dumps_params={"ensure_ascii": False})
+        result = _cached_metrics(request, project_id)
+        return fast_json_response(result["summary"])
+    except MetricsPayloadError as e:
+        return _bad_payload(e)
     except Exception as e:
-        return JsonResponse({"error": str(e), "trace": traceback.format_exc()}, status=500)
+        return _server_error(e)
 
 
+@transaction.non_atomic_requests
 @csrf_exempt
 @login_required
 @require_http_methods(["POST"])
+@_limit_body_size
+@gzip_page
 def metrics_details(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(_projects_visible_to(request.user), id=project_id)
     if not _can_open_project(project, request.user):
         return _forbidden()
 
-    payload = _read_json(request)
     try:
-        result = compute_metrics_from_similarity_payload(payload)
-        return JsonResponse(result["details"], safe=True, json_dumps_params={"ensure_ascii": False})
+        result = _cached_metrics(request, project_id)
+        return fast_json_response(result["details"])
+    except MetricsPayloadError as e:
+        return _bad_payload(e)
     except Exception as e:
-        return JsonResponse({"error": str(e), "trace": traceback.format_exc()}, status=500)
+        return _server_error(e)
 
 
+@transaction.non_atomic_requests
 @csrf_exempt
 @login_required
 @require_http_methods(["POST"])
 def metrics_developers(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(_projects_visible_to(request.user), id=project_id)
     if not _can_open_project(project, request.user):
         return _forbidden()
 
@@ -189,39 +334,51 @@ def metrics_developers(request, project_id: int):
 # ============================================================
 # Compare BPMN vs Code inputs endpoint
 # ============================================================
+@transaction.non_atomic_requests
 @login_required
 @require_GET
+@cache_control(private=True, max_age=DASHBOARD_STATS_MAX_AGE)
 def dashboard_stats(request):
     """
     JSON endpoint for React DashboardPage:
     GET /analysis/api/reports/dashboard/
     Scoped to projects where the user is a member.
     """
-    memberships = (
+    # One round trip for the project ids and all three counters: each
+    # membership row carries its project's upload/run counts as scalar
+    # subqueries, summed below. No join to projects is needed, and
+    # uniq_project_member guarantees one row per (project, user), so no
+    # DISTINCT/dedup either.
+    runs = AnalysisRun.objects.all()
+    membership_rows = list(
         ProjectMembership.objects
-        .select_related("project")
         .filter(user=request.user)
+        .annotate(
+            uploads=count_per_project(ProjectFile.objects.all(), "project_id"),
+            done=count_per_project(runs.filter(status="DONE"), "project_id"),
+            pending=count_per_project(runs.exclude(status="DONE"), "project_id"),
+        )
+        .values_list("project_id", "uploads", "done", "pending")
     )
-    project_ids = [m.project_id for m in memberships]
-    unique_project_ids = list(set(project_ids))
 
+    unique_project_ids = [row[0] for row in membership_rows]
     total_projects = len(unique_project_ids)
-    total_uploads = ProjectFile.objects.filter(project_id__in=unique_project_ids).count()
-
-    analyses_done = AnalysisRun.objects.filter(project_id__in=unique_project_ids, status="DONE").count()
-    analyses_pending = AnalysisRun.objects.filter(project_id__in=unique_project_ids).exclude(status="DONE").count()
+    total_uploads = sum(row[1] for row in membership_rows)
+    analyses_done = sum(row[2] for row in membership_rows)
+    analyses_pending = sum(row[3] for row in membership_rows)
 
+    # last run status/time are denormalized onto Project (see analysis.signals)
     recent_projects_qs = (
         Project.objects
         .filter(id__in=unique_project_ids)
+        .only("id", "name", "created_at", "last_run_status", "last_run_at")
         .order_by("-created_at")[:10]
     )
 
     recent_projects = []
     for p in recent_projects_qs:
-        last_run = AnalysisRun.objects.filter(project=p).order_by("-created_at").first()
-        status = "done" if (last_run and last_run.status == "DONE") else "pending"
-        updated_at = (last_run.created_at if last_run else p.created_at)
+        status = "done" if p.last_run_status == "DONE" else "pending"
+        updated_at = p.last_run_at or p.created_at
 
         recent_projects.append({
             "id": str(p.id),
@@ -230,17 +387,13 @@ def dashboard_stats(request):
             "updatedAt": updated_at.isoformat() if updated_at else "",
         })
 
-    return JsonResponse(
-        {
-            "totalProjects": total_projects,
-            "totalUploads": total_uploads,
-            "analysesPending": analyses_pending,
-            "analysesDone": analyses_done,
-            "recentProjects": recent_projects,
-        },
-        safe=True,
-        json_dumps_params={"ensure_ascii": False},
-    )
+    return fast_json_response({
+        "totalProjects": total_projects,
+        "totalUploads": total_uploads,
+        "analysesPending": analyses_pending,
+        "analysesDone": analyses_done,
+        "recentProjects": recent_projects,
+    })
 
 @login_required
 @require_GET
@@ -263,13 +416,11 @@ def project_bpmn_diagram(request, project_id: int):
 
     try:
         bpmn_path = _abs_media_path(active_bpmn.stored_path)
-        graph = extract_bpmn_graph(bpmn_path)
+        # parse straight from the page cache instead of a read_bytes() copy
+        with map_bpmn_file(bpmn_path) as bpmn_buf:
+            graph = extract_bpmn_graph(bpmn_buf)
 
-        return JsonResponse(
-            graph,
-            safe=True,
-            json_dumps_params={"ensure_ascii": False},
-        )
+        return fast_json_response(graph)
 
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
@@ -390,6 +541,17 @@ def project_bpmn_xml(request, project_id: int):
 
     bpmn_path = _abs_media_path(project.active_bpmn.stored_path)
 
+    # Files that already carry a diagram layout are served unchanged: check
+    # through a read-only mmap and stream the file instead of decoding it.
+    try:
+        with map_bpmn_file(bpmn_path) as bpmn_buf:
+            has_diagram = bpmn_buf.find(b"BPMNDiagram") != -1
+    except ValueError:  # empty file; mmap needs at least one byte
+        has_diagram = False
+
+    if has_diagram:
+        return FileResponse(open(bpmn_path, "rb"), content_type="application/xml")
+
     xml_text = bpmn_path.read_text(encoding="utf-8")
 
     # ✅ Check if BPMN has visual diagram layout
@@ -403,8 +565,7 @@ def project_bpmn_xml(request, project_id: int):
     #         },
     #         status=400,
     #     )
-    if "BPMNDiagram" not in xml_text:
-       xml_text = _auto_add_bpmn_di(xml_text)
+    xml_text = _auto_add_bpmn_di(xml_text)
 
     return HttpResponse(
         xml_text,
@@ -451,7 +612,7 @@ def save_fixed_bpmn(request, project_id: int):
         )
 
     try:
-        payload = json.loads(request.body.decode("utf-8"))
+        payload = read_json_body(request)
         xml = payload.get("xml", "")
 
         if not xml.strip():
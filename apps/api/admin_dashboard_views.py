@@ -1,3 +1,4 @@
+from django.db.models import Count
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 from django.contrib.auth.models import User
@@ -13,9 +14,14 @@ def admin_dashboard(request):
 
     total_users = User.objects.count()
     total_projects = Project.objects.count()
-    total_admins = UserProfile.objects.filter(role="ADMIN").count()
-    total_evaluators = UserProfile.objects.filter(role="EVALUATOR").count()
-    total_developers = UserProfile.objects.filter(role="DEVELOPER").count()
+
+    # all role counts from one GROUP BY instead of a COUNT per role
+    role_counts = dict(
+        UserProfile.objects.order_by().values_list("role").annotate(c=Count("id"))
+    )
+    total_admins = role_counts.get(UserProfile.Role.ADMIN, 0)
+    total_evaluators = role_counts.get(UserProfile.Role.EVALUATOR, 0)
+    total_developers = role_counts.get(UserProfile.Role.DEVELOPER, 0)
 
     return JsonResponse({
         "stats": {
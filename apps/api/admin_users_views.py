@@ -1,5 +1,6 @@
 # apps/api/admin_users_views.py
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -26,8 +27,14 @@ def users_list_create(request):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
     if request.method == "GET":
-        qs = User.objects.all().order_by("-date_joined").select_related("profile")
-        return JsonResponse({"users": [_user_row(u) for u in qs]})
+        # only the columns _user_row reads; the password hash etc. stay in the DB
+        qs = (
+            User.objects
+            .select_related("profile")
+            .only("id", "email", "username", "first_name", "is_active", "date_joined", "profile__role")
+            .order_by("-date_joined")
+        )
+        return JsonResponse({"users": [_user_row(u) for u in qs.iterator(chunk_size=500)]})
 
     # POST create
     email = (request.POST.get("email") or "").strip().lower()
@@ -42,21 +49,26 @@ def users_list_create(request):
     if role not in [c[0] for c in UserProfile.Role.choices]:
         return JsonResponse({"detail": "Invalid role"}, status=400)
 
-    if User.objects.filter(username=email).exists():
+    # auth_user.username is unique: let the INSERT detect a taken email
+    # instead of a separate exists() check that could race with it.
+    try:
+        with transaction.atomic():
+            u = User.objects.create_user(
+                username=email,
+                email=email,
+                password=password,
+                first_name=full_name,
+                is_active=is_active,
+            )
+
+            # accounts.models.ensure_profile created the profile on save and
+            # left it cached on u; reuse it instead of fetching it again.
+            profile = u.profile
+            profile.role = role
+            profile.save(update_fields=["role"])
+    except IntegrityError:
         return JsonResponse({"detail": "A user with this email already exists"}, status=400)
 
-    u = User.objects.create_user(
-        username=email,
-        email=email,
-        password=password,
-        first_name=full_name,
-        is_active=is_active,
-    )
-
-    profile, _ = UserProfile.objects.get_or_create(user=u)
-    profile.role = role
-    profile.save()
-
     return JsonResponse({"user": _user_row(u)}, status=201)
 
 
@@ -65,7 +77,7 @@ def users_update_delete(request, user_id: int):
     if not _is_admin(request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
-    u = User.objects.filter(id=user_id).first()
+    u = User.objects.select_related("profile").filter(id=user_id).first()
     if not u:
         return JsonResponse({"detail": "Not found"}, status=404)
 
@@ -84,8 +96,6 @@ def users_update_delete(request, user_id: int):
     is_active_raw = (request.POST.get("isActive") or "").strip().lower()
 
     if email and email != u.username:
-        if User.objects.filter(username=email).exclude(id=u.id).exists():
-            return JsonResponse({"detail": "Email already in use"}, status=400)
         u.username = email
         u.email = email
 
@@ -98,13 +108,18 @@ def users_update_delete(request, user_id: int):
     if password:
         u.set_password(password)
 
-    u.save()
+    try:
+        with transaction.atomic():
+            u.save()
+    except IntegrityError:
+        # unique auth_user.username: the new email belongs to another user
+        return JsonResponse({"detail": "Email already in use"}, status=400)
 
-    profile, _ = UserProfile.objects.get_or_create(user=u)
+    profile = u.profile
     if role:
         if role not in [c[0] for c in UserProfile.Role.choices]:
             return JsonResponse({"detail": "Invalid role"}, status=400)
         profile.role = role
-        profile.save()
+        profile.save(update_fields=["role"])
 
     return JsonResponse({"user": _user_row(u)})
\ No newline at end of file
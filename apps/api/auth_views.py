@@ -4,7 +4,7 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_GET, require_POST
 from django.views.decorators.csrf import ensure_csrf_cookie
 
-from apps.accounts.models import UserProfile
+from apps.accounts.rbac import role_of
 
 
 def _user_payload(user):
@@ -12,13 +12,11 @@ def _user_payload(user):
     email = user.email or user.username
     full_name = (user.first_name or "").strip() or (user.get_full_name() or "").strip()
 
-    role = getattr(getattr(user, "profile", None), "role", UserProfile.Role.DEVELOPER)
-
     return {
         "id": user.id,
         "email": email,
         "fullName": full_name,
-        "role": role,
+        "role": role_of(user),
     }
 
 
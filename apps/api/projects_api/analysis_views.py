@@ -3,18 +3,21 @@ from __future__ import annotations
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 
-from apps.analysis.services.services import run_analysis_for_project
+from apps.analysis.models import AnalysisRun
+from apps.analysis.services.services import run_analysis_for_project, start_analysis_for_project
 from apps.projects.models import Project
-
-from .permissions import can_open_project
+from apps.projects.permissions import can_open_project, get_project_for_user
 
 
 @login_required
 @require_POST
 def api_run_analysis(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    # the active uploads are checked below and read again by the pipeline
+    project = get_project_for_user(
+        project_id, request.user, Project.objects.select_related("active_bpmn", "active_code"),
+    )
 
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Only project members can run analysis."}, status=403)
@@ -25,6 +28,11 @@ def api_run_analysis(request, project_id: int):
     if not project.active_code:
         return JsonResponse({"detail": "Upload Code ZIP first."}, status=400)
 
+    # ?background=1 queues the run and returns 202; poll analysis-runs/<id>/
+    if request.GET.get("background") in ("1", "true"):
+        run = start_analysis_for_project(project, matcher="greedy", top_k=3)
+        return JsonResponse({"run": _serialize_run(run)}, status=202)
+
     try:
         run = run_analysis_for_project(project, matcher="greedy", top_k=3)
         return JsonResponse({
@@ -35,4 +43,26 @@ def api_run_analysis(request, project_id: int):
             }
         })
     except Exception as e:
-        return JsonResponse({"detail": f"Analysis failed: {e}"}, status=400)
\ No newline at end of file
+        return JsonResponse({"detail": f"Analysis failed: {e}"}, status=400)
+
+
+@login_required
+@require_GET
+def api_analysis_run_status(request, project_id: int, run_id: int):
+    project = get_project_for_user(project_id, request.user)
+
+    if not can_open_project(project, request.user):
+        return JsonResponse({"detail": "Forbidden"}, status=403)
+
+    run = get_object_or_404(AnalysisRun, id=run_id, project=project)
+    return JsonResponse({"run": _serialize_run(run)})
+
+
+def _serialize_run(run: AnalysisRun) -> dict:
+    return {
+        "id": run.id,
+        "status": run.status,
+        "startedAt": run.started_at.isoformat() if run.started_at else None,
+        "finishedAt": run.finished_at.isoformat() if run.finished_at else None,
+        "errorMessage": run.error_message,
+    }
\ No newline at end of file
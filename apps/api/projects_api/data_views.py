@@ -2,40 +2,39 @@ from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_http_methods, require_POST
 
 from apps.analysis.models import AnalysisRun, BpmnTask, MatchResult
-from apps.projects.models import Project, ProjectFile
-
-from .permissions import can_open_project, is_project_evaluator, require_admin_or_evaluator
+from apps.common.http import STREAM_ROWS_PER_CHUNK, fast_json_response, read_json_body, stream_json_list_response
+from apps.projects.models import ProjectFile
+from apps.projects.permissions import can_open_project, get_project_for_user, is_project_evaluator, require_admin_or_evaluator
 from apps.projects.github_service import validate_github_url
-import json
 
 @login_required
 @require_http_methods(["GET"])
 def api_project_logs(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not is_project_evaluator(project, request.user):
         return JsonResponse({"detail": "Only evaluator can view upload logs."}, status=403)
 
+    # plain rows: the BPMN precheck/summary columns are not part of the log
     logs = (
         ProjectFile.objects
         .filter(project=project)
-        .select_related("uploaded_by")
-        .order_by("-created_at")[:200]
+        .order_by("-created_at")
+        .values("id", "file_type", "original_name", "uploaded_by__username", "created_at")[:200]
     )
 
     return JsonResponse({
         "projectId": project.id,
         "logs": [
             {
-                "id": f.id,
-                "fileType": f.file_type,
-                "originalName": f.original_name,
-                "uploadedBy": f.uploaded_by.username if f.uploaded_by else None,
-                "createdAt": f.created_at.isoformat() if f.created_at else None,
+                "id": f["id"],
+                "fileType": f["file_type"],
+                "originalName": f["original_name"],
+                "uploadedBy": f["uploaded_by__username"],
+                "createdAt": f["created_at"].isoformat() if f["created_at"] else None,
             }
             for f in logs
         ]
@@ -45,13 +44,13 @@ def api_project_logs(request, project_id: int):
 @login_required
 @require_POST
 def api_update_threshold(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not is_project_evaluator(project, request.user):
         return JsonResponse({"detail": "Only evaluator can update settings."}, status=403)
 
     try:
-        body = json.loads(request.body.decode("utf-8") or "{}")
+        body = read_json_body(request)
         v = float(body.get("similarityThreshold") or 0)
         if v <= 0 or v >= 1:
             raise ValueError()
@@ -64,13 +63,13 @@ def api_update_threshold(request, project_id: int):
 @login_required
 @require_POST
 def api_update_github_url(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not is_project_evaluator(project, request.user):
         return JsonResponse({"detail": "Only evaluator can update settings."}, status=403)
 
     try:
-        body = json.loads(request.body.decode("utf-8") or "{}")
+        body = read_json_body(request)
         url = (body.get("github_repo_url") or "").strip()
 
         if url:
@@ -86,49 +85,59 @@ def api_update_github_url(request, project_id: int):
 
 @login_required
 def api_project_files(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
-    files = list(project.code_files.values("relative_path", "ext", "size_bytes"))
-    return JsonResponse({"project_id": project.id, "files": files})
+    files = project.code_files.values("relative_path", "ext", "size_bytes").iterator(chunk_size=STREAM_ROWS_PER_CHUNK)
+    return stream_json_list_response({"project_id": project.id}, "files", files)
 
 
 @login_required
 def api_project_tasks(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
-    tasks = list(project.bpmn_tasks.values("task_id", "name", "description"))
-    return JsonResponse({"project_id": project.id, "tasks": tasks})
+    # ?fields=short: ids and names only, without the task descriptions
+    if request.GET.get("fields") == "short":
+        tasks = list(project.bpmn_tasks.values("task_id", "name"))
+    else:
+        tasks = list(project.bpmn_tasks.values("task_id", "name", "description"))
+    return fast_json_response({"project_id": project.id, "tasks": tasks})
 
 
 @login_required
 def api_project_matches(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
-    matches = []
-    for m in project.match_results.select_related("task").all():
-        matches.append({
-            "status": m.status,
-            "similarity_score": m.similarity_score,
+    rows = (
+        project.match_results
+        .values("status", "similarity_score", "code_ref", "task_id", "task__task_id", "task__name")
+        .iterator(chunk_size=STREAM_ROWS_PER_CHUNK)
+    )
+    matches = (
+        {
+            "status": m["status"],
+            "similarity_score": m["similarity_score"],
             "task": {
-                "task_id": m.task.task_id,
-                "name": m.task.name,
-            } if m.task else None,
-            "code_ref": m.code_ref,
-        })
+                "task_id": m["task__task_id"],
+                "name": m["task__name"],
+            } if m["task_id"] else None,
+            "code_ref": m["code_ref"],
+        }
+        for m in rows
+    )
 
-    return JsonResponse({"project_id": project.id, "matches": matches})
+    return stream_json_list_response({"project_id": project.id}, "matches", matches)
 
 
 @login_required
 @require_http_methods(["GET"])
 def api_project_report(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not require_admin_or_evaluator(project, request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import zipfile
 import os
 from django.contrib.auth.decorators import login_required
@@ -13,9 +12,8 @@ from apps.github_integration.services.github_service import GitHubService
 from apps.projects.models import Project
 from apps.task_management.models import TaskAssignment, DeveloperSubmission
 from apps.accounts.rbac import is_evaluator, is_admin
-from .permissions import can_open_project
-from apps.github_integration.models import GitHubRepository
-from apps.github_integration.services.github_service import GitHubService
+from apps.common.http import read_json_body
+from apps.projects.permissions import can_open_project
 from apps.github_integration.views import _reindex_default_branch_async
 
 # Text file extensions we'll try to display inline
@@ -162,21 +160,22 @@ def api_dev_submissions_list(request, project_id: int):
     from collections import defaultdict
     grouped: dict[int, list] = defaultdict(list)
     assignment_meta: dict[int, dict] = {}
+    # Same for every row; built once instead of per submission
+    zip_url_prefix = f"/api/projects/{project.id}/developer-submissions/"
 
     for s in submissions:
         a = s.assignment
         aid = a.id
         if aid not in assignment_meta:
+            task = a.bpmn_task
+            dev = a.developer_membership.user
             assignment_meta[aid] = {
                 "assignmentId": aid,
-                "taskId": a.bpmn_task.task_id,
-                "taskName": a.bpmn_task.name,
-                "taskDescription": a.bpmn_task.summary_text or a.bpmn_task.description or "",
-                "developerEmail": a.developer_membership.user.email or a.developer_membership.user.username,
-                "developerName": (
-                    f"{a.developer_membership.user.first_name} {a.developer_membership.user.last_name}".strip()
-                    or a.developer_membership.user.username
-                ),
+                "taskId": task.task_id,
+                "taskName": task.name,
+                "taskDescription": task.summary_text or task.description or "",
+                "developerEmail": dev.email or dev.username,
+                "developerName": f"{dev.first_name} {dev.last_name}".strip() or dev.username,
                 "assignmentStatus": a.status,
             }
         grouped[aid].append({
@@ -187,7 +186,7 @@ def api_dev_submissions_list(request, project_id: int):
             "submittedAt": s.submitted_at.isoformat(),
             "reviewedAt": s.reviewed_at.isoformat() if s.reviewed_at else None,
             "reviewedBy": s.reviewed_by.email if s.reviewed_by else None,
-            "zipUrl": f"/api/projects/{project.id}/developer-submissions/{s.id}/download/" if s.zip_file else None,
+            "zipUrl": f"{zip_url_prefix}{s.id}/download/" if s.zip_file else None,
             "zipFileName": s.zip_file.name.split("/")[-1] if s.zip_file else None,
             "hasFiles": bool(s.zip_file),
             "similarityScore": match_scores.get(s.id),
@@ -284,7 +283,7 @@ def api_dev_submission_reject(request, project_id: int, submission_id: int):
     if submission.status != DeveloperSubmission.Status.PENDING:
         return JsonResponse({"detail": "Submission is not pending."}, status=400)
 
-    body = json.loads(request.body.decode() or "{}")
+    body = read_json_body(request)
     feedback = (body.get("feedback") or "").strip()
 
     submission.status = DeveloperSubmission.Status.REJECTED
@@ -328,7 +327,7 @@ def api_dev_submission_reassign(request, project_id: int, submission_id: int):
         ).delete()
 
         
-    body = json.loads(request.body.decode() or "{}")
+    body = read_json_body(request)
     feedback = (body.get("feedback") or "").strip()
     if not feedback:
         return JsonResponse({"detail": "Feedback is required for reassignment."}, status=400)
@@ -480,8 +479,7 @@ def api_github_pr_accept(request, project_id: int):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
     try:
-        import json as _json
-        body = _json.loads(request.body)
+        body = read_json_body(request)
     except Exception:
         return JsonResponse({"detail": "Invalid JSON."}, status=400)
 
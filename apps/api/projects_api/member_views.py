@@ -1,31 +1,30 @@
 from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.models import User
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_http_methods, require_POST
 
 from apps.projects.models import Project, ProjectMembership
+from apps.accounts.lookups import find_user_by_login
 from apps.accounts.rbac import is_admin
-
-from .permissions import is_project_evaluator
+from apps.projects.permissions import get_project_for_user, is_member, is_project_evaluator
 
 
 def can_view_project_members(project: Project, user) -> bool:
     if is_admin(user):
         return True
 
-    if is_project_evaluator(project, user):
+    if is_member(project, user):
         return True
 
-    return ProjectMembership.objects.filter(project=project, user=user).exists()
+    return is_project_evaluator(project, user)
 
 
 @login_required
 @require_http_methods(["GET", "POST"])
 def api_project_members(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user, Project.objects.select_related("evaluator"))
 
     if request.method == "GET":
         if not can_view_project_members(project, request.user):
@@ -33,18 +32,18 @@ def api_project_members(request, project_id: int):
 
         members = (
             ProjectMembership.objects
-            .select_related("user")
             .filter(project=project)
             .order_by("user__username")
+            .values("id", "user__username", "user__email", "role")
         )
         return JsonResponse({
             "projectId": project.id,
             "members": [
                 {
-                    "id": m.id,
-                    "username": m.user.username,
-                    "email": m.user.email,
-                    "role": getattr(m, "role", "DEVELOPER"),
+                    "id": m["id"],
+                    "username": m["user__username"],
+                    "email": m["user__email"],
+                    "role": m["role"] or "DEVELOPER",
                 }
                 for m in members
             ],
@@ -63,7 +62,7 @@ def api_project_members(request, project_id: int):
     if not email:
         return JsonResponse({"detail": "Enter an email."}, status=400)
 
-    user = User.objects.filter(username=email).first() or User.objects.filter(email=email).first()
+    user = find_user_by_login(email)
     if not user:
         return JsonResponse({"detail": "No user found with that email."}, status=404)
 
@@ -89,7 +88,7 @@ def api_project_members(request, project_id: int):
 @login_required
 @require_POST
 def api_remove_member(request, project_id: int, membership_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not is_admin(request.user):
         return JsonResponse({"detail": "Only admin can manage members."}, status=403)
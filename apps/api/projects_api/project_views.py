@@ -2,34 +2,48 @@ from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_http_methods
 
+from apps.accounts.lookups import find_user_by_login
 from apps.accounts.rbac import is_admin, is_evaluator
+from apps.common.http import fast_json_response
 from apps.projects.models import Project, ProjectMembership
+from apps.projects.permissions import can_open_project
 
-from .permissions import can_open_project
-from .serializers import json_project_detail, json_project_summary
+from .serializers import json_project_detail, json_project_summary, project_detail_prefetches
+
+# Columns json_project_summary reads; list queries load only these.
+PROJECT_SUMMARY_FIELDS = ("id", "name", "description", "similarity_threshold", "github_repo_url", "evaluator_id")
+# ?fields=short: the same without the free-text description.
+PROJECT_SHORT_SUMMARY_FIELDS = tuple(f for f in PROJECT_SUMMARY_FIELDS if f != "description")
 
 
 @login_required
 @require_http_methods(["GET", "POST"])
 def api_projects_list_create(request):
     if request.method == "GET":
+        short = request.GET.get("fields") == "short"
+        base = Project.objects.only(*(PROJECT_SHORT_SUMMARY_FIELDS if short else PROJECT_SUMMARY_FIELDS))
+
         if is_admin(request.user):
-            projects = Project.objects.all().order_by("-created_at")
-            data = [json_project_summary(p, request.user) for p in projects]
-            return JsonResponse(data, safe=False)
+            projects = base.order_by("-created_at")
+            data = [json_project_summary(p, request.user, role="ADMIN") for p in projects]
+            return fast_json_response(data)
 
         if is_evaluator(request.user):
-            projects = Project.objects.filter(evaluator=request.user).order_by("-created_at")
-            data = [json_project_summary(p, request.user) for p in projects]
-            return JsonResponse(data, safe=False)
+            projects = base.filter(evaluator=request.user).order_by("-created_at")
+            data = [json_project_summary(p, request.user, role="EVALUATOR") for p in projects]
+            return fast_json_response(data)
 
-        projects = Project.objects.filter(memberships__user=request.user).distinct().order_by("-created_at")
-        data = [json_project_summary(p, request.user) for p in projects]
-        return JsonResponse(data, safe=False)
+        # semi-join on membership ids: no DISTINCT over the joined project rows
+        projects = base.filter(
+            id__in=ProjectMembership.objects.filter(user=request.user).values("project_id")
+        ).order_by("-created_at")
+        data = [json_project_summary(p, request.user, role="DEVELOPER") for p in projects]
+        return fast_json_response(data)
 
     if not is_admin(request.user):
         return JsonResponse({"detail": "Only admin can create projects."}, status=403)
@@ -56,10 +70,7 @@ def api_projects_list_create(request):
     except Exception:
         return JsonResponse({"detail": "Threshold must be between 0 and 1 (e.g., 0.6)."}, status=400)
 
-    evaluator = (
-        User.objects.filter(username=evaluator_email).first()
-        or User.objects.filter(email=evaluator_email).first()
-    )
+    evaluator = find_user_by_login(evaluator_email)
     if not evaluator:
         return JsonResponse({"detail": "Evaluator user not found."}, status=404)
 
@@ -75,8 +86,24 @@ def api_projects_list_create(request):
         github_repo_url=github_repo_url,
     )
 
+    # One query for every listed developer; a username match wins over an
+    # email match, as with the per-email lookups this replaces.
+    by_username = {}
+    by_email = {}
+    if developer_emails:
+        candidates = (
+            User.objects
+            .filter(Q(username__in=developer_emails) | Q(email__in=developer_emails))
+            .select_related("profile")
+            .order_by("pk")
+        )
+        for u in candidates:
+            by_username.setdefault(u.username, u)
+            by_email.setdefault(u.email, u)
+
+    developers = {}
     for email in developer_emails:
-        dev = User.objects.filter(username=email).first() or User.objects.filter(email=email).first()
+        dev = by_username.get(email) or by_email.get(email)
         if not dev:
             continue
         if dev.id == evaluator.id:
@@ -86,7 +113,12 @@ def api_projects_list_create(request):
         if profile and getattr(profile, "role", None) != "DEVELOPER":
             continue
 
-        ProjectMembership.objects.get_or_create(project=project, user=dev)
+        developers[dev.id] = dev
+
+    ProjectMembership.objects.bulk_create(
+        [ProjectMembership(project=project, user=dev) for dev in developers.values()],
+        ignore_conflicts=True,
+    )
 
     return JsonResponse(json_project_summary(project, request.user), status=201)
 
@@ -95,10 +127,12 @@ def api_projects_list_create(request):
 @login_required
 @require_http_methods(["GET", "DELETE"])
 def api_project_detail_or_delete(request, project_id: int):
-    project = get_object_or_404(
-        Project.objects.select_related("active_bpmn", "active_code", "evaluator"),
-        id=project_id,
+    projects = Project.objects.select_related(
+        "active_bpmn__uploaded_by", "active_code__uploaded_by", "evaluator",
     )
+    if request.method == "GET":
+        projects = projects.prefetch_related(*project_detail_prefetches())
+    project = get_object_or_404(projects, id=project_id)
     if request.method == "DELETE":
         if not is_admin(request.user):
             return JsonResponse({"detail": "Admin only."}, status=403)
@@ -108,7 +142,7 @@ def api_project_detail_or_delete(request, project_id: int):
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
-    return JsonResponse(json_project_detail(project, request.user))
+    return fast_json_response(json_project_detail(project, request.user))
 
 
 @login_required
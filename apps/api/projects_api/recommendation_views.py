@@ -8,9 +8,9 @@ from django.views.decorators.http import require_http_methods
 from apps.analysis.models import BpmnRecommendations
 from apps.analysis.services.services import run_recommendation_for_project
 from apps.projects.models import Project
+from apps.projects.permissions import can_open_project
 
 from .helpers import get_project_bpmn_summary
-from .permissions import can_open_project
 
 
 @login_required
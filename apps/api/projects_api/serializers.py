@@ -1,28 +1,41 @@
 from __future__ import annotations
 
 from django.contrib.auth.models import User
+from django.db.models import OuterRef, Prefetch, Subquery
 
 from apps.accounts.rbac import is_admin, is_evaluator
 from apps.analysis.models import AnalysisRun, BpmnTask, MatchResult
-from apps.projects.models import Project, ProjectMembership, CodeFile
+from apps.common.db import count_per_project
+from apps.projects.models import Project, ProjectMembership, CodeFile, ProjectFile
+from apps.projects.permissions import get_membership
 
-from .helpers import latest_file
 
-
-def json_project_summary(project: Project, user: User):
+def _membership_role(project: Project, user: User):
     if is_admin(user):
-        role = "ADMIN"
-    elif getattr(project, "evaluator_id", None) == user.id and is_evaluator(user):
-        role = "EVALUATOR"
-    elif ProjectMembership.objects.filter(project=project, user=user).exists():
-        role = "DEVELOPER"
-    else:
-        role = None
+        return "ADMIN"
+    if getattr(project, "evaluator_id", None) == user.id and is_evaluator(user):
+        return "EVALUATOR"
+    if get_membership(project, user) is not None:
+        return "DEVELOPER"
+    return None
+
+
+def json_project_summary(project: Project, user: User, role: str | None = None):
+    """
+    role is the user's membership role for this project. List views that
+    already know it (every row of their queryset has the same role) pass it
+    in, which skips the per-project membership query.
+    """
+    if role is None:
+        role = _membership_role(project, user)
+
+    # a list query may leave the description out; don't load it per row
+    description = "" if "description" in project.get_deferred_fields() else project.description
 
     return {
         "id": project.id,
         "name": project.name,
-        "description": project.description or "",
+        "description": description or "",
         "similarityThreshold": float(project.similarity_threshold),
         "github_repo_url": project.github_repo_url or "",
         "membership": {"role": role} if role else None,
@@ -97,28 +110,86 @@ def _serialize_indexed_code_file(code_file: CodeFile):
     }
 
 
+def _latest_files_by_type(project: Project):
+    """
+    {"BPMN": ProjectFile, "CODE": ProjectFile} with the newest upload of each
+    type, fetched in one query (helpers.latest_file does one type per query).
+    """
+    newest_of_type = (
+        ProjectFile.objects
+        .filter(project=project, file_type=OuterRef("file_type"))
+        .order_by("-created_at")
+        .values("pk")[:1]
+    )
+    files = (
+        ProjectFile.objects
+        .filter(project=project, file_type__in=["BPMN", "CODE"], pk=Subquery(newest_of_type))
+        .select_related("uploaded_by")
+    )
+    return {f.file_type: f for f in files}
+
+
+# Most recent analysis runs listed in the project detail.
+DETAIL_RUNS_LIMIT = 10
+
+
+def project_detail_prefetches():
+    """
+    Prefetches for a project about to be passed to json_project_detail: its
+    latest runs (as project.recent_runs) and its members with their users.
+    The prefetched members also answer permissions.get_membership.
+    """
+    return (
+        Prefetch(
+            "analysis_runs",
+            queryset=AnalysisRun.objects.order_by("-created_at")[:DETAIL_RUNS_LIMIT],
+            to_attr="recent_runs",
+        ),
+        Prefetch(
+            "memberships",
+            queryset=ProjectMembership.objects.select_related("user").order_by("user__username"),
+        ),
+    )
+
+
 def json_project_detail(project: Project, user: User):
     active_bpmn = project.active_bpmn
     active_code = project.active_code
 
-    latest_bpmn = latest_file(project, "BPMN")
-    latest_code = latest_file(project, "CODE")
+    latest = _latest_files_by_type(project)
+    latest_bpmn = latest.get("BPMN")
+    latest_code = latest.get("CODE")
 
     code_files = CodeFile.objects.filter(project=project).order_by("id")
-    code_files_count = code_files.count()
     indexed_files = [_serialize_indexed_code_file(code_file) for code_file in code_files]
+    code_files_count = len(indexed_files)
+
+    # both counts in one round-trip, as scalar subqueries on the project row
+    counts = (
+        Project.objects
+        .filter(pk=project.pk)
+        .values(
+            tasks=count_per_project(BpmnTask.objects.all()),
+            matches=count_per_project(MatchResult.objects.all()),
+        )
+        .get()
+    )
+    tasks_count = counts["tasks"]
+    matches_count = counts["matches"]
 
-    tasks_count = BpmnTask.objects.filter(project=project).count()
-    matches_count = MatchResult.objects.filter(project=project).count()
-
-    runs = AnalysisRun.objects.filter(project=project).order_by("-created_at")[:10]
+    runs = getattr(project, "recent_runs", None)
+    if runs is None:
+        runs = AnalysisRun.objects.filter(project=project).order_by("-created_at")[:DETAIL_RUNS_LIMIT]
 
-    members = (
-        ProjectMembership.objects
-        .select_related("user")
-        .filter(project=project)
-        .order_by("user__username")
-    )
+    if "memberships" in getattr(project, "_prefetched_objects_cache", {}):
+        members = project.memberships.all()
+    else:
+        members = (
+            ProjectMembership.objects
+            .select_related("user")
+            .filter(project=project)
+            .order_by("user__username")
+        )
 
     if is_admin(user):
         my_role = "ADMIN"
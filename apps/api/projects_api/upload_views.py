@@ -2,23 +2,23 @@ from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_POST
 
 from apps.analysis.services.services import run_bpmn_upload_flow
-from apps.projects.models import Project
 from apps.projects.services import save_code_zip_and_extract
 from apps.projects.github_service import download_repo_archive
 from django.core.files import File
 
-from .permissions import can_open_project, is_project_evaluator
+from apps.common.http import read_json_body
+from apps.projects.permissions import can_open_project, get_project_for_user, is_project_evaluator
+
 from .serializers import json_file_payload
 
 
 @login_required
 @require_POST
 def api_upload_bpmn(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not is_project_evaluator(project, request.user):
         return JsonResponse({"detail": "Only evaluator can upload BPMN."}, status=403)
@@ -40,7 +40,7 @@ def api_upload_bpmn(request, project_id: int):
 @login_required
 @require_POST
 def api_upload_code_zip(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Only project members can upload code ZIP."}, status=403)
@@ -58,7 +58,7 @@ def api_upload_code_zip(request, project_id: int):
 @login_required
 @require_POST
 def api_fetch_github_code(request, project_id: int):
-    project = get_object_or_404(Project, id=project_id)
+    project = get_project_for_user(project_id, request.user)
 
     if not can_open_project(project, request.user):
         return JsonResponse({"detail": "Access denied."}, status=403)
@@ -66,11 +66,10 @@ def api_fetch_github_code(request, project_id: int):
     if not project.github_repo_url:
         return JsonResponse({"detail": "No GitHub repository linked."}, status=400)
 
-    import json
     # Handle both application/json and application/x-www-form-urlencoded
     if request.content_type == "application/json":
         try:
-            body = json.loads(request.body)
+            body = read_json_body(request)
             branch = (body.get("branch") or "main").strip()
         except Exception:
             branch = "main"
@@ -32,6 +32,7 @@ from apps.api.projects_api.upload_views import (
 )
 from apps.api.projects_api.analysis_views import (
     api_run_analysis,
+    api_analysis_run_status,
 )
 from apps.api.projects_api.data_views import (
     api_project_files,
@@ -69,6 +70,7 @@ urlpatterns = [
     path("projects/<int:project_id>/upload-code/", api_upload_code_zip, name="upload_code"),
     path("projects/<int:project_id>/fetch-github/", api_fetch_github_code, name="fetch_github"),
     path("projects/<int:project_id>/run-analysis/", api_run_analysis, name="run_analysis"),
+    path("projects/<int:project_id>/analysis-runs/<int:run_id>/", api_analysis_run_status, name="analysis_run_status"),
 
     # Data
     path("projects/<int:project_id>/files/", api_project_files, name="project_files"),
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from django.db.models import Count, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_per_project(qs: QuerySet, project_ref: str = "pk") -> Coalesce:
+    """
+    COUNT(*) of qs rows whose project_id equals the outer row's project_ref
+    field ("pk" when the outer rows are projects, "project_id" when they
+    belong to one), as a scalar subquery that is 0 when there are none.
+    """
+    counts = (
+        qs.filter(project_id=OuterRef(project_ref))
+        .order_by()
+        .values("project_id")
+        .annotate(c=Count("pk"))
+        .values("c")
+    )
+    return Coalesce(Subquery(counts), 0)
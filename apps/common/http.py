@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from itertools import islice
+from typing import Any, Iterable
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+
+try:  # optional: C-implemented JSON codec for large payloads
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib / Django encoder
+    orjson = None
+
+if orjson is not None:
+    # match json.dumps: int dict keys become strings; numpy values are allowed
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def fast_json_response(data: Any, status: int = 200) -> HttpResponse:
+    """
+    JSON response encoded with orjson when it is installed (UTF-8, no
+    ensure_ascii escaping); otherwise a regular JsonResponse.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:  # types only DjangoJSONEncoder knows (Decimal, lazy strings, ...)
+            pass
+        else:
+            return HttpResponse(body, status=status, content_type="application/json")
+    return JsonResponse(data, safe=False, status=status, json_dumps_params={"ensure_ascii": False})
+
+
+# Rows encoded per chunk written by stream_json_list_response.
+STREAM_ROWS_PER_CHUNK = 500
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:  # same fallback as fast_json_response
+            pass
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode("utf-8")
+
+
+def stream_json_list_response(fields: dict, list_key: str, rows: Iterable[Any]) -> StreamingHttpResponse:
+    """
+    Stream {**fields, list_key: [*rows]} as JSON. rows is consumed lazily
+    (e.g. a queryset .iterator()), so a long list is never held in memory
+    as a whole and the first bytes go out before the last row is read.
+    """
+    def chunks():
+        head = _dumps({**fields, list_key: []})
+        yield head[:-2]  # up to and including the list's opening "["
+        rows_iter = iter(rows)
+        sep = b""
+        while batch := list(islice(rows_iter, STREAM_ROWS_PER_CHUNK)):
+            yield sep + b",".join(_dumps(r) for r in batch)
+            sep = b","
+        yield b"]}"
+
+    return StreamingHttpResponse(chunks(), content_type="application/json")
+
+
+def read_json_body(request) -> Any:
+    """Parsed JSON request body ({} when empty); raises ValueError on bad JSON."""
+    if not request.body:
+        return {}
+    if orjson is not None:
+        return orjson.loads(request.body)
+    return json.loads(request.body.decode("utf-8"))
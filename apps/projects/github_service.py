@@ -8,6 +8,7 @@ public archive endpoint — no API tokens or git installation required.
 from __future__ import annotations
 
 import re
+import shutil
 import tempfile
 import urllib.request
 import urllib.error
@@ -16,6 +17,9 @@ from typing import Tuple
 
 from django.conf import settings
 
+# Bytes per read/write when streaming a repo archive to disk.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 # ============================================================
 # URL validation
@@ -98,8 +102,9 @@ def download_repo_archive(
     try:
         # Download with a generous timeout
         req = urllib.request.Request(archive_url, headers={"User-Agent": "COVADEV/1.0"})
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            dest_file.write_bytes(resp.read())
+        # Stream to disk in chunks; large archives never sit in memory whole
+        with urllib.request.urlopen(req, timeout=120) as resp, open(dest_file, "wb") as out:
+            shutil.copyfileobj(resp, out, DOWNLOAD_CHUNK_SIZE)
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise RuntimeError(
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.analysis.models import AnalysisRun
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Fill Project.last_run_status / last_run_at from each project's latest AnalysisRun."
+
+    def handle(self, *args, **options):
+        latest_run = AnalysisRun.objects.filter(project=OuterRef("pk")).order_by("-created_at")
+
+        # one UPDATE for all projects; projects without runs are reset to empty
+        updated = Project.objects.update(
+            last_run_status=Coalesce(Subquery(latest_run.values("status")[:1]), Value("")),
+            last_run_at=Subquery(latest_run.values("created_at")[:1]),
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"Projects updated: {updated}"))
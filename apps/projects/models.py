@@ -56,6 +56,11 @@ class Project(models.Model):
         related_name="active_for_code_projects",
     )
 
+    # Latest AnalysisRun, denormalized for list/dashboard reads; kept in sync
+    # by the AnalysisRun post_save signal (apps/analysis/signals.py).
+    last_run_status = models.CharField(max_length=10, blank=True, default="")
+    last_run_at = models.DateTimeField(null=True, blank=True)
+
     def __str__(self):
         return self.name
 
@@ -131,6 +136,10 @@ class ProjectFile(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # newest upload of a type per project (latest_file, project detail)
+            models.Index(fields=["project", "file_type", "-created_at"], name="pf_proj_type_created_idx"),
+        ]
 
     def __str__(self):
         return f"Project={self.project_id} {self.file_type} {self.original_name}"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from django.contrib.auth.models import User
+from django.db.models import Exists, OuterRef
+from django.shortcuts import get_object_or_404
+
+from apps.accounts.rbac import is_admin, is_evaluator
+from apps.projects.models import Project, ProjectMembership
+
+
+def _membership_memo(user) -> dict:
+    memo = getattr(user, "_membership_by_project", None)
+    if memo is None:
+        memo = user._membership_by_project = {}
+    return memo
+
+
+def get_membership(project: Project, user) -> ProjectMembership | None:
+    """
+    The user's membership row for the project (or None), memoized on the
+    user instance (request.user lives for one request) by project id, so the
+    permission checks of a request share one lookup per project even when
+    they load the project separately. Memberships prefetched on the project
+    are used instead of a query.
+    """
+    memo = _membership_memo(user)
+    if project.pk not in memo:
+        prefetched = getattr(project, "_prefetched_objects_cache", {}).get("memberships")
+        if prefetched is not None:
+            memo[project.pk] = next((m for m in prefetched if m.user_id == user.pk), None)
+        else:
+            memo[project.pk] = ProjectMembership.objects.filter(project=project, user=user).first()
+    return memo[project.pk]
+
+
+def get_project_for_user(project_id: int, user, queryset=None) -> Project:
+    """
+    get_object_or_404 for a project that also resolves whether the user is
+    a member, in the same query (an EXISTS annotation). The permission
+    helpers below then answer from that flag instead of querying again.
+    """
+    queryset = Project.objects.all() if queryset is None else queryset
+    if is_admin(user):
+        # admins may open every project; membership never decides anything
+        return get_object_or_404(queryset, id=project_id)
+
+    project = get_object_or_404(
+        queryset.annotate(
+            user_is_member=Exists(ProjectMembership.objects.filter(project=OuterRef("pk"), user_id=user.pk))
+        ),
+        id=project_id,
+    )
+    known = getattr(user, "_is_member_of", None)
+    if known is None:
+        known = user._is_member_of = {}
+    known[project.pk] = project.user_is_member
+    if not project.user_is_member:
+        # nothing to fetch: get_membership can answer None right away
+        _membership_memo(user)[project.pk] = None
+    return project
+
+
+def is_member(project: Project, user) -> bool:
+    """Whether the user has a membership row for the project."""
+    known = getattr(user, "_is_member_of", {}).get(project.pk)
+    if known is not None:
+        return known
+    return get_membership(project, user) is not None
+
+
+def is_project_evaluator(project: Project, user: User) -> bool:
+    if is_admin(user):
+        return True
+
+    if getattr(project, "evaluator_id", None) == user.id:
+        return True
+
+    membership = get_membership(project, user)
+    return bool(membership and str(getattr(membership, "role", "")).upper() == "EVALUATOR")
+
+
+def is_project_developer(project: Project, user: User) -> bool:
+    if is_admin(user):
+        return True
+    return is_member(project, user)
+
+
+def can_open_project(project: Project, user: User) -> bool:
+    # Same rule as is_project_developer or is_project_evaluator, checked once
+    # and cheapest first: admin role, then the project's evaluator column,
+    # then membership (usually already known from get_project_for_user).
+    if is_admin(user):
+        return True
+    if getattr(project, "evaluator_id", None) == user.id:
+        return True
+    return is_member(project, user)
+
+
+def require_member(project: Project, user) -> bool:
+    if is_admin(user):
+        return True
+    return is_member(project, user)
+
+
+def require_admin_or_evaluator(project: Project, user) -> bool:
+    return is_project_evaluator(project, user)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # apps/projects/services.py
 from __future__ import annotations
 
+import hashlib
 import shutil
 import zipfile
 from pathlib import Path
@@ -9,9 +10,10 @@ from typing import Any, Dict, List, Optional
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.db import transaction
+from django.utils import timezone
 
 from apps.projects.models import Project, ProjectFile, CodeFile
-from apps.analysis.summary.code_summary_service import SummaryService
+from apps.analysis.summary.code_summary_service import get_summary_service
 from apps.analysis.models_code import CodeArtifact
 from apps.analysis.summary.code_summary_service import fallback_summary as _fallback_summary
 
@@ -85,6 +87,49 @@ def _safe_extract_zip(zip_file_path: Path, extract_to: Path):
         zf.extractall(extract_to)
 
 
+# Sidecar in the extracted folder recording which ZIP produced it.
+ZIP_HASH_SIDECAR = ".zip_hash"
+
+
+def _file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _extract_zip_if_changed(zip_file_path: Path, extract_to: Path) -> bool:
+    """
+    Extract zip_file_path into extract_to unless extract_to already holds the
+    same ZIP (matching sha256 sidecar). Returns True if files were extracted.
+    """
+    zip_hash = _file_sha256(zip_file_path)
+    sidecar = extract_to / ZIP_HASH_SIDECAR
+
+    try:
+        if sidecar.read_text(encoding="utf-8").strip() == zip_hash:
+            return False
+    except OSError:
+        pass
+
+    # Clear old extracted content
+    if extract_to.exists():
+        try:
+            shutil.rmtree(extract_to)
+        except Exception:
+            pass
+    extract_to.mkdir(parents=True, exist_ok=True)
+
+    _safe_extract_zip(zip_file_path, extract_to)
+    sidecar.write_text(zip_hash, encoding="utf-8")
+    return True
+
+
+# Rows per INSERT when indexing extracted files.
+CODE_FILE_BATCH_SIZE = 500
+
+
 def _index_code_files(project: Project, code_root_dir: Path, uploader):
     """
     Scan extracted directory and store file list in CodeFile table.
@@ -93,13 +138,12 @@ def _index_code_files(project: Project, code_root_dir: Path, uploader):
     - Replaces previous index for this project.
     - Ignores junk folders and system files.
     """
-    CodeFile.objects.filter(project=project).delete()
-
     code_root_dir = code_root_dir.resolve()
 
     ignore_dirs = {"__pycache__", ".git", "node_modules", "venv", ".idea", ".vscode"}
-    ignore_files = {".ds_store", "thumbs.db"}
+    ignore_files = {".ds_store", "thumbs.db", ZIP_HASH_SIDECAR}
 
+    rows: List[CodeFile] = []
     for p in code_root_dir.rglob("*"):
         if not p.is_file():
             continue
@@ -114,13 +158,18 @@ def _index_code_files(project: Project, code_root_dir: Path, uploader):
         ext = p.suffix.lower().lstrip(".")
         size = p.stat().st_size
 
-        CodeFile.objects.create(
+        rows.append(CodeFile(
             project=project,
             relative_path=rel,
             ext=ext,
             size_bytes=size,
             uploaded_by=uploader,
-        )
+        ))
+
+    # swap the whole index at once so a failure can't leave it half-written
+    with transaction.atomic():
+        CodeFile.objects.filter(project=project).delete()
+        CodeFile.objects.bulk_create(rows, batch_size=CODE_FILE_BATCH_SIZE)
 
 
 # ============================================================
@@ -129,16 +178,10 @@ def _index_code_files(project: Project, code_root_dir: Path, uploader):
 
 from apps.analysis.code.universal_extractor import UniversalExtractor
 
-def _persist_code_artifacts_with_summaries(
-    *,
-    project: Project,
-    code_root_dir: Path,
-) -> Dict[str, Any]:
+def _extract_and_summarize_code(code_root_dir: Path) -> Dict[str, Any]:
     """
-    Extract structured functions from the extracted code folder (multi-language),
-    generate LLM summaries, and save/update CodeArtifact rows.
-
-    Returns a summary dict with counts and any errors encountered.
+    Extract structured functions from the extracted code folder (multi-language)
+    and generate LLM summaries. No DB access, so it can run off the main thread.
     """
     structured_functions = UniversalExtractor.extract_from_directory(
         code_root_dir,
@@ -149,7 +192,7 @@ def _persist_code_artifacts_with_summaries(
     summary_errors: Dict[str, str] = {}
     global_error: str = ""
 
-    summarizer = SummaryService()
+    summarizer = get_summary_service()
     try:
         summaries_by_uid = summarizer.summarize_many(structured_functions)
     except Exception as e:
@@ -157,6 +200,37 @@ def _persist_code_artifacts_with_summaries(
         summary_errors["__GLOBAL__"] = global_error
         summaries_by_uid = {}
 
+    return {
+        "structured_functions": structured_functions,
+        "summaries_by_uid": summaries_by_uid,
+        "summary_errors": summary_errors,
+        "global_error": global_error,
+    }
+
+
+def _persist_code_artifacts_with_summaries(
+    *,
+    project: Project,
+    code_root_dir: Path,
+    prepared: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Extract structured functions from the extracted code folder (multi-language),
+    generate LLM summaries, and save/update CodeArtifact rows.
+
+    prepared: a result of _extract_and_summarize_code computed ahead of time
+    (e.g. concurrently by the analysis pipeline); skips that step here.
+
+    Returns a summary dict with counts and any errors encountered.
+    """
+    if prepared is None:
+        prepared = _extract_and_summarize_code(code_root_dir)
+
+    structured_functions = prepared["structured_functions"]
+    summaries_by_uid = prepared["summaries_by_uid"]
+    summary_errors = prepared["summary_errors"]
+    global_error = prepared["global_error"]
+
     saved = 0
     failed = 0
 
@@ -220,7 +294,8 @@ def save_code_zip_and_extract(project: Project, uploaded_zip, uploader):
 
     Behavior:
     - Stores the ZIP file under code folder (audit)
-    - Clears old extracted code folder content before extracting
+    - Clears old extracted code folder content before extracting, unless it
+      already holds this exact ZIP (sha256 sidecar), in which case it is reused
     - Updates project.active_code pointer
     """
     code_root = Path(settings.MEDIA_ROOT) / "projects" / str(project.id) / "code"
@@ -229,14 +304,6 @@ def save_code_zip_and_extract(project: Project, uploaded_zip, uploader):
     # Keep zip audit file in code_root, but extract into a clean subfolder
     extract_dir = code_root / "extracted"
 
-    # Clear old extracted content
-    if extract_dir.exists():
-        try:
-            shutil.rmtree(extract_dir)
-        except Exception:
-            pass
-    extract_dir.mkdir(parents=True, exist_ok=True)
-
     # Optionally clear old zip files in code_root (keep folder)
     # If you want to keep all past zips, remove this block.
     for child in code_root.iterdir():
@@ -253,9 +320,15 @@ def save_code_zip_and_extract(project: Project, uploaded_zip, uploader):
     # Absolute path for extraction
     zip_full_path = Path(settings.MEDIA_ROOT) / stored_zip_path
 
-    # Extract safely and index files
-    _safe_extract_zip(zip_full_path, extract_dir)
-    _index_code_files(project, extract_dir, uploader)
+    # Extract safely and index files. When the same ZIP is already extracted
+    # the existing index describes exactly these files, so only its uploader
+    # is refreshed (one UPDATE instead of a tree walk + re-insert).
+    extracted = _extract_zip_if_changed(zip_full_path, extract_dir)
+    reused = not extracted and CodeFile.objects.filter(project=project).update(
+        uploaded_by=uploader, indexed_at=timezone.now(),
+    )
+    if not reused:
+        _index_code_files(project, extract_dir, uploader)
 
     # Log upload
     pf = ProjectFile.objects.create(
@@ -216,4 +216,55 @@ class CodeZipUploadTests(TestCase):
         )
 
         # Nothing stored
-        self.assertFalse(ProjectFile.objects.filter(project=self.project, file_type="CODE").exists())
\ No newline at end of file
+        self.assertFalse(ProjectFile.objects.filter(project=self.project, file_type="CODE").exists())
+
+class ZipExtractCacheTests(TestCase):
+
+    def _write_zip(self, path, files):
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, content in files.items():
+                zf.writestr(name, content)
+
+    def test_same_zip_is_not_extracted_twice(self):
+        from pathlib import Path
+        import tempfile
+        from apps.projects.services import _extract_zip_if_changed
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            zip_path = tmp / "code.zip"
+            extract_dir = tmp / "extracted"
+            self._write_zip(zip_path, {"main.py": "x = 1\n"})
+
+            self.assertTrue(_extract_zip_if_changed(zip_path, extract_dir))
+            self.assertFalse(_extract_zip_if_changed(zip_path, extract_dir))
+            self.assertEqual((extract_dir / "main.py").read_text(), "x = 1\n")
+
+            # a different ZIP replaces the old extracted tree
+            self._write_zip(zip_path, {"other.py": "y = 2\n"})
+            self.assertTrue(_extract_zip_if_changed(zip_path, extract_dir))
+            self.assertFalse((extract_dir / "main.py").exists())
+            self.assertTrue((extract_dir / "other.py").exists())
+
+    def test_reuploading_same_zip_keeps_the_index(self):
+        import tempfile
+        from django.test import override_settings
+        from apps.projects.services import save_code_zip_and_extract
+
+        admin = make_user("admin_user", role="ADMIN")
+        evaluator = make_user("eval_user", role="EVALUATOR")
+        project = make_project(admin, evaluator)
+
+        with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media):
+            save_code_zip_and_extract(project, make_valid_zip(), admin)
+            first_ids = set(CodeFile.objects.filter(project=project).values_list("id", flat=True))
+            self.assertEqual(
+                set(CodeFile.objects.filter(project=project).values_list("relative_path", flat=True)),
+                {"main.py", "utils.py"},
+            )
+
+            save_code_zip_and_extract(project, make_valid_zip(), evaluator)
+
+        files = CodeFile.objects.filter(project=project)
+        self.assertEqual(set(files.values_list("id", flat=True)), first_ids)
+        self.assertEqual(set(files.values_list("uploaded_by", flat=True)), {evaluator.id})
@@ -0,0 +1,116 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.analysis.models import BpmnTask, MatchResult
+from apps.analysis.models_code import CodeArtifact
+from apps.projects.models import Project, ProjectMembership
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class CompareInputsApiTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.dev = make_user("dev1")
+        self.outsider = make_user("dev2")
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectMembership.objects.create(project=self.project, user=self.dev)
+
+        task = BpmnTask.objects.create(
+            project=self.project, task_id="T1", name="Pay order", summary_text="Charge the cart.",
+        )
+        CodeArtifact.objects.create(
+            project=self.project, code_uid="a.py::pay", symbol="pay", file_path="a.py",
+            summary_text="Charges the card.",
+        )
+        MatchResult.objects.create(
+            project=self.project, task=task, code_ref="a.py::pay", status="MATCHED",
+            is_ai_generated=True, matched_summary="Charges the order total.",
+        )
+        MatchResult.objects.create(
+            project=self.project, task=task, code_ref="Developer submission #1", status="MATCHED",
+            matched_summary="Café checkout charges the order.",
+        )
+        # pipeline rows are not listed
+        MatchResult.objects.create(
+            project=self.project, task=task, code_ref="a.py::pay", status="MATCHED",
+            matched_summary="Pipeline match.",
+        )
+        self.url = reverse("api:compare_inputs", args=[self.project.id])
+
+    def test_returns_tasks_and_code_functions(self):
+        self.client.login(username="dev1", password="pass1234")
+        resp = self.client.get(self.url)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "application/json")
+        data = resp.json()
+        self.assertEqual(data["projectId"], self.project.id)
+        self.assertEqual([t["taskId"] for t in data["bpmnTasks"]], ["T1"])
+        self.assertEqual(
+            [f["source"] for f in data["codeFunctions"]],
+            ["evaluator", "ai", "developer"],
+        )
+        self.assertEqual(data["codeFunctions"][2]["summaryText"], "Café checkout charges the order.")
+        self.assertEqual(data["codeFunctions"][1]["symbol"], "Pay order")
+
+    def test_forbidden_for_non_member(self):
+        self.client.login(username="dev2", password="pass1234")
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 403)
+
+    def test_unchanged_inputs_return_304(self):
+        self.client.login(username="dev1", password="pass1234")
+        first = self.client.get(self.url)
+        tag = first["ETag"]
+        self.assertIn("private", first["Cache-Control"])
+
+        again = self.client.get(self.url, HTTP_IF_NONE_MATCH=tag)
+        self.assertEqual(again.status_code, 304)
+
+        CodeArtifact.objects.create(project=self.project, code_uid="b.py::ship", symbol="ship")
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=tag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], tag)
+
+    def test_summaries_edited_in_place_change_the_etag(self):
+        self.client.login(username="dev1", password="pass1234")
+        tag = self.client.get(self.url)["ETag"]
+
+        BpmnTask.objects.filter(project=self.project).update(summary_text="Charge the cart twice.")
+        after_task = self.client.get(self.url, HTTP_IF_NONE_MATCH=tag)
+        self.assertEqual(after_task.status_code, 200)
+        self.assertEqual(after_task.json()["bpmnTasks"][0]["summaryText"], "Charge the cart twice.")
+
+        MatchResult.objects.filter(is_ai_generated=True).update(matched_summary="Refunds the order.")
+        after_match = self.client.get(self.url, HTTP_IF_NONE_MATCH=after_task["ETag"])
+        self.assertEqual(after_match.status_code, 200)
+
+    def test_gzipped_when_client_accepts_it(self):
+        for i in range(20):
+            CodeArtifact.objects.create(project=self.project, code_uid=f"c.py::fn{i}", symbol=f"fn{i}")
+        self.client.login(username="dev1", password="pass1234")
+
+        resp = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        again = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=resp["ETag"])
+        self.assertEqual(again.status_code, 304)
@@ -0,0 +1,381 @@
+import json
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.projects.models import Project
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class ThresholdSettingTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        self.url = reverse("api:update_threshold", kwargs={"project_id": self.project.id})
+        self.client.force_login(self.evaluator)
+
+    def test_updates_threshold_from_json_body(self):
+        response = self.client.post(
+            self.url, data=json.dumps({"similarityThreshold": 0.55}), content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.project.refresh_from_db()
+        self.assertAlmostEqual(self.project.similarity_threshold, 0.55)
+
+    def test_invalid_json_is_rejected(self):
+        response = self.client.post(self.url, data="{oops", content_type="application/json")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class ProjectListTests(TestCase):
+    def setUp(self):
+        from apps.projects.models import ProjectMembership
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.dev = make_user("dev1")
+        for i in range(3):
+            project = make_project(self.admin, self.evaluator, name=f"P{i}")
+            ProjectMembership.objects.create(project=project, user=self.dev)
+        self.url = reverse("api:projects_list_create")
+
+    def test_developer_list_has_no_per_project_queries(self):
+        self.client.force_login(self.dev)
+
+        with self.assertNumQueries(3):  # session, user + profile, projects
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()), 3)
+        self.assertTrue(all(p["membership"] == {"role": "DEVELOPER"} for p in response.json()))
+
+    def test_create_adds_listed_developers_only(self):
+        from apps.projects.models import Project, ProjectMembership
+
+        other_dev = make_user("dev2")
+        self.client.force_login(self.admin)
+        response = self.client.post(self.url, {
+            "name": "New",
+            "evaluatorEmail": "eval1@test.com",
+            "developerEmails": "dev1@test.com, DEV2, eval1@test.com, admin1@test.com, nobody@test.com, dev1",
+        })
+
+        self.assertEqual(response.status_code, 201)
+        project = Project.objects.get(name="New")
+        members = set(
+            ProjectMembership.objects.filter(project=project, is_ai_agent=False).values_list("user_id", flat=True)
+        )
+        self.assertEqual(members, {self.dev.id, other_dev.id})
+
+    def test_developer_list_is_bound_per_user(self):
+        self.client.force_login(self.dev)
+        names = [p["name"] for p in self.client.get(self.url).json()]
+        self.assertEqual(names, ["P2", "P1", "P0"])
+
+        self.client.force_login(make_user("dev2"))
+        self.assertEqual(self.client.get(self.url).json(), [])
+
+    def test_short_list_leaves_out_descriptions(self):
+        self.client.force_login(self.dev)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {"fields": "short"})
+
+        self.assertEqual({p["description"] for p in response.json()}, {""})
+        self.assertEqual({p["description"] for p in self.client.get(self.url).json()}, {"A test project"})
+
+    def test_evaluator_list_reports_evaluator_role(self):
+        self.client.force_login(self.evaluator)
+        response = self.client.get(self.url)
+
+        self.assertEqual({p["membership"]["role"] for p in response.json()}, {"EVALUATOR"})
+
+
+class ProjectDetailTests(TestCase):
+    def setUp(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.analysis.models import BpmnTask
+        from apps.projects.models import ProjectFile
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+
+        now = timezone.now()
+        for i, name in enumerate(["old.bpmn", "new.bpmn"]):
+            f = ProjectFile.objects.create(
+                project=self.project, file_type="BPMN", original_name=name,
+                stored_path=name, uploaded_by=self.evaluator,
+            )
+            ProjectFile.objects.filter(pk=f.pk).update(created_at=now + timedelta(minutes=i))
+        ProjectFile.objects.create(
+            project=self.project, file_type="CODE", original_name="code.zip",
+            stored_path="code.zip", uploaded_by=self.evaluator,
+        )
+        BpmnTask.objects.create(project=self.project, task_id="T1", name="Pay")
+        self.url = reverse("api:project_detail_or_delete", kwargs={"project_id": self.project.id})
+
+    def test_detail_returns_latest_files_and_counts(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["activeUploads"]["latestBpmn"]["originalName"], "new.bpmn")
+        self.assertEqual(data["activeUploads"]["latestCode"]["originalName"], "code.zip")
+        self.assertEqual(data["counts"], {"codeFiles": 0, "tasks": 1, "matches": 0})
+
+    def test_member_access_check_uses_prefetched_members(self):
+        from apps.analysis.models import AnalysisRun
+        from apps.projects.models import ProjectMembership
+
+        dev = make_user("dev1")
+        ProjectMembership.objects.create(project=self.project, user=dev)
+        for status in ["DONE", "FAILED"]:
+            AnalysisRun.objects.create(project=self.project, status=status)
+        self.client.force_login(dev)
+
+        # session, user, project, runs, members, latest files, code files, counts
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["membership"], {"role": "DEVELOPER"})
+        self.assertEqual([r["status"] for r in data["runs"]], ["FAILED", "DONE"])
+        self.assertIn("dev1", [m["username"] for m in data["members"]])
+
+    def test_outsider_is_forbidden(self):
+        self.client.force_login(make_user("dev2"))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class ProjectMembersTests(TestCase):
+    def setUp(self):
+        from apps.projects.models import ProjectMembership
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.dev = make_user("dev1")
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectMembership.objects.create(project=self.project, user=self.dev)
+        self.url = reverse("api:project_members", kwargs={"project_id": self.project.id})
+
+    def test_member_check_is_answered_by_the_project_query(self):
+        self.client.force_login(self.dev)
+
+        # session, user + profile, project + evaluator + membership flag, members
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["evaluator"]["username"], "eval1")
+        self.assertIn("dev1", [m["username"] for m in response.json()["members"]])
+
+    def test_admin_adds_member_by_email(self):
+        from apps.projects.models import ProjectMembership
+
+        dev2 = User.objects.create_user(username="dev2", email="dev2@test.com", password="pass1234")
+        self.client.force_login(self.admin)
+
+        response = self.client.post(self.url, {"email": "DEV2@test.com"})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(ProjectMembership.objects.filter(project=self.project, user=dev2).exists())
+
+    def test_username_match_wins_over_email_match(self):
+        from apps.accounts.lookups import find_user_by_login
+
+        by_email = User.objects.create_user(username="someone", email="shared@test.com")
+        by_username = User.objects.create_user(username="shared@test.com", email="other@test.com")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(find_user_by_login("shared@test.com"), by_username)
+        self.assertEqual(find_user_by_login("someone"), by_email)
+        self.assertIsNone(find_user_by_login("nobody@test.com"))
+
+    def test_membership_is_looked_up_once_per_user_and_project(self):
+        from apps.projects.permissions import can_open_project, get_membership
+
+        with self.assertNumQueries(1):
+            self.assertTrue(can_open_project(self.project, self.dev))
+            self.assertIsNotNone(get_membership(Project(pk=self.project.pk), self.dev))
+
+    def test_outsider_is_forbidden(self):
+        self.client.force_login(make_user("dev2"))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class ProjectLogsTests(TestCase):
+    def setUp(self):
+        from apps.projects.models import ProjectFile
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        ProjectFile.objects.create(
+            project=self.project, file_type="BPMN", original_name="p.bpmn",
+            stored_path="p.bpmn", uploaded_by=self.evaluator,
+        )
+        ProjectFile.objects.create(
+            project=self.project, file_type="CODE", original_name="code.zip", stored_path="code.zip",
+        )
+        self.url = reverse("api:project_logs", kwargs={"project_id": self.project.id})
+
+    def test_logs_list_uploads_with_uploader(self):
+        self.client.force_login(self.evaluator)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        uploaders = {log["originalName"]: log["uploadedBy"] for log in response.json()["logs"]}
+        self.assertEqual(uploaders, {"p.bpmn": "eval1", "code.zip": None})
+
+
+class ProjectMatchesTests(TestCase):
+    def setUp(self):
+        from apps.analysis.models import BpmnTask, MatchResult
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        task = BpmnTask.objects.create(project=self.project, task_id="T1", name="Pay")
+        MatchResult.objects.create(project=self.project, task=task, code_ref="a.py::pay", similarity_score=0.9)
+        MatchResult.objects.create(project=self.project, code_ref="b.py::ship", similarity_score=0.0, status="EXTRA")
+        self.url = reverse("api:project_matches", kwargs={"project_id": self.project.id})
+
+    def test_matches_are_streamed_as_one_json_document(self):
+        self.client.force_login(self.evaluator)
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(data["project_id"], self.project.id)
+        by_ref = {m["code_ref"]: m for m in data["matches"]}
+        self.assertEqual(by_ref["a.py::pay"]["task"], {"task_id": "T1", "name": "Pay"})
+        self.assertIsNone(by_ref["b.py::ship"]["task"])
+
+    def test_empty_match_list_is_valid_json(self):
+        from apps.analysis.models import MatchResult
+
+        MatchResult.objects.all().delete()
+        self.client.force_login(self.evaluator)
+        response = self.client.get(self.url)
+
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), {"project_id": self.project.id, "matches": []})
+
+
+class ProjectFilesAndTasksTests(TestCase):
+    def setUp(self):
+        from apps.analysis.models import BpmnTask
+        from apps.projects.models import CodeFile
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        CodeFile.objects.create(project=self.project, relative_path="b.py", ext=".py", size_bytes=20)
+        CodeFile.objects.create(project=self.project, relative_path="a.py", ext=".py", size_bytes=10)
+        BpmnTask.objects.create(project=self.project, task_id="T1", name="Pay", description="Charge the card")
+        self.client.force_login(self.evaluator)
+
+    def test_files_are_streamed_in_path_order(self):
+        url = reverse("api:project_files", kwargs={"project_id": self.project.id})
+        response = self.client.get(url)
+
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            data["files"],
+            [
+                {"relative_path": "a.py", "ext": ".py", "size_bytes": 10},
+                {"relative_path": "b.py", "ext": ".py", "size_bytes": 20},
+            ],
+        )
+
+    def test_member_access_costs_no_extra_query(self):
+        from apps.projects.models import ProjectMembership
+
+        dev = make_user("dev1")
+        ProjectMembership.objects.create(project=self.project, user=dev)
+        self.client.force_login(dev)
+        url = reverse("api:project_tasks", kwargs={"project_id": self.project.id})
+
+        # session, user + profile, project + membership flag, tasks
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        self.client.force_login(make_user("dev2"))
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_admin_access_skips_the_membership_lookup(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_login(self.admin)
+        url = reverse("api:project_tasks", kwargs={"project_id": self.project.id})
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 4)  # session, user, project, tasks
+        self.assertFalse(any("projects_projectmembership" in q["sql"] for q in ctx.captured_queries))
+
+    def test_tasks_short_fields(self):
+        url = reverse("api:project_tasks", kwargs={"project_id": self.project.id})
+
+        full = self.client.get(url).json()["tasks"]
+        short = self.client.get(url, {"fields": "short"}).json()["tasks"]
+
+        self.assertEqual(full, [{"task_id": "T1", "name": "Pay", "description": "Charge the card"}])
+        self.assertEqual(short, [{"task_id": "T1", "name": "Pay"}])
+
+
+class RunAnalysisApiTests(TestCase):
+    def setUp(self):
+        from apps.projects.models import ProjectFile
+
+        self.client = Client()
+        self.admin = make_user("admin1", role="ADMIN")
+        self.evaluator = make_user("eval1", role="EVALUATOR")
+        self.project = make_project(self.admin, self.evaluator)
+        self.project.active_bpmn = ProjectFile.objects.create(
+            project=self.project, file_type="BPMN", original_name="p.bpmn", stored_path="p.bpmn",
+        )
+        self.project.save(update_fields=["active_bpmn"])
+        self.url = reverse("api:run_analysis", kwargs={"project_id": self.project.id})
+
+    def test_missing_code_is_reported_without_lazy_loads(self):
+        self.client.force_login(self.admin)
+
+        # session, user + profile, project + active uploads
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Upload Code ZIP first.")
@@ -5,19 +5,25 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django.views.decorators.http import require_http_methods, require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import conditional_page, require_http_methods, require_POST
 # ADD
 from apps.analysis.services.upload_flow_service import run_bpmn_upload_flow
 from apps.accounts.rbac import is_admin, is_evaluator
 from apps.analysis.bpmn.pipeline import run_bpmn_predev
 from apps.analysis.models import AnalysisRun, BpmnTask, MatchResult
 from apps.analysis.models_code import CodeArtifact
-from apps.analysis.services.services import run_analysis_for_project
+from apps.analysis.services.services import start_analysis_for_project
 from .models import Project, ProjectMembership, CodeFile, ProjectFile
 from .services import save_bpmn_file, save_code_zip_and_extract
 from .github_service import validate_github_url, download_repo_archive
+from .permissions import get_membership
+from apps.accounts.lookups import find_user_by_login
+from apps.common.http import fast_json_response
 
 # ============================================================
 # Permission helpers (Option 1)
@@ -36,11 +42,17 @@ def _is_project_developer(project, user):
     if is_admin(user):
         return True
     # Developer = has membership row in that project
-    return ProjectMembership.objects.filter(project=project, user=user).exists()
+    return get_membership(project, user) is not None
 
 
 def _can_open_project(project, user):
-    return _is_project_evaluator(project, user) or _is_project_developer(project, user)
+    # _is_project_evaluator or _is_project_developer, with the admin check
+    # done once and the membership lookup only when the rest fails
+    if is_admin(user):
+        return True
+    if is_evaluator(user) and getattr(project, "evaluator_id", None) == user.id:
+        return True
+    return get_membership(project, user) is not None
 
 
 # ============================================================
@@ -54,7 +66,10 @@ def projects_list(request):
     elif is_evaluator(request.user):
         projects = Project.objects.filter(evaluator=request.user).order_by("-created_at")
     else:
-        projects = Project.objects.filter(memberships__user=request.user).distinct().order_by("-created_at")
+        # semi-join on membership ids: no DISTINCT over the joined project rows
+        projects = Project.objects.filter(
+            id__in=ProjectMembership.objects.filter(user=request.user).values("project_id")
+        ).order_by("-created_at")
 
     return render(request, "projects/project_list.html", {"projects": projects})
 
@@ -356,8 +371,10 @@ def run_analysis(request, project_id):
             messages.error(request, e)
         return redirect("projects:detail", project_id=project.id)
 
+    # Runs on a background thread; the new PENDING run shows up in the
+    # project's run list and flips to DONE/FAILED when the pipeline finishes.
     try:
-        run_analysis_for_project(project)
+        start_analysis_for_project(project)
         messages.success(request, "Analysis started.")
     except Exception as e:
         messages.error(request, f"Analysis failed: {e}")
@@ -464,7 +481,7 @@ def project_members(request, project_id):
             messages.error(request, "Enter a user email.")
             return redirect("projects:members", project_id=project.id)
 
-        user = User.objects.filter(username=email).first() or User.objects.filter(email=email).first()
+        user = find_user_by_login(email)
         if user:
             if user.id == project.evaluator_id:
                 messages.error(request, "This user is the evaluator already.")
@@ -500,7 +517,12 @@ def remove_member(request, project_id, membership_id):
     return redirect("projects:members", project_id=project.id)
 
 
+# ETag from the encoded payload (what ConditionalGetMiddleware does), so a
+# 304 needs no second set of queries. Set before gzip_page weakens it.
 @login_required
+@gzip_page
+@cache_control(private=True, no_cache=True)
+@conditional_page
 def compare_inputs_api(request, project_id: int):
     print("COMPARE API 3")
     project = get_object_or_404(Project, id=project_id)
@@ -510,62 +532,58 @@ def compare_inputs_api(request, project_id: int):
 
     bpmn_tasks = [
         {
-            "taskId": t.task_id,
-            "name": t.name,
-            "summaryText": t.summary_text,
+            "taskId": t["task_id"],
+            "name": t["name"],
+            "summaryText": t["summary_text"],
         }
-        for t in BpmnTask.objects.filter(project=project)
+        for t in (
+            BpmnTask.objects
+            .filter(project=project)
+            .values("task_id", "name", "summary_text")
+            .iterator(chunk_size=500)
+        )
     ]
 
     code_functions = [
         {
-            "codeUid": c.code_uid,
-            "symbol": c.symbol,
-            "file": c.file_path,
-            "summaryText": c.summary_text,
+            "codeUid": c["code_uid"],
+            "symbol": c["symbol"],
+            "file": c["file_path"],
+            "summaryText": c["summary_text"],
             "source": "evaluator",
         }
-        for c in CodeArtifact.objects.filter(project=project)
+        for c in (
+            CodeArtifact.objects
+            .filter(project=project)
+            .values("code_uid", "symbol", "file_path", "summary_text")
+            .iterator(chunk_size=500)
+        )
     ]
 
-    # Also include AI-generated match results so their summaries appear alongside
-    # the evaluator's code functions.
+    # AI-generated and developer-submission match results, in one query so
+    # their summaries appear alongside the evaluator's code functions.
+    # AI rows come first, each group in the model's default ordering.
     for m in (
         MatchResult.objects
-        .filter(project=project, is_ai_generated=True)
-        .select_related("task")
+        .filter(project=project)
+        .filter(Q(is_ai_generated=True) | Q(code_ref__startswith="Developer submission"))
+        .exclude(matched_summary="")
+        .order_by("-is_ai_generated", *MatchResult._meta.ordering)
+        .values("id", "code_ref", "matched_summary", "is_ai_generated", "task__name")
+        .iterator(chunk_size=500)
     ):
-        if not (m.matched_summary or "").strip():
-            continue
-        task_name = m.task.name if m.task else ""
-        code_functions.append({
-            "codeUid": f"ai-match-{m.id}",
-            "symbol": task_name,
-            "file": m.code_ref,
-            "summaryText": m.matched_summary,
-            "source": "ai",
-        })
-
-    # Include developer submission match results
-    for m in (
-        MatchResult.objects
-        .filter(project=project, is_ai_generated=False)
-        .select_related("task")
-    ):
-        if not m.code_ref.startswith("Developer submission"):
-            continue
-        if not (m.matched_summary or "").strip():
+        if not m["matched_summary"].strip():
             continue
-        task_name = m.task.name if m.task else ""
+        prefix, source = ("ai-match", "ai") if m["is_ai_generated"] else ("dev-match", "developer")
         code_functions.append({
-            "codeUid": f"dev-match-{m.id}",
-            "symbol": task_name,
-            "file": m.code_ref,
-            "summaryText": m.matched_summary,
-            "source": "developer",
+            "codeUid": f"{prefix}-{m['id']}",
+            "symbol": m["task__name"] or "",
+            "file": m["code_ref"],
+            "summaryText": m["matched_summary"],
+            "source": source,
         })
 
-    return JsonResponse({
+    return fast_json_response({
         "projectId": project.id,
         "bpmnTasks": bpmn_tasks,
         "codeFunctions": code_functions,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import io
 import zipfile
-import json
 from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth.decorators import login_required
@@ -33,11 +32,12 @@ from apps.task_management.services.assignment_service import (
 )
 from apps.task_management.services.evaluation_service import evaluate_assignment, auto_evaluate_assignment
 from apps.accounts.rbac import is_admin, is_evaluator
+from apps.common.http import read_json_body
 
 
 def _parse_json_body(request):
     try:
-        return json.loads(request.body.decode("utf-8") or "{}")
+        return read_json_body(request)
     except Exception:
         return {}
 
@@ -673,16 +673,19 @@ def developer_performance_overview_api(request):
     if is_admin(user):
         memberships = (
             ProjectMembership.objects
-            .select_related("user", "project")
+            .select_related("user")
             .filter(role="DEVELOPER")
         )
     else:
         memberships = (
             ProjectMembership.objects
-            .select_related("user", "project")
+            .select_related("user")
             .filter(role="DEVELOPER", project__evaluator_id=user.id)
         )
-    membership_ids = list(memberships.values_list("id", flat=True))
+    # The loop below needs the rows anyway; fetch them once and take the ids
+    # from memory instead of a second values_list query.
+    memberships = list(memberships)
+    membership_ids = [m.id for m in memberships]
 
     assignment_counts = (
         TaskAssignment.objects
@@ -774,13 +777,13 @@ def developer_performance_overview_api(request):
 def my_performance_insights_api(request):
     user = request.user
 
-    memberships = (
+    memberships = list(
         ProjectMembership.objects
         .select_related("project")
         .filter(user=user, role="DEVELOPER")
     )
 
-    membership_ids = list(memberships.values_list("id", flat=True))
+    membership_ids = [m.id for m in memberships]
 
     assignments = (
         TaskAssignment.objects
@@ -795,37 +798,56 @@ def my_performance_insights_api(request):
         .order_by("-assigned_at")
     )
 
-    total_assigned = assignments.count()
-    accepted_count = assignments.filter(status=TaskAssignment.Status.ACCEPTED).count()
-    rejected_count = assignments.filter(status=TaskAssignment.Status.REJECTED).count()
-    submitted_count = assignments.filter(status=TaskAssignment.Status.SUBMITTED).count()
-    in_progress_count = assignments.filter(status=TaskAssignment.Status.IN_PROGRESS).count()
+    # All summary counters and the average score in one conditional aggregate.
+    summary_counts = (
+        TaskAssignment.objects
+        .filter(developer_membership_id__in=membership_ids)
+        .aggregate(
+            total=Count("id"),
+            accepted=Count("id", filter=Q(status=TaskAssignment.Status.ACCEPTED)),
+            rejected=Count("id", filter=Q(status=TaskAssignment.Status.REJECTED)),
+            submitted=Count("id", filter=Q(status=TaskAssignment.Status.SUBMITTED)),
+            in_progress=Count("id", filter=Q(status=TaskAssignment.Status.IN_PROGRESS)),
+            avg_score=Avg("evaluation__final_score"),
+        )
+    )
 
-    evaluations = TaskEvaluation.objects.filter(assignment__in=assignments)
-    avg_final_score = evaluations.aggregate(avg=Avg("final_score"))["avg"] or 0
+    total_assigned = summary_counts["total"]
+    accepted_count = summary_counts["accepted"]
+    rejected_count = summary_counts["rejected"]
+    submitted_count = summary_counts["submitted"]
+    in_progress_count = summary_counts["in_progress"]
+    avg_final_score = summary_counts["avg_score"] or 0
     acceptance_rate = (accepted_count / total_assigned * 100) if total_assigned else 0
 
+    # Per-project counts for all memberships in one grouped query,
+    # instead of six queries per project.
+    project_counts = (
+        TaskAssignment.objects
+        .filter(developer_membership_id__in=membership_ids)
+        .values("developer_membership_id")
+        .annotate(
+            total=Count("id"),
+            accepted=Count("id", filter=Q(status=TaskAssignment.Status.ACCEPTED)),
+            rejected=Count("id", filter=Q(status=TaskAssignment.Status.REJECTED)),
+            submitted=Count("id", filter=Q(status=TaskAssignment.Status.SUBMITTED)),
+            in_progress=Count("id", filter=Q(status=TaskAssignment.Status.IN_PROGRESS)),
+            avg_score=Avg("evaluation__final_score"),
+        )
+    )
+    project_counts_by_membership = {r["developer_membership_id"]: r for r in project_counts}
+
     project_items = []
     for membership in memberships:
         project = membership.project
-        project_assignments = assignments.filter(developer_membership=membership)
-
-        project_total = project_assignments.count()
-        project_accepted = project_assignments.filter(
-            status=TaskAssignment.Status.ACCEPTED
-        ).count()
-        project_rejected = project_assignments.filter(
-            status=TaskAssignment.Status.REJECTED
-        ).count()
-        project_submitted = project_assignments.filter(
-            status=TaskAssignment.Status.SUBMITTED
-        ).count()
-        project_in_progress = project_assignments.filter(
-            status=TaskAssignment.Status.IN_PROGRESS
-        ).count()
-
-        project_evaluations = TaskEvaluation.objects.filter(assignment__in=project_assignments)
-        project_avg_score = project_evaluations.aggregate(avg=Avg("final_score"))["avg"] or 0
+        counts = project_counts_by_membership.get(membership.id, {})
+
+        project_total = counts.get("total", 0)
+        project_accepted = counts.get("accepted", 0)
+        project_rejected = counts.get("rejected", 0)
+        project_submitted = counts.get("submitted", 0)
+        project_in_progress = counts.get("in_progress", 0)
+        project_avg_score = counts.get("avg_score") or 0
         project_acceptance_rate = (
             (project_accepted / project_total) * 100 if project_total else 0
         )
@@ -866,13 +888,13 @@ def my_performance_insights_api(request):
             "evaluation": _serialize_evaluation(getattr(assignment, "evaluation", None)),
         })
 
-    all_dev_memberships = (
+    all_dev_memberships = list(
         ProjectMembership.objects
         .select_related("user")
         .filter(role="DEVELOPER")
     )
 
-    all_membership_ids = list(all_dev_memberships.values_list("id", flat=True))
+    all_membership_ids = [m.id for m in all_dev_memberships]
 
     ranking_counts = (
         TaskAssignment.objects
@@ -962,7 +984,7 @@ def my_performance_insights_api(request):
             "userId": user.id,
             "username": user.username,
             "email": user.email,
-            "projectsCount": memberships.count(),
+            "projectsCount": len(memberships),
             "totalAssigned": total_assigned,
             "acceptedCount": accepted_count,
             "rejectedCount": rejected_count,
@@ -1235,70 +1257,3 @@ def project_ai_runs_api(request, project_id: int):
         "items": items,
     })
 
-
-import io
-import zipfile
-
-
-@login_required
-@require_GET
-def ai_submission_zip_api(request, assignment_id: int):
-    """
-    Returns the latest AI submission for an assignment as a zip file
-    containing each generated Python file plus a README.txt with metadata.
-    """
-    assignment = get_object_or_404(
-        TaskAssignment.objects.select_related(
-            "bpmn_task",
-            "developer_membership__user",
-            "project",
-        ),
-        id=assignment_id,
-    )
-
-    if not can_view_assignment(assignment, request.user):
-        return JsonResponse({"detail": "Forbidden"}, status=403)
-
-    submission = (
-        assignment.ai_submissions
-        .prefetch_related("files")
-        .order_by("-attempt_number")
-        .first()
-    )
-    if submission is None:
-        return JsonResponse(
-            {"detail": "No AI submission exists for this assignment."},
-            status=404,
-        )
-
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        readme_lines = [
-            "AI Submission Bundle",
-            "=====================",
-            "",
-            f"Task:        {assignment.bpmn_task.name}",
-            f"Task ID:     {assignment.bpmn_task.task_id}",
-            f"Assignment:  #{assignment.id}",
-            f"Attempt:     #{submission.attempt_number}",
-            f"Model:       {submission.model_used or '(unknown)'}",
-            f"Tokens used: {submission.tokens_used}",
-            f"Created at:  {submission.created_at.isoformat() if submission.created_at else '(unknown)'}",
-            f"Status:      {assignment.status}",
-            "",
-            "--- Explanation ---",
-            f"{submission.explanation or '(no explanation)'}",
-            "",
-        ]
-        zf.writestr("README.txt", "\n".join(readme_lines))
-
-        for f in submission.files.all():
-            safe_name = (f.filename or "ai_output.py").replace("/", "_").replace("\\", "_")
-            zf.writestr(safe_name, f.content or "")
-
-    buffer.seek(0)
-
-    filename = f"ai_submission_{assignment.id}_attempt_{submission.attempt_number}.zip"
-    response = HttpResponse(buffer.read(), content_type="application/zip")
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
\ No newline at end of file
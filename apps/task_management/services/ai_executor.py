@@ -273,9 +273,9 @@ def _get_full_file_contents(
     Return list of (filepath, content) for the most task-relevant files
     plus all models.py files. Reads actual content from disk.
     """
-    import numpy as np
     from pathlib import Path
     from apps.analysis.models import CodeEmbedding, TaskEmbedding
+    from apps.analysis.semantic.similarity import cosine_to_query
     from apps.task_management.services.ai_match_service import _get_embedder
 
     active_code = getattr(project, "active_code", None)
@@ -305,25 +305,20 @@ def _get_full_file_contents(
                 task_vector = None
 
         if task_vector is not None:
-            tv = np.asarray(task_vector, dtype=float)
-            tv_norm = float(np.linalg.norm(tv)) or 1e-9
-
-            code_embs = list(
-                CodeEmbedding.objects
-                .filter(project=project)
-                .select_related("code_artifact")
-            )
+            code_embs = [
+                ce for ce in (
+                    CodeEmbedding.objects
+                    .filter(project=project)
+                    .select_related("code_artifact")
+                )
+                if ce.vector and (ce.code_artifact.file_path or "").strip()
+            ]
+            # all embeddings scored in one vectorized pass
+            sims = cosine_to_query([ce.vector for ce in code_embs], task_vector).tolist()
 
             file_scores: dict[str, float] = {}
-            for ce in code_embs:
-                if not ce.vector:
-                    continue
-                fp = (ce.code_artifact.file_path or "").strip()
-                if not fp:
-                    continue
-                cv = np.asarray(ce.vector, dtype=float)
-                cv_norm = float(np.linalg.norm(cv)) or 1e-9
-                sim = float(np.dot(tv, cv) / (tv_norm * cv_norm))
+            for ce, sim in zip(code_embs, sims):
+                fp = ce.code_artifact.file_path.strip()
                 if fp not in file_scores or sim > file_scores[fp]:
                     file_scores[fp] = sim
 
@@ -389,8 +384,8 @@ def _get_related_code(
     falls back to computing the task vector on the fly if missing.
     Returns [] if no embeddings or no relevant code exists.
     """
-    import numpy as np
     from apps.analysis.models import TaskEmbedding, CodeEmbedding
+    from apps.analysis.semantic.similarity import cosine_to_query
     from apps.task_management.services.ai_match_service import _get_embedder
 
     # 1. Task vector
@@ -416,18 +411,10 @@ def _get_related_code(
     if not code_embs:
         return []
 
-    # 3. Cosine similarity
-    tv = np.asarray(task_vector, dtype=float)
-    tv_norm = float(np.linalg.norm(tv)) or 1e-9
-
-    scored = []
-    for ce in code_embs:
-        if not ce.vector:
-            continue
-        cv = np.asarray(ce.vector, dtype=float)
-        cv_norm = float(np.linalg.norm(cv)) or 1e-9
-        sim = float(np.dot(tv, cv) / (tv_norm * cv_norm))
-        scored.append((sim, ce.code_artifact))
+    # 3. Cosine similarity, all embeddings in one vectorized pass
+    code_embs = [ce for ce in code_embs if ce.vector]
+    sims = cosine_to_query([ce.vector for ce in code_embs], task_vector).tolist()
+    scored = [(sim, ce.code_artifact) for sim, ce in zip(sims, code_embs)]
 
     if not scored:
         return []
@@ -1,29 +1,20 @@
 from __future__ import annotations
 
-import threading
 from typing import Optional
 
 import numpy as np
 
-from apps.analysis.embeddings.embedder import LocalEmbedder
+from apps.analysis.embeddings.embedder import LocalEmbedder, get_shared_embedder
 from apps.analysis.models import BpmnTask, MatchResult, TaskEmbedding
+from apps.analysis.semantic.similarity import cosine_to_query
 import tempfile
 from pathlib import Path
 from apps.analysis.code.structured_extractor import extract_structured_functions
-from apps.analysis.summary.code_summary_service import SummaryService
-
-# Lazy-loaded singleton embedder so we don't reload the model on every accept.
-_embedder_lock = threading.Lock()
-_embedder_instance: Optional[LocalEmbedder] = None
-
+from apps.analysis.summary.code_summary_service import get_summary_service
 
+# Shared with the analysis pipeline so the model is only loaded once per process.
 def _get_embedder() -> LocalEmbedder:
-    global _embedder_instance
-    if _embedder_instance is None:
-        with _embedder_lock:
-            if _embedder_instance is None:
-                _embedder_instance = LocalEmbedder()
-    return _embedder_instance
+    return get_shared_embedder()
 
 
 def _build_ai_code_text(submission: AISubmission, max_chars: int = 6000) -> str:
@@ -82,7 +73,7 @@ def _get_ai_function_summaries(submission: AISubmission) -> list:
         return []
 
     try:
-        summaries_dict = SummaryService().summarize_many(all_functions)
+        summaries_dict = get_summary_service().summarize_many(all_functions)
         return [s for s in summaries_dict.values() if s]
     except Exception as e:
         print(f"[ai_match_service] SummaryService failed: {e}")
@@ -146,7 +137,7 @@ def match_accepted_ai_submission(assignment: TaskAssignment) -> Optional[MatchRe
     best_summary = ""
     if function_summaries:
         code_embeddings = embedder.embed_many(function_summaries)
-        scores = [_cosine_similarity(emb.vector, task_vector) for emb in code_embeddings]
+        scores = cosine_to_query([emb.vector for emb in code_embeddings], task_vector).tolist()
         best_idx = int(max(range(len(scores)), key=lambda i: scores[i]))
         similarity = scores[best_idx]
         best_summary = function_summaries[best_idx]
@@ -5,24 +5,14 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
-
-from apps.analysis.embeddings.embedder import LocalEmbedder
+from apps.analysis.embeddings.embedder import get_shared_embedder
 from apps.analysis.models import BpmnTask, MatchResult, TaskEmbedding
+from apps.analysis.semantic.similarity import cosine_to_query
 from apps.analysis.code.structured_extractor import extract_structured_functions
-from apps.analysis.summary.code_summary_service import SummaryService
+from apps.analysis.summary.code_summary_service import get_summary_service
 from apps.task_management.models import DeveloperSubmission
 
 
-def _cosine_similarity(a: list, b: list) -> float:
-    av = np.asarray(a, dtype=float)
-    bv = np.asarray(b, dtype=float)
-    if av.size == 0 or bv.size == 0:
-        return 0.0
-    denom = (np.linalg.norm(av) * np.linalg.norm(bv)) or 1e-9
-    return float(np.clip(np.dot(av, bv) / denom, -1.0, 1.0))
-
-
 def _extract_summaries_from_zip(zip_path: Path) -> list[tuple[str, str]]:
     """
     Extract all Python functions from a ZIP, summarize each one.
@@ -33,7 +23,12 @@ def _extract_summaries_from_zip(zip_path: Path) -> list[tuple[str, str]]:
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp = Path(tmpdir)
         with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(tmp)
+            # Only Python sources are summarized; skip writing assets,
+            # vendored binaries, etc. to disk.
+            zf.extractall(tmp, members=[
+                m for m in zf.infolist()
+                if not m.is_dir() and m.filename.endswith(".py")
+            ])
 
         for py_file in tmp.rglob("*.py"):
             try:
@@ -46,7 +41,7 @@ def _extract_summaries_from_zip(zip_path: Path) -> list[tuple[str, str]]:
         return []
 
     try:
-        summaries_dict = SummaryService().summarize_many(all_functions)
+        summaries_dict = get_summary_service().summarize_many(all_functions)
         return [
             (sf.get("function_name", ""), summaries_dict.get(sf.get("function_uid", ""), ""))
             for sf in all_functions
@@ -67,7 +62,7 @@ def match_accepted_developer_submission(submission: DeveloperSubmission) -> Opti
     task: BpmnTask = assignment.bpmn_task
     project = submission.project
 
-    embedder = LocalEmbedder()
+    embedder = get_shared_embedder()
 
     # Get or compute task embedding
     task_emb = TaskEmbedding.objects.filter(project=project, bpmn_task=task).first()
@@ -94,7 +89,7 @@ def match_accepted_developer_submission(submission: DeveloperSubmission) -> Opti
     if name_summary_pairs:
         summaries = [s for _, s in name_summary_pairs]
         code_embeddings = embedder.embed_many(summaries)
-        scores = [_cosine_similarity(emb.vector, task_vector) for emb in code_embeddings]
+        scores = cosine_to_query([emb.vector for emb in code_embeddings], task_vector).tolist()
         best_idx = int(max(range(len(scores)), key=lambda i: scores[i]))
         best_score = scores[best_idx]
         best_summary = summaries[best_idx]
@@ -225,7 +220,7 @@ def _extract_developer_functions_from_pr(service, github_repo, pr_files: list, h
         return []
 
     try:
-        summaries_dict = SummaryService().summarize_many(all_functions)
+        summaries_dict = get_summary_service().summarize_many(all_functions)
         return [
             (sf["function_name"], summaries_dict.get(sf["function_uid"], ""))
             for sf in all_functions
@@ -252,7 +247,7 @@ def match_accepted_github_submission(project, assignment, pr_number: int) -> Opt
 
     service = GitHubService(token=github_repo.access_token)
     task: BpmnTask = assignment.bpmn_task
-    embedder = LocalEmbedder()
+    embedder = get_shared_embedder()
 
     # Get or compute task embedding
     task_emb = TaskEmbedding.objects.filter(project=project, bpmn_task=task).first()
@@ -286,7 +281,7 @@ def match_accepted_github_submission(project, assignment, pr_number: int) -> Opt
     if name_summary_pairs:
         summaries = [s for _, s in name_summary_pairs]
         code_embeddings = embedder.embed_many(summaries)
-        scores = [_cosine_similarity(emb.vector, task_vector) for emb in code_embeddings]
+        scores = cosine_to_query([emb.vector for emb in code_embeddings], task_vector).tolist()
         best_idx = int(max(range(len(scores)), key=lambda i: scores[i]))
         best_score = scores[best_idx]
         best_summary = summaries[best_idx]
@@ -324,7 +319,7 @@ def _run_similarity_pipeline(project, task, name_summary_pairs: list) -> dict:
     Embed summaries, cosine-compare vs the task embedding, return score dict.
     Nothing is saved to the DB.
     """
-    embedder = LocalEmbedder()
+    embedder = get_shared_embedder()
 
     task_emb = TaskEmbedding.objects.filter(project=project, bpmn_task=task).first()
     if task_emb and task_emb.vector:
@@ -342,7 +337,7 @@ def _run_similarity_pipeline(project, task, name_summary_pairs: list) -> dict:
 
     summaries = [s for _, s in name_summary_pairs]
     code_embeddings = embedder.embed_many(summaries)
-    scores = [_cosine_similarity(emb.vector, task_vector) for emb in code_embeddings]
+    scores = cosine_to_query([emb.vector for emb in code_embeddings], task_vector).tolist()
     best_score = max(scores)
 
     return {
@@ -1,3 +1,134 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from apps.analysis.models import BpmnTask
+from apps.projects.models import Project, ProjectMembership
+from apps.task_management.models import TaskAssignment, TaskEvaluation
+
+
+def make_user(username, password="pass1234", role="DEVELOPER"):
+    u = User.objects.create_user(username=username, email=f"{username}@test.com", password=password)
+    u.profile.role = role
+    u.profile.save()
+    return u
+
+
+def make_project(admin, evaluator, name="Test Project"):
+    return Project.objects.create(
+        name=name,
+        description="A test project",
+        created_by=admin,
+        evaluator=evaluator,
+    )
+
+
+class MyPerformanceInsightsTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+        self.url = reverse("my_performance_insights_api")
+        self._task_seq = 0
+
+    def _add_project(self, name, statuses, score=None):
+        project = make_project(self.admin, self.evaluator, name=name)
+        membership = ProjectMembership.objects.create(project=project, user=self.dev)
+        for status in statuses:
+            self._task_seq += 1
+            task = BpmnTask.objects.create(
+                project=project, task_id=f"T{self._task_seq}", name=f"Task {self._task_seq}",
+                ai_suitability="HUMAN_ONLY",
+            )
+            assignment = TaskAssignment.objects.create(
+                project=project, bpmn_task=task, developer_membership=membership,
+                assigned_by=self.evaluator, status=status,
+            )
+            if score is not None and status == TaskAssignment.Status.ACCEPTED:
+                TaskEvaluation.objects.create(
+                    assignment=assignment, evaluator=self.evaluator,
+                    correctness_score=Decimal(score), quality_score=Decimal(score),
+                    timeliness_score=Decimal(score), communication_score=Decimal(score),
+                )
+        return project
+
+    def test_project_breakdown_and_summary(self):
+        S = TaskAssignment.Status
+        self._add_project("Alpha", [S.ACCEPTED, S.ACCEPTED, S.REJECTED], score="80")
+        self._add_project("Beta", [S.SUBMITTED, S.IN_PROGRESS])
+        self.client.force_login(self.dev)
+
+        data = self.client.get(self.url).json()
+
+        projects = {p["projectName"]: p for p in data["projects"]}
+        self.assertEqual(projects["Alpha"]["totalAssigned"], 3)
+        self.assertEqual(projects["Alpha"]["acceptedCount"], 2)
+        self.assertEqual(projects["Alpha"]["rejectedCount"], 1)
+        self.assertEqual(projects["Alpha"]["averageScore"], 80.0)
+        self.assertEqual(projects["Beta"]["submittedCount"], 1)
+        self.assertEqual(projects["Beta"]["inProgressCount"], 1)
+        self.assertEqual(projects["Beta"]["averageScore"], 0.0)
+
+        summary = data["summary"]
+        self.assertEqual(summary["projectsCount"], 2)
+        self.assertEqual(summary["totalAssigned"], 5)
+        self.assertEqual(summary["acceptedCount"], 2)
+        self.assertEqual(summary["rejectedCount"], 1)
+        self.assertEqual(summary["submittedCount"], 1)
+        self.assertEqual(summary["inProgressCount"], 1)
+        self.assertEqual(summary["acceptanceRate"], 40.0)
+        self.assertEqual(summary["averageScore"], 80.0)
+
+    def test_query_count_does_not_grow_with_projects(self):
+        S = TaskAssignment.Status
+        self._add_project("Alpha", [S.ACCEPTED, S.REJECTED], score="70")
+        self.client.force_login(self.dev)
+        self.client.get(self.url)
+
+        before = self._count_queries()
+        self._add_project("Beta", [S.SUBMITTED])
+        self._add_project("Gamma", [S.ACCEPTED], score="90")
+        self.assertEqual(self._count_queries(), before)
+
+    def _count_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url)
+        return len(ctx.captured_queries)
+
+
+class DeveloperPerformanceOverviewTests(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.admin     = make_user("admin_user", role="ADMIN")
+        self.evaluator = make_user("eval_user",  role="EVALUATOR")
+        self.dev       = make_user("dev_user",   role="DEVELOPER")
+        self.url = reverse("developer_performance_overview_api")
+
+    def test_developer_totals_span_projects(self):
+        for i, status in enumerate([TaskAssignment.Status.ACCEPTED, TaskAssignment.Status.REJECTED]):
+            project = make_project(self.admin, self.evaluator, name=f"P{i}")
+            membership = ProjectMembership.objects.create(project=project, user=self.dev)
+            task = BpmnTask.objects.create(
+                project=project, task_id=f"T{i}", name=f"Task {i}", ai_suitability="HUMAN_ONLY",
+            )
+            TaskAssignment.objects.create(
+                project=project, bpmn_task=task, developer_membership=membership,
+                assigned_by=self.evaluator, status=status,
+            )
+        self.client.force_login(self.evaluator)
+
+        resp = self.client.get(self.url)
+
+        self.assertEqual(resp.status_code, 200)
+        items = {i["username"]: i for i in resp.json()["items"]}
+        self.assertEqual(items["dev_user"]["projectsCount"], 2)
+        self.assertEqual(items["dev_user"]["totalAssigned"], 2)
+        self.assertEqual(items["dev_user"]["acceptedCount"], 1)
+        self.assertEqual(items["dev_user"]["rejectedCount"], 1)
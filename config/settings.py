@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import importlib.util
+import os
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -98,6 +100,27 @@ DATABASES = {
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
+# Loads user.profile (the RBAC role) in the same query as the session user.
+# The only backend, so a failed login hashes the password once.
+AUTHENTICATION_BACKENDS = [
+    "apps.accounts.backends.ProfileModelBackend",
+]
+
+# Argon2 hashes a password several times faster than PBKDF2 at Django's
+# default work factors, which keeps create_user/set_password from holding a
+# worker for hundreds of ms. It needs argon2-cffi, so it is only preferred
+# when that is installed. PBKDF2 stays listed so existing hashes still verify
+# (and are re-hashed with Argon2 on the user's next login).
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if importlib.util.find_spec("argon2") is not None:
+    PASSWORD_HASHERS.insert(0, PASSWORD_HASHERS.pop(2))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -138,6 +161,26 @@ LOGIN_URL = "accounts:login"
 LOGIN_REDIRECT_URL = "projects:list"
 LOGOUT_REDIRECT_URL = "accounts:login"
 
+# Load the sentence-transformer at startup (AppConfig.ready) instead of on the
+# first analysis request. Enable in long-running web workers.
+EMBEDDER_PRELOAD = os.getenv("EMBEDDER_PRELOAD", "0") == "1"
+# int8 dynamic quantization of the embedder on CPU (smaller, faster, slightly
+# different scores than the float model).
+EMBEDDER_QUANTIZE_INT8 = os.getenv("EMBEDDER_QUANTIZE_INT8", "0") == "1"
+# torch.compile the embedder's transformer (one-off compile cost at load).
+EMBEDDER_COMPILE = os.getenv("EMBEDDER_COMPILE", "0") == "1"
+
+# Shared cache for summaries, embeddings, metrics and pipeline results. The
+# default local-memory cache is per worker process; with REDIS_URL set
+# (needs the redis package) every worker reuses the same entries.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+
 
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:5173",
@@ -0,0 +1,30 @@
+import zipfile
+
+from apps.task_management.services import developer_match_service as svc
+
+
+class _FakeSummaryService:
+    def summarize_many(self, functions):
+        return {f["function_uid"]: "Does a thing." for f in functions}
+
+
+def test_only_python_members_are_extracted(tmp_path, monkeypatch):
+    zip_path = tmp_path / "submission.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("app/orders.py", "def place_order(cart):\n    return cart\n")
+        zf.writestr("app/static/logo.png", b"\x89PNG" * 100)
+        zf.writestr("README.md", "notes")
+
+    seen = []
+
+    def fake_extract(py_file, project_root):
+        seen.extend(p.relative_to(project_root).as_posix() for p in project_root.rglob("*") if p.is_file())
+        return [{"function_uid": "app/orders.py::place_order", "function_name": "place_order"}]
+
+    monkeypatch.setattr(svc, "extract_structured_functions", fake_extract)
+    monkeypatch.setattr(svc, "get_summary_service", lambda: _FakeSummaryService())
+
+    pairs = svc._extract_summaries_from_zip(zip_path)
+
+    assert seen == ["app/orders.py"]
+    assert len(pairs) == 1
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from django.core.cache import cache
+
+from apps.analysis.embeddings.embedder import EmbeddingResult
+from apps.analysis.embeddings.pipeline import embed_pipeline
+
+
+class _FakeEmbedder:
+    model_name = "test-model"
+    variant = "fp32"
+    model = SimpleNamespace(get_sentence_embedding_dimension=lambda: 2)
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_many(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        return [EmbeddingResult(text=t, vector=[float(len(t)), 0.5]) for t in texts]
+
+
+def test_unchanged_texts_are_not_re_embedded():
+    cache.clear()
+    embedder = _FakeEmbedder()
+    tasks = [{"id": "T1", "name": "Pay order"}, {"id": "T2", "name": "Pay order"}]
+    code = [{"id": "C1", "name": "charge", "summary_text": "Charges the card."}]
+
+    first = embed_pipeline(tasks=tasks, code_items=code, embedder=embedder)
+    # identical task texts are embedded once
+    assert len(embedder.calls[0]) == 2
+
+    code.append({"id": "C2", "name": "refund", "summary_text": "Refunds the card."})
+    second = embed_pipeline(tasks=tasks, code_items=code, embedder=embedder)
+
+    assert embedder.calls[1] == ["Task: Refund. Description: Refunds the card.."]
+    assert second["task_embeddings"] == first["task_embeddings"]
+    assert second["code_embeddings"][0]["vector"] == first["code_embeddings"][0]["vector"]
+    assert [e["id"] for e in second["code_embeddings"]] == ["C1", "C2"]
@@ -0,0 +1,21 @@
+from apps.analysis.metrics.evaluation import evaluate_traceability
+
+
+def test_best_candidate_per_task():
+    tasks = [{"taskId": "T1", "taskName": "A"}, {"taskId": "T2", "taskName": "B"}, {"taskId": "T3", "taskName": "C"}]
+    code = [{"codeId": "C1"}, {"codeId": "C2"}, {"codeId": "C3"}]
+    matches = [
+        {"taskId": "T1", "codeId": "C3", "similarity": 0.75},
+        {"taskId": "T1", "codeId": "C1", "similarity": 0.9},
+        {"taskId": "T2", "codeId": "C2", "similarity": 0.8},
+        {"taskId": "T2", "codeId": "C3", "similarity": 0.8},  # tie: first candidate wins
+        {"taskId": "T3", "codeId": "C3", "similarity": 0.6},  # below threshold
+    ]
+
+    result = evaluate_traceability(tasks, code, matches, threshold=0.7)
+
+    matched = {m["taskId"]: m["codeId"] for m in result["details"]["matched"]}
+    assert matched == {"T1": "C1", "T2": "C2"}
+    assert [m["taskId"] for m in result["details"]["missing"]] == ["T3"]
+    assert [e["codeId"] for e in result["details"]["extra"]] == ["C3"]
+    assert result["summary"]["matched_count"] == 2
@@ -0,0 +1,41 @@
+import json
+from decimal import Decimal
+
+import numpy as np
+from django.test import RequestFactory
+
+from apps.common.http import fast_json_response, read_json_body, stream_json_list_response
+
+
+def test_fast_json_response_matches_stdlib_output():
+    data = {1: "één", "scores": [np.float32(0.5), 0.25], "nested": {"ok": True}}
+
+    response = fast_json_response(data, status=201)
+
+    assert response.status_code == 201
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(response.content) == {"1": "één", "scores": [0.5, 0.25], "nested": {"ok": True}}
+
+
+def test_fast_json_response_falls_back_for_django_only_types():
+    response = fast_json_response({"threshold": Decimal("0.6")})
+    assert json.loads(response.content) == {"threshold": "0.6"}
+
+
+def test_stream_json_list_response_falls_back_for_django_only_types():
+    rows = iter([{"score": Decimal("0.6")}, {"score": 0.5}])
+
+    response = stream_json_list_response({"projectId": 1, "threshold": Decimal("0.7")}, "matches", rows)
+
+    assert json.loads(b"".join(response.streaming_content)) == {
+        "projectId": 1,
+        "threshold": "0.7",
+        "matches": [{"score": "0.6"}, {"score": 0.5}],
+    }
+
+
+def test_read_json_body():
+    factory = RequestFactory()
+    assert read_json_body(factory.post("/", data=b"", content_type="application/json")) == {}
+    request = factory.post("/", data='{"tasks": ["é"]}', content_type="application/json")
+    assert read_json_body(request) == {"tasks": ["é"]}
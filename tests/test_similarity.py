@@ -0,0 +1,93 @@
+import numpy as np
+
+from apps.analysis.semantic.similarity import (
+    compute_similarity,
+    cosine_similarity_matrix,
+    cosine_to_query,
+    top_k_matches,
+)
+
+
+def test_cosine_similarity_matrix_shape_and_bounds():
+    tasks = [[1.0, 0.0], [0.6, 0.8]]
+    code = [[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]]
+
+    S = cosine_similarity_matrix(tasks, code)
+
+    assert S.shape == (2, 3)
+    assert S.dtype == np.float32
+    assert np.all(S <= 1.0) and np.all(S >= -1.0)
+    assert np.allclose(S, [[1.0, 0.0, -1.0], [0.6, 0.8, -0.6]], atol=1e-6)
+
+
+def test_top_k_matches_orders_scores_descending():
+    similarity = compute_similarity(
+        task_embeddings=[{"id": "T1", "vector": [0.6, 0.8]}],
+        code_embeddings=[
+            {"id": "C1", "vector": [1.0, 0.0]},
+            {"id": "C2", "vector": [0.0, 1.0]},
+            {"id": "C3", "vector": [-1.0, 0.0]},
+        ],
+    )
+
+    top = top_k_matches(similarity=similarity, k=2)
+
+    assert [cid for cid, _ in top["T1"]] == ["C2", "C1"]
+    assert round(top["T1"][0][1], 3) == 0.8
+
+
+def test_top_k_matches_accepts_ndarray_matrix():
+    similarity = {
+        "task_ids": ["T1", "T2"],
+        "code_ids": ["C1", "C2"],
+        "matrix": np.array([[0.2, 0.9], [0.7, 0.1]], dtype=np.float32),
+    }
+
+    top = top_k_matches(similarity=similarity, k=1)
+
+    assert [cid for cid, _ in top["T1"]] == ["C2"]
+    assert [cid for cid, _ in top["T2"]] == ["C1"]
+    assert top_k_matches(similarity={"task_ids": ["T1"], "matrix": np.empty((0, 0))}, k=3) == {"T1": []}
+
+
+def test_compute_similarity_keeps_float32_matrix_for_matchers():
+    from apps.analysis.semantic.matcher import greedy_one_to_one_match
+
+    similarity = compute_similarity(
+        task_embeddings=[{"id": "T1", "vector": [1.0, 0.0]}, {"id": "T2", "vector": [0.0, 1.0]}],
+        code_embeddings=[{"id": "C1", "vector": [0.0, 1.0]}, {"id": "C2", "vector": [1.0, 0.0]}],
+    )
+
+    assert isinstance(similarity["matrix"], np.ndarray)
+    assert similarity["matrix"].dtype == np.float32
+
+    matching = greedy_one_to_one_match(similarity=similarity, threshold=0.5)
+    assert {(m["task_id"], m["code_id"]) for m in matching["matched"]} == {("T1", "C2"), ("T2", "C1")}
+
+
+def test_top_k_matches_agrees_with_full_sort():
+    rng = np.random.default_rng(0)
+    S = rng.random((20, 50), dtype=np.float32)
+    similarity = {
+        "task_ids": [f"T{i}" for i in range(20)],
+        "code_ids": [f"C{j}" for j in range(50)],
+        "matrix": S,
+    }
+
+    for k in (1, 5, 50, 80):
+        top = top_k_matches(similarity=similarity, k=k)
+        for i in range(20):
+            expected = sorted(S[i].tolist(), reverse=True)[:min(k, 50)]
+            assert [score for _, score in top[f"T{i}"]] == expected
+
+    assert top_k_matches(similarity=similarity, k=0)["T0"] == []
+
+
+def test_cosine_to_query_matches_pairwise_cosine():
+    vectors = [[3.0, 4.0], [0.0, 2.0], [0.0, 0.0], [-1.0, 0.0]]
+    query = [1.0, 0.0]
+
+    scores = cosine_to_query(vectors, query)
+
+    assert np.allclose(scores, [0.6, 0.0, 0.0, -1.0])
+    assert cosine_to_query([], query).shape == (0,)
@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from apps.analysis.summary.code_summary_service import SummaryService, clean_summary
+
+
+def _service():
+    # skip __init__ so no Groq client is created
+    cache.clear()
+    svc = SummaryService.__new__(SummaryService)
+    svc.model_name = "test-model"
+    return svc
+
+
+def test_summarize_many_keeps_uid_order_with_concurrent_calls():
+    functions = [
+        {"function_uid": f"mod.py::f{i}", "function_name": f"f{i}", "raw_snippet": f"def f{i}(): pass"}
+        for i in range(12)
+    ]
+    functions.append({"function_uid": "", "function_name": "skipped"})
+
+    def fake_call(prompt):
+        name = prompt.split("def ", 1)[1].split("(", 1)[0]
+        return f"Handles {name} request."
+
+    with patch.object(SummaryService, "_call_model", side_effect=fake_call) as mock_call:
+        out = _service().summarize_many(functions)
+
+    assert mock_call.call_count == 12
+    assert list(out) == [f"mod.py::f{i}" for i in range(12)]
+    assert out["mod.py::f7"] == "Handles f7 request."
+
+
+def test_summarize_many_only_requests_detailed_when_asked():
+    functions = [{"function_uid": "mod.py::f", "function_name": "f", "raw_snippet": "def f(): pass"}]
+
+    def fake_call(prompt):
+        return "Short line." if prompt.startswith("Analyze") else "First part.\nSecond part."
+
+    with patch.object(SummaryService, "_call_model", side_effect=fake_call) as mock_call:
+        short_only = _service().summarize_many(functions)
+        assert mock_call.call_count == 1
+
+        both = _service().summarize_many(functions, include_detailed=True)
+        assert mock_call.call_count == 3
+
+    assert short_only == {"mod.py::f": "Short line."}
+    assert both == {"mod.py::f": {"short": "Short line.", "detailed": "First part. Second part."}}
+
+
+def test_clean_summary_strips_prefixes_and_backticks():
+    assert clean_summary("The apply_discount function applies `discount` to the cart. Extra.") == (
+        "Applies discount to the cart."
+    )
+    assert clean_summary("_NAME: sends confirmation email") == "Sends confirmation email"
+    assert clean_summary("CODE: def f(): pass") == ""
+
+
+def test_summarize_many_reuses_cached_summaries():
+    functions = [{"function_uid": "mod.py::f", "function_name": "f", "raw_snippet": "def f(): pass"}]
+    svc = _service()
+
+    with patch.object(SummaryService, "_call_model", side_effect=["Saves the order.", "Other."]) as mock_call:
+        first = svc.summarize_many(functions)
+        second = svc.summarize_many(functions)
+
+    assert mock_call.call_count == 1
+    assert first == second == {"mod.py::f": "Saves the order."}
+
+
+def test_failed_summaries_are_not_cached():
+    functions = [{"function_uid": "mod.py::f", "function_name": "f", "raw_snippet": "def f(): pass"}]
+    svc = _service()
+
+    with patch.object(SummaryService, "_call_model", side_effect=["", "Saves the order."]) as mock_call:
+        assert svc.summarize_many(functions) == {"mod.py::f": ""}
+        assert svc.summarize_many(functions) == {"mod.py::f": "Saves the order."}
+
+    assert mock_call.call_count == 2
+
+
+def test_generator_block_truncates_snippet_on_token_budget():
+    from apps.analysis.summary.generator import SNIPPET_TOKEN_BUDGET, build_generator_block
+
+    snippet = "\n".join(f"total_{i} = compute(order, items)" for i in range(200))
+    block = build_generator_block({"function_name": "f", "raw_snippet": snippet})
+
+    assert "... (truncated)" in block
+    assert "total_199" not in block
+    # whole lines up to the one that overflows, which ends on a full token
+    kept = [ln for ln in block.splitlines() if ln.startswith("total_")]
+    assert all(ln.endswith("compute(order, items)") for ln in kept[:-1])
+    assert kept[-1] == "total_43 = compute(order,"
+    assert (len(kept) - 1) * 8 <= SNIPPET_TOKEN_BUDGET
+
+    long_line = " ".join(f"identifier_{i}" for i in range(1000))
+    block = build_generator_block({"function_name": "f", "raw_snippet": long_line})
+    assert "identifier_350" not in block
+    assert block.split("\n")[1].endswith(f"identifier_{SNIPPET_TOKEN_BUDGET - 1}")
+
+
+def test_truncate_snippet_cuts_the_overflowing_line_after_a_short_first_line():
+    from apps.analysis.summary.generator import _truncate_snippet
+
+    body = "    return " + " + ".join(f"x{i}" for i in range(600))
+    truncated = _truncate_snippet("def f(x):\n" + body, budget=20)
+    # def f ( x ) : is 6 tokens; the remaining 14 go to the long line
+    assert truncated == "def f(x):\n    return x0 + x1 + x2 + x3 + x4 + x5 + x6\n... (truncated)"
+
+    # leading blank lines take no tokens, so the long line still gets the budget
+    assert _truncate_snippet("\n\n" + body, budget=3) == "\n\n    return x0 +\n... (truncated)"